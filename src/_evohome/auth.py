@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from abc import ABC, abstractmethod
+from collections import Counter
+from contextlib import AbstractAsyncContextManager, nullcontext
+from functools import partial
 from http import HTTPMethod, HTTPStatus
 from typing import TYPE_CHECKING, Any, Final
 
@@ -12,14 +16,10 @@ import aiohttp
 import voluptuous as vol
 
 from . import exceptions as exc
+from .concurrency import SingleFlight
 from .const import ERR_MSG_LOOKUP_BASE, HINT_CHECK_NETWORK, HOSTNAME
-from .helpers import (
-    convert_dtms_to_utc_str,
-    convert_keys_to_camel_case,
-    convert_keys_to_snake_case,
-    convert_str_enums_to_pascal_case,
-    redact_secrets,
-)
+from .helpers import convert_keys_to_snake_case, convert_to_vendor_json, redact_secrets
+from .retry import parse_retry_after
 
 type _TccResponse = dict[str, Any] | list[dict[str, Any]]
 
@@ -29,6 +29,11 @@ if TYPE_CHECKING:
 
     from aiohttp.typedefs import StrOrURL
 
+    from .rate_limiter import AbstractRateLimiter
+    from .response_cache import ResponseCache
+    from .retry import RetryPolicy
+    from .shape_cache import ShapeCache
+
 
 async def _payload(r: aiohttp.ClientResponse | None) -> str:
     if r is None:
@@ -58,6 +63,10 @@ class AbstractAuth(ABC):
         /,
         *,
         logger: logging.Logger,
+        rate_limiter: AbstractRateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        response_cache: ResponseCache | None = None,
+        shape_cache: ShapeCache | None = None,
         _hostname: str | None = None,
     ) -> None:
         """A class for interacting with the Resideo TCC API."""
@@ -67,6 +76,27 @@ class AbstractAuth(ABC):
         self._logger: Final = logger
         self._hostname: Final = _hostname or HOSTNAME
 
+        # limits the rate/concurrency of GET/PUT requests (not of authentication)
+        self._rate_limiter: Final[AbstractAsyncContextManager[Any]] = (
+            rate_limiter or nullcontext()
+        )
+
+        # transient failures of requests are not retried, unless there's a policy
+        self._retry_policy: Final = retry_policy
+
+        # GETs of rarely-changing resources may be cached, if there's a cache
+        self._response_cache: Final = response_cache
+
+        # GET responses are validated in full, unless there's a cache of their shapes
+        self._shape_cache: Final = shape_cache
+
+        # concurrent GETs of the same URL share a single request, unless a PUT (or a
+        # discard) of that URL came between them, i.e. a later generation of the URL
+        self._gets: Final[SingleFlight[tuple[str, int], _TccResponse]] = SingleFlight()
+        self._generations: Final[Counter[str]] = Counter()
+
+        self._stats: Final[Counter[str]] = Counter()
+
     def __str__(self) -> str:
         """Return a string representation of the object."""
         return f"{self.__class__.__name__}(base='{self.url_base}')"
@@ -81,16 +111,48 @@ class AbstractAuth(ABC):
         """Return the URL base used for GET/PUT requests."""
         return self._url_base
 
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return counters of the requests made (e.g. requests, retries, cache hits)."""
+
+        stats = dict(self._stats)
+
+        if self._response_cache is not None:
+            stats["cache_hits"] = self._response_cache.hits
+            stats["cache_misses"] = self._response_cache.misses
+
+        if self._shape_cache is not None:
+            stats["shape_hits"] = self._shape_cache.hits
+            stats["shape_misses"] = self._shape_cache.misses
+
+        return stats
+
     async def get[T](self, url: StrOrURL, /, schema: Callable[[Any], T]) -> T:
         """Call the vendor's TCC API with a GET.
 
         A schema is required; it is used to convert datetimes and strEnums from the
         vendor's format after getting.
+
+        Concurrent GETs of the same URL are coalesced into a single request, and each
+        caller validates the (shared) response with its own schema. If there is a
+        response cache, a fresh response may be served from it instead.
+
+        If there is a shape cache, a response with the same shape as the last one of
+        that URL may have only its values validated (see ShapeCache).
         """
 
-        response: _TccResponse = await self.request(HTTPMethod.GET, url)
+        cache = self._response_cache
+
+        if cache is None or (response := cache.get(str(url))) is None:
+            key = (str(url), self._generations[str(url)])
+            if key in self._gets:
+                self._stats["coalesced"] += 1
+
+            response = await self._gets(key, partial(self._get_response, *key))
 
         try:
+            if self._shape_cache is not None:
+                return self._shape_cache.validate(str(url), response, schema)
             return schema(response)
         except vol.Invalid as err:
             raise exc.BadApiSchemaError(
@@ -116,7 +178,37 @@ class AbstractAuth(ABC):
             except vol.Invalid as err:
                 self._logger.warning(f"PUT {url}: payload failed validation: {err}")
 
-        return await self.request(HTTPMethod.PUT, url, json=json)
+        # e.g. PUT {type}/{id}/schedule invalidates GET {type}/{id}/schedule, incl. any
+        # GET in flight before the PUT is done (as its response may pre-date the PUT)
+        self.discard_cached(url)
+        try:
+            return await self.request(HTTPMethod.PUT, url, json=json)
+        finally:
+            self.discard_cached(url)
+
+    def discard_cached(self, url: StrOrURL, /) -> None:
+        """Discard any cached response of a URL, so its next GET is not from the cache.
+
+        The response of any GET of that URL that is already in flight is not cached.
+        """
+
+        self._generations[str(url)] += 1
+
+        if self._response_cache is not None:
+            self._response_cache.discard(str(url))
+
+    async def _get_response(self, url: str, generation: int, /) -> _TccResponse:
+        """GET a response from the vendor's TCC API, and cache it (if cacheable).
+
+        The response is not cached if the URL was discarded while the GET was in flight.
+        """
+
+        response = await self.request(HTTPMethod.GET, url)
+
+        if self._response_cache is not None and self._generations[url] == generation:
+            self._response_cache.set(url, response)
+
+        return response
 
     async def request(
         self, method: HTTPMethod, url: StrOrURL, /, **kwargs: Any
@@ -125,17 +217,18 @@ class AbstractAuth(ABC):
 
         Converts JSON keys to/from snake_case/camelCase as required.
 
-        Helper functions are used to convert datetimes and strEnums to the vendor's
-        format before putting.
+        Any JSON payload is converted to the vendor's format (keys, strEnums and
+        datetimes) in a single pass before putting.
+
+        If there is a retry policy, requests that fail for transient reasons (e.g.
+        429/503, or a refused connection) are retried, as per that policy.
         """
 
         if "json" in kwargs:
-            kwargs["json"] = convert_dtms_to_utc_str(kwargs["json"])
-            kwargs["json"] = convert_str_enums_to_pascal_case(kwargs["json"])
-            kwargs["json"] = convert_keys_to_camel_case(kwargs["json"])
+            kwargs["json"] = convert_to_vendor_json(kwargs["json"])
 
         try:
-            response = await self._make_request(method, url, **kwargs)
+            response = await self._make_request_with_retries(method, url, **kwargs)
         except exc.ApiCallFailedError as err:
             if err.status != HTTPStatus.UNAUTHORIZED:  # 401
                 # leave it up to higher layers to handle 401s as they can either be
@@ -153,6 +246,35 @@ class AbstractAuth(ABC):
 
         return convert_keys_to_snake_case(response)
 
+    async def _make_request_with_retries(
+        self, method: HTTPMethod, url: StrOrURL, /, **kwargs: Any
+    ) -> _TccResponse:
+        """Make a GET/PUT request, retrying it as per the retry policy (if any)."""
+
+        attempt = 1
+
+        while True:
+            try:
+                return await self._make_request(method, url, **kwargs)
+
+            except exc.ApiCallFailedError as err:
+                if self._retry_policy is None:
+                    raise
+
+                delay = self._retry_policy.retry_delay(method, err, attempt)
+                if delay is None:
+                    raise
+
+                self._logger.debug(
+                    f"{method} {url}: retrying in {delay:.1f} seconds"
+                    f" (attempt {attempt} of {self._retry_policy.max_attempts}): {err}"
+                )
+
+            self._stats["retries"] += 1
+            attempt += 1
+
+            await asyncio.sleep(delay)
+
     @abstractmethod
     async def _headers(self, headers: dict[str, str]) -> dict[str, str]:
         """Ensure the authorization header is valid.
@@ -173,11 +295,14 @@ class AbstractAuth(ABC):
         url = f"{self.url_base}/{url}"
         headers = await self._headers(kwargs.pop("headers", {}))
 
+        self._stats["requests"] += 1
+
         try:
-            rsp = await self._request(method, url, headers=headers, **kwargs)
-            assert rsp is not None  # mypy hint
+            async with self._rate_limiter:  # a no-op, unless one was provided
+                rsp = await self._request(method, url, headers=headers, **kwargs)
+                assert rsp is not None  # mypy hint
 
-            await rsp.read()  # so we can use rsp.json()/rsp.text(), below
+                await rsp.read()  # so we can use rsp.json()/rsp.text(), below
             rsp.raise_for_status()
 
             # can't assert content_length != 0 with aioresponses, so skip that check
@@ -206,11 +331,14 @@ class AbstractAuth(ABC):
                 self._logger.error(hint)  # noqa: TRY400
 
             msg = f"{err.status} {err.message}"
+            retry_after = None
+
             if rsp:
                 msg += f", response={await _payload(rsp)}"
+                retry_after = parse_retry_after(rsp.headers.get("Retry-After"))
 
             raise exc.ApiCallFailedError(
-                f"{method} {url}: {msg}", status=err.status
+                f"{method} {url}: {msg}", status=err.status, retry_after=retry_after
             ) from err
 
         except aiohttp.ClientError as err:  # e.g. ClientConnectionError
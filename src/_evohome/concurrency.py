@@ -0,0 +1,99 @@
+"""evohomeasync provides an async client for the Resideo TCC API."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable, Iterable
+
+
+# the default number of requests to make concurrently (e.g. one per location)
+MAX_CONCURRENCY: Final = 4
+
+
+class SingleFlight[K: Hashable, T]:
+    """Coalesce concurrent calls that share a key into a single call (the flight).
+
+    The first caller (the leader) awaits the call, and any callers that arrive while
+    it is in flight await the leader's outcome: the same result, or the same error.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the (empty) set of flights."""
+        self._flights: Final[dict[K, asyncio.Future[T]]] = {}
+
+    def __contains__(self, key: K) -> bool:
+        """Return True if a call with this key is in flight."""
+        return key in self._flights
+
+    async def __call__(self, key: K, fnc: Callable[[], Awaitable[T]], /) -> T:
+        """Return the outcome of fnc(), joining any in-flight call with the same key."""
+
+        while (flight := self._flights.get(key)) is not None:
+            try:
+                return await asyncio.shield(flight)
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if not flight.cancelled() or (task and task.cancelling()):
+                    raise  # it is this caller (not the leader) that was cancelled
+                # the leader was cancelled, so this follower will try to lead
+
+        flight = asyncio.get_running_loop().create_future()
+        self._flights[key] = flight
+
+        try:
+            result = await fnc()
+
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+
+        except BaseException as err:
+            flight.set_exception(err)
+            flight.exception()  # mark as retrieved, in case there are no followers
+            raise
+
+        else:
+            flight.set_result(result)
+            return result
+
+        finally:
+            del self._flights[key]
+
+
+async def gather_with_limit[T](
+    aws: Iterable[Awaitable[T]],
+    /,
+    *,
+    limit: int | None = MAX_CONCURRENCY,
+    message: str = "Multiple failures",
+) -> list[T]:
+    """Return the results of the awaitables, awaiting at most `limit` at a time.
+
+    The results are in the same order as the awaitables (None means no limit). All
+    the awaitables are awaited, even if some fail. Then, if one failed, its exception
+    is raised, or if several failed, an ExceptionGroup of their exceptions is raised.
+    """
+
+    if limit is not None and limit < 1:
+        raise ValueError(f"Invalid limit: {limit}")
+
+    semaphore = asyncio.Semaphore(limit) if limit else None
+
+    async def run(aw: Awaitable[T]) -> T:
+        if semaphore is None:
+            return await aw
+        async with semaphore:
+            return await aw
+
+    results = await asyncio.gather(*(run(aw) for aw in aws), return_exceptions=True)
+
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if len(errors) == 1:
+        raise errors[0]
+    if errors:
+        raise BaseExceptionGroup(message, errors)  # an ExceptionGroup, if it can be
+
+    return [r for r in results if not isinstance(r, BaseException)]
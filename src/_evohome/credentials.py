@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from contextlib import AbstractAsyncContextManager, nullcontext
 from http import HTTPMethod
 from typing import TYPE_CHECKING, Any, Final
 
@@ -10,6 +11,7 @@ import aiohttp
 
 from . import exceptions as exc
 from .auth import _payload
+from .concurrency import SingleFlight
 from .const import ERR_MSG_LOOKUP_BASE, HINT_CHECK_NETWORK, HOSTNAME
 
 if TYPE_CHECKING:
@@ -17,6 +19,8 @@ if TYPE_CHECKING:
 
     from aiohttp.typedefs import StrOrURL
 
+    from .rate_limiter import AbstractRateLimiter
+
 
 class CredentialsManagerBase:
     """A base class for managing the credentials used for HTTP authentication."""
@@ -29,6 +33,7 @@ class CredentialsManagerBase:
         /,
         *,
         logger: logging.Logger,
+        rate_limiter: AbstractRateLimiter | None = None,
         _hostname: str | None = None,
     ) -> None:
         """Initialise the session manager."""
@@ -42,6 +47,14 @@ class CredentialsManagerBase:
 
         self._was_authenticated = False  # True once credentials are proven valid
 
+        # limits the rate of authentication requests (a budget separate to GET/PUTs)
+        self._rate_limiter: Final[AbstractAsyncContextManager[Any]] = (
+            rate_limiter or nullcontext()
+        )
+
+        # concurrent callers share a single fetch of the same credential
+        self._fetches: Final[SingleFlight[str, None]] = SingleFlight()
+
     def __str__(self) -> str:
         """Return a string representation of the object."""
         return (
@@ -68,10 +81,11 @@ class CredentialsManagerBase:
         rsp: aiohttp.ClientResponse | None = None  # to prevent unbound error
 
         try:
-            rsp = await self._request(HTTPMethod.POST, url, **kwargs)
-            assert rsp is not None  # mypy hint
+            async with self._rate_limiter:  # a no-op, unless one was provided
+                rsp = await self._request(HTTPMethod.POST, url, **kwargs)
+                assert rsp is not None  # mypy hint
 
-            await rsp.read()  # so we can use rsp.json()/rsp.text(), below
+                await rsp.read()  # so we can use rsp.json()/rsp.text(), below
             rsp.raise_for_status()
 
             # can't assert content_length != 0 with aioresponses, so skip that check
@@ -21,9 +21,16 @@ class EvohomeError(_EvohomeBaseError):
 class _ApiCallFailedError(EvohomeError):
     """The API request failed for some reason (no/invalid/unexpected response)."""
 
-    def __init__(self, message: str, status: int | None = None) -> None:
+    def __init__(
+        self,
+        message: str,
+        status: int | None = None,
+        *,
+        retry_after: float | None = None,
+    ) -> None:
         super().__init__(message)
         self.status = status  # useful, available if via aiohttp.ClientResponseError
+        self.retry_after = retry_after  # seconds, if the vendor sent a Retry-After
 
 
 class ApiCallFailedError(_ApiCallFailedError):  # a base exception, API failed
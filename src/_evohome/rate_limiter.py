@@ -0,0 +1,112 @@
+"""evohomeasync provides an async client for the Resideo TCC API."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Final, Self
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+
+class AbstractRateLimiter(ABC):
+    """An ABC for limiting the rate of requests to the vendor's API.
+
+    Used as an async context manager around each request (including reading its
+    response), so that it can limit both the rate and the concurrency of requests.
+    """
+
+    @abstractmethod
+    async def acquire(self) -> None:
+        """Wait until a request can be made."""
+
+    @abstractmethod
+    def release(self) -> None:
+        """Note that a request has been completed (successfully, or otherwise)."""
+
+    async def __aenter__(self) -> Self:
+        await self.acquire()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.release()
+
+
+class RateLimiter(AbstractRateLimiter):
+    """A token bucket (requests per minute) and/or a cap on requests in flight.
+
+    Waiters are served in order of arrival. An instance can be shared by several
+    clients (e.g. v0 and v2) so that they draw from the same budget.
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_per_minute: float | None = None,
+        burst: int = 5,
+        max_in_flight: int | None = None,
+    ) -> None:
+        """Initialise the rate limiter (None means no limit)."""
+
+        if requests_per_minute is not None and requests_per_minute <= 0:
+            raise ValueError(f"Invalid requests_per_minute: {requests_per_minute}")
+        if burst < 1:
+            raise ValueError(f"Invalid burst: {burst}")
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError(f"Invalid max_in_flight: {max_in_flight}")
+
+        self._rate: Final = requests_per_minute / 60 if requests_per_minute else None
+        self._burst: Final = burst
+
+        self._tokens: float = burst  # the bucket starts full
+        self._updated: float = time.monotonic()
+
+        self._bucket_lock: Final = asyncio.Lock()  # so waiters are served FIFO
+        self._semaphore: Final = (
+            asyncio.Semaphore(max_in_flight) if max_in_flight else None
+        )
+
+    def __str__(self) -> str:
+        """Return a string representation of the object."""
+        return f"{self.__class__.__name__}(rate={self._rate}/s, burst={self._burst})"
+
+    async def acquire(self) -> None:
+        """Wait until there is a token in the bucket, and a slot for the request."""
+
+        if self._rate:
+            async with self._bucket_lock:
+                await self._take_token(self._rate)
+
+        if self._semaphore:
+            await self._semaphore.acquire()
+
+    def release(self) -> None:
+        """Free the slot used by the request (tokens are replenished over time)."""
+
+        if self._semaphore:
+            self._semaphore.release()
+
+    async def _take_token(self, rate: float) -> None:
+        """Take a token from the bucket, waiting for one to be added if required."""
+
+        self._refill(rate)
+
+        if self._tokens < 1:
+            await asyncio.sleep((1 - self._tokens) / rate)
+            self._refill(rate)
+
+        self._tokens -= 1
+
+    def _refill(self, rate: float) -> None:
+        """Add the tokens accrued since the last refill (up to the bucket's size)."""
+
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * rate)
+        self._updated = now
@@ -0,0 +1,109 @@
+"""evohomeasync provides an async client for the Resideo TCC API."""
+
+from __future__ import annotations
+
+import re
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+class ResponseCache:
+    """A cache of GET responses, for resources that change rarely (if ever).
+
+    Only URLs that match a pattern are cached, each for that pattern's TTL (seconds),
+    with the least recently used entries evicted once the cache is full.
+    """
+
+    def __init__(self, ttls: Mapping[str, float], /, *, max_size: int = 128) -> None:
+        """Initialise the cache, with a TTL (time to live) for each URL pattern.
+
+        The patterns are regular expressions; the first pattern that matches a URL
+        determines its TTL (and unmatched URLs are never cached).
+        """
+
+        if max_size < 1:
+            raise ValueError(f"Invalid max_size: {max_size}")
+
+        self._ttls: Final = [(re.compile(p), ttl) for p, ttl in ttls.items()]
+        self._max_size: Final = max_size
+
+        self._entries: Final[OrderedDict[str, tuple[float, Any]]] = OrderedDict()
+        self._ttl_by_url: Final[dict[str, float | None]] = {}  # memoised
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of entries in the cache (some may have expired)."""
+        return len(self._entries)
+
+    def __str__(self) -> str:
+        """Return a string representation of the object."""
+        return (
+            f"{self.__class__.__name__}"
+            f"(size={len(self)}/{self._max_size}, hits={self.hits}, misses={self.misses})"
+        )
+
+    def ttl(self, url: str) -> float | None:
+        """Return the TTL for a URL, or None if it should not be cached."""
+
+        try:
+            return self._ttl_by_url[url]
+        except KeyError:
+            pass
+
+        ttl = next((t for p, t in self._ttls if p.search(url)), None)
+        self._ttl_by_url[url] = ttl
+        return ttl
+
+    def get(self, url: str) -> Any | None:
+        """Return the cached response for a URL, or None if there isn't a fresh one.
+
+        Only URLs that can be cached are counted as a hit, or a miss.
+        """
+
+        if self.ttl(url) is None:
+            return None
+
+        if (entry := self._entries.get(url)) is None or entry[0] <= time.monotonic():
+            self._entries.pop(url, None)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(url)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, url: str, response: Any) -> None:
+        """Cache the response for a URL (if it can be cached)."""
+
+        if (ttl := self.ttl(url)) is None:
+            return
+
+        self._entries[url] = (time.monotonic() + ttl, response)
+        self._entries.move_to_end(url)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def discard(self, url: str) -> None:
+        """Remove the cached response for a URL (if there is one)."""
+        self._entries.pop(url, None)
+
+    def invalidate(self, pattern: str | None = None) -> None:
+        """Remove the cached responses for URLs that match a pattern (else all URLs).
+
+        The pattern is a regular expression (use discard() to match a URL exactly).
+        """
+
+        if pattern is None:
+            self._entries.clear()
+            return
+
+        regex = re.compile(pattern)
+        for url in [u for u in self._entries if regex.search(u)]:
+            del self._entries[url]
@@ -0,0 +1,137 @@
+"""evohomeasync provides an async client for the Resideo TCC API."""
+
+from __future__ import annotations
+
+import random
+from datetime import UTC, datetime as dt
+from email.utils import parsedate_to_datetime
+from http import HTTPMethod, HTTPStatus
+from typing import TYPE_CHECKING, Final
+
+import aiohttp
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .exceptions import ApiCallFailedError
+
+
+# these are usually transient, and so worth retrying (a 401 is handled elsewhere)
+RETRYABLE_STATUSES: Final = frozenset(
+    {
+        HTTPStatus.TOO_MANY_REQUESTS,  # 429
+        HTTPStatus.BAD_GATEWAY,  # 502
+        HTTPStatus.SERVICE_UNAVAILABLE,  # 503
+        HTTPStatus.GATEWAY_TIMEOUT,  # 504
+    }
+)
+
+# the vendor may ask us to wait (via a Retry-After header) for these
+_RETRY_AFTER_STATUSES: Final = frozenset(
+    {
+        HTTPStatus.TOO_MANY_REQUESTS,  # 429
+        HTTPStatus.SERVICE_UNAVAILABLE,  # 503
+    }
+)
+
+_RANDOM: Final = random.SystemRandom()
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Return the seconds to wait, as per a Retry-After header (or None if invalid).
+
+    The header may be either a number of seconds, or an HTTP-date.
+    """
+
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:  # HTTP-dates are always GMT
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max((retry_at - dt.now(tz=UTC)).total_seconds(), 0)
+
+
+class RetryPolicy:
+    """A policy for retrying requests that have failed for transient reasons.
+
+    Failures are retried if the response had a retryable status, or if there was no
+    response (e.g. the connection failed). Retries are delayed by an exponential
+    backoff (with jitter), unless the vendor specified a delay via Retry-After.
+
+    Only idempotent requests (GETs) are retried, unless PUTs are explicitly opted in.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = 3,
+        backoff: float = 1.0,
+        max_backoff: float = 30.0,
+        jitter: float = 0.1,
+        retry_puts: bool = False,
+        statuses: Iterable[int] = RETRYABLE_STATUSES,
+    ) -> None:
+        """Initialise the policy (max_attempts includes the first attempt)."""
+
+        if max_attempts < 1:
+            raise ValueError(f"Invalid max_attempts: {max_attempts}")
+        if not 0 <= jitter < 1:
+            raise ValueError(f"Invalid jitter: {jitter}")
+
+        self.max_attempts: Final = max_attempts
+        self.backoff: Final = backoff
+        self.max_backoff: Final = max_backoff
+        self.jitter: Final = jitter
+
+        self.methods: Final = frozenset(
+            {HTTPMethod.GET, HTTPMethod.PUT} if retry_puts else {HTTPMethod.GET}
+        )
+        self.statuses: Final = frozenset(statuses)
+
+    def __str__(self) -> str:
+        """Return a string representation of the object."""
+        return (
+            f"{self.__class__.__name__}"
+            f"(max_attempts={self.max_attempts}, backoff={self.backoff})"
+        )
+
+    def is_retryable(self, method: HTTPMethod, err: ApiCallFailedError) -> bool:
+        """Return True if a request that failed with this error is worth retrying."""
+
+        if method not in self.methods:
+            return False
+
+        if err.status is not None:
+            return err.status in self.statuses
+
+        # if there was no response (e.g. Connection refused), it is probably transient
+        return isinstance(err.__cause__, aiohttp.ClientConnectionError)
+
+    def retry_delay(
+        self, method: HTTPMethod, err: ApiCallFailedError, attempt: int
+    ) -> float | None:
+        """Return the delay (seconds) before the next attempt, or None to give up.
+
+        The attempt is the number of the attempt that failed, starting from 1. Will
+        give up if the vendor asks for a delay that is longer than max_backoff.
+        """
+
+        if attempt >= self.max_attempts or not self.is_retryable(method, err):
+            return None
+
+        if err.status in _RETRY_AFTER_STATUSES and err.retry_after is not None:
+            # don't stall the caller for longer than the backoff could ever be
+            return err.retry_after if err.retry_after <= self.max_backoff else None
+
+        delay = min(self.backoff * 2.0 ** (attempt - 1), self.max_backoff)
+        return delay * (1 + _RANDOM.uniform(-self.jitter, self.jitter))
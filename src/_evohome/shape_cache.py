@@ -0,0 +1,98 @@
+"""evohomeasync provides an async client for the Resideo TCC API."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Final, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class _Shape(NamedTuple):
+    schema: Callable[[Any], Any]
+    shape: list[Any]
+    polls: int  # the number of responses with this shape since it was validated
+
+
+class ShapeCache:
+    """A cache of the shapes of GET responses, to avoid validating them in full.
+
+    The responses to polling (e.g. of a location's status) usually have the same shape
+    (keys, and the types of values) every time; only their values change. A response
+    with the same shape as the last validated response of that URL has only its values
+    checked (e.g. enums, datetimes) and coerced; it is validated in full only if its
+    shape changes, or after every so many polls (as a safety net).
+
+    Only schemas that can coerce without validating (i.e. compiled schemas) benefit;
+    other schemas always validate in full.
+    """
+
+    def __init__(self, *, revalidate_every: int = 10, max_size: int = 128) -> None:
+        """Initialise the cache (revalidate_every includes the full validation)."""
+
+        if revalidate_every < 1:
+            raise ValueError(f"Invalid revalidate_every: {revalidate_every}")
+        if max_size < 1:
+            raise ValueError(f"Invalid max_size: {max_size}")
+
+        self._revalidate_every: Final = revalidate_every
+        self._max_size: Final = max_size
+
+        self._shapes: Final[dict[str, _Shape]] = {}
+
+        self.hits = 0  # only values were checked
+        self.misses = 0  # validated in full
+
+    def __len__(self) -> int:
+        """Return the number of URLs with a known shape."""
+        return len(self._shapes)
+
+    def __str__(self) -> str:
+        """Return a string representation of the object."""
+        return (
+            f"{self.__class__.__name__}"
+            f"(size={len(self)}/{self._max_size}, hits={self.hits}, misses={self.misses})"
+        )
+
+    def validate[T](self, url: str, response: Any, schema: Callable[[Any], T]) -> T:
+        """Return the response as validated/coerced by the schema.
+
+        Raises vol.Invalid if the response fails validation.
+        """
+
+        coerce: Callable[[Any], tuple[T, list[Any] | None]] | None = getattr(
+            schema, "coerce", None
+        )
+        if coerce is None:
+            return schema(response)
+
+        result, shape = coerce(response)
+
+        if shape is None:  # couldn't be coerced, so was validated in full instead
+            self.misses += 1
+            return result
+
+        entry = self._shapes.get(url)
+        if (
+            entry is not None
+            and entry.schema is schema
+            and entry.polls < self._revalidate_every
+            and entry.shape == shape
+        ):
+            self._shapes[url] = entry._replace(polls=entry.polls + 1)
+            self.hits += 1
+            return result
+
+        result = schema(response)  # validate in full
+        self.misses += 1
+
+        self._shapes.pop(url, None)  # so that the least recently validated is evicted
+        self._shapes[url] = _Shape(schema, shape, 1)
+        if len(self._shapes) > self._max_size:
+            del self._shapes[next(iter(self._shapes))]
+
+        return result
+
+    def invalidate(self) -> None:
+        """Forget all shapes (so the next response of every URL is validated in full)."""
+        self._shapes.clear()
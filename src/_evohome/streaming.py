@@ -0,0 +1,209 @@
+"""evohomeasync provides an async client for the Resideo TCC API."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import math
+from collections import deque
+from enum import EnumCheck, StrEnum, verify
+from typing import TYPE_CHECKING, Final
+
+from .exceptions import BadUserCredentialsError, EvohomeError
+
+if TYPE_CHECKING:
+    import logging
+    from collections.abc import AsyncGenerator, Awaitable, Callable
+
+
+@verify(EnumCheck.UNIQUE)
+class BackpressurePolicy(StrEnum):
+    """What a stream does with a new item when its buffer is full."""
+
+    BLOCK = "block"  # defer the next poll until the consumer has caught up
+    COALESCE = "coalesce"  # merge the new item into the newest buffered item
+    DROP_OLDEST = "drop_oldest"  # discard the oldest buffered item
+
+
+def _keep_newest[T](_: T, new: T, /) -> T:
+    """Coalesce two items by keeping only the newer one (e.g. snapshots)."""
+    return new
+
+
+def is_transient_error(err: BaseException) -> bool:
+    """Return True if a failed poll can be retried at the next poll.
+
+    Bad user credentials are not transient, and neither is any error that is not an
+    EvohomeError (e.g. a bug); a group of errors is transient only if all of them are.
+    """
+
+    if isinstance(err, BaseExceptionGroup):
+        return all(is_transient_error(e) for e in err.exceptions)
+    return isinstance(err, EvohomeError) and not isinstance(
+        err, BadUserCredentialsError
+    )
+
+
+class _StreamBuffer[T]:
+    """A bounded FIFO buffer of items, between a poller and a (single) consumer."""
+
+    def __init__(
+        self,
+        maxsize: int,
+        policy: BackpressurePolicy,
+        coalesce: Callable[[T, T], T],
+    ) -> None:
+        self._items: Final[deque[T]] = deque()
+        self._maxsize: Final = maxsize
+        self._policy: Final = policy
+        self._coalesce: Final = coalesce
+
+        self._not_empty: Final = asyncio.Event()
+        self._not_full: Final = asyncio.Event()
+
+        self._closed: bool = False
+        self._error: BaseException | None = None  # why the poller stopped, if it did
+
+        self.dropped: int = 0  # the number of items dropped/coalesced
+
+    async def put(self, item: T) -> None:
+        """Add an item to the buffer, as per the backpressure policy if it is full."""
+
+        if len(self._items) >= self._maxsize:
+            if self._policy == BackpressurePolicy.BLOCK:
+                while len(self._items) >= self._maxsize:
+                    self._not_full.clear()
+                    await self._not_full.wait()
+
+            elif self._policy == BackpressurePolicy.DROP_OLDEST:
+                self._items.popleft()
+                self.dropped += 1
+
+            else:  # BackpressurePolicy.COALESCE
+                self._items[-1] = self._coalesce(self._items[-1], item)
+                self.dropped += 1
+                return
+
+        self._items.append(item)
+        self._not_empty.set()
+
+    async def get(self) -> T:
+        """Remove & return the oldest item, waiting for one if the buffer is empty.
+
+        Once the buffer is closed (and empty), raises the poller's error, if any, or
+        StopAsyncIteration.
+        """
+
+        while not self._items and not self._closed:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+
+        if self._items:
+            item = self._items.popleft()
+            self._not_full.set()
+            return item
+
+        if self._error is not None:
+            raise self._error
+        raise StopAsyncIteration
+
+    def close(self, poller: asyncio.Task[None]) -> None:
+        """Note that the poller has stopped (and why, if due to an error)."""
+
+        if not poller.cancelled():
+            self._error = poller.exception()
+
+        self._closed = True
+        self._not_empty.set()
+
+
+async def _poll_forever[T](
+    poll: Callable[[], Awaitable[T | None]],
+    buffer: _StreamBuffer[T],
+    interval: float,
+    logger: logging.Logger,
+) -> None:
+    """Poll at a fixed rate, and add each item to the buffer, until cancelled.
+
+    The polls are made on a fixed grid of intervals (so they do not drift), and never
+    overlap: if a poll overruns, then the missed polls are skipped.
+    """
+
+    loop = asyncio.get_running_loop()
+    next_poll = loop.time()
+
+    while True:
+        try:
+            item = await poll()
+
+        except (EvohomeError, ExceptionGroup) as err:
+            if not is_transient_error(err):
+                raise
+            logger.warning(f"Stream poll failed (will retry at next poll): {err}")
+
+        else:
+            if item is not None:  # None means there is nothing to yield
+                await buffer.put(item)
+
+        now = loop.time()
+        next_poll += interval * (math.floor((now - next_poll) / interval) + 1)
+
+        await asyncio.sleep(next_poll - now)
+
+
+def poll_stream[T](
+    poll: Callable[[], Awaitable[T | None]],
+    /,
+    *,
+    interval: float,
+    logger: logging.Logger,
+    buffer_size: int = 1,
+    policy: BackpressurePolicy = BackpressurePolicy.COALESCE,
+    coalesce: Callable[[T, T], T] = _keep_newest,
+) -> AsyncGenerator[T]:
+    """Yield the items returned by polling every `interval` seconds, until closed.
+
+    The poller runs as a task, independently of the consumer, and buffers up to
+    `buffer_size` items; when the buffer is full, the backpressure policy applies. A
+    poll that fails transiently is logged and retried at the next poll; any other
+    failure is raised to the consumer (after it has consumed any buffered items).
+
+    The poller starts when the first item is requested, and is stopped when the
+    generator is closed (e.g. by contextlib.aclosing(), when the consumer is done).
+    """
+
+    if interval <= 0:
+        raise ValueError(f"Invalid interval: {interval}")
+    if buffer_size < 1:
+        raise ValueError(f"Invalid buffer_size: {buffer_size}")
+
+    return _stream(poll, _StreamBuffer(buffer_size, policy, coalesce), interval, logger)
+
+
+async def _stream[T](
+    poll: Callable[[], Awaitable[T | None]],
+    buffer: _StreamBuffer[T],
+    interval: float,
+    logger: logging.Logger,
+) -> AsyncGenerator[T]:
+    """Yield the items of the buffer, as they are added by a poller (a task)."""
+
+    poller = asyncio.create_task(_poll_forever(poll, buffer, interval, logger))
+    poller.add_done_callback(buffer.close)
+
+    try:
+        while True:
+            try:
+                item = await buffer.get()
+            except StopAsyncIteration:
+                return
+            yield item
+
+    finally:
+        if not poller.done():
+            poller.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await poller
+
+        if buffer.dropped:
+            logger.debug(f"Stream closed: {buffer.dropped} items dropped/coalesced")
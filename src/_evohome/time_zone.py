@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from datetime import datetime as dt, timedelta as td, tzinfo
+import calendar
+from datetime import date, datetime as dt, time, timedelta as td, tzinfo
+from functools import lru_cache
 from typing import TYPE_CHECKING, Final
 
-from .windows_zones import WINDOWS_TO_IANA_LOOKUP
+from .windows_zones import WINDOWS_DST_RULES_LOOKUP, WINDOWS_TO_IANA_LOOKUP
 
 if TYPE_CHECKING:
     from evohomeasync2.typedefs import EvoTimeZoneT
@@ -14,12 +16,43 @@ SZ_CURRENT_OFFSET_MINUTES: Final = "current_offset_minutes"
 SZ_OFFSET_MINUTES: Final = "offset_minutes"
 SZ_TIME_ZONE_ID: Final = "time_zone_id"
 
+_LAST_WEEK: Final = 5  # i.e. the last such weekday of the month
+
+# (month, week, weekday, minutes), see: windows_zones.py
+type _DstTransition = tuple[int, int, int, int]
+# (dst_minutes, start, end)
+type DstRulesT = tuple[int, _DstTransition, _DstTransition]
+
 
 def iana_tz_from_windows_tz(time_zone: str) -> str:
     """Return the IANA TZ identifier from the Windows TZ id."""
     return WINDOWS_TO_IANA_LOOKUP[time_zone.replace(" ", "").replace(".", "")]
 
 
+def dst_rules_from_windows_tz(time_zone: str) -> DstRulesT | None:
+    """Return the DST rules from the Windows TZ id (None if it doesn't observe DST).
+
+    Unlike the IANA TZ (which requires the tzdata of the host), these rules are
+    available offline. Returns None for an unknown (or irregular) time zone.
+    """
+    return WINDOWS_DST_RULES_LOOKUP.get(time_zone.replace(" ", "").replace(".", ""))
+
+
+@lru_cache(maxsize=64)
+def _transition_time(year: int, transition: _DstTransition) -> dt:
+    """Return the (naive) local time at which DST starts/ends in a given year."""
+
+    month, week, weekday, minutes = transition
+
+    if week == _LAST_WEEK:
+        last = calendar.monthrange(year, month)[1]
+        day = last - (calendar.weekday(year, month, last) - weekday) % 7
+    else:  # the nth such weekday of the month
+        day = 1 + (weekday - calendar.weekday(year, month, 1)) % 7 + (week - 1) * 7
+
+    return dt.combine(date(year, month, day), time()) + td(minutes=minutes)
+
+
 # it is ostensibly optional to provide this data to the EvoZoneInfo class
 _DEFAULT_TIME_ZONE_INFO: EvoTimeZoneT = {
     SZ_TIME_ZONE_ID: "GMTStandardTime",
@@ -35,7 +68,8 @@ class EvoZoneInfo(tzinfo):
     """Return a tzinfo object based on a TCC location's time zone information.
 
     The location does not know its IANA time zone, only its offsets, so:
-    - this tzinfo object must be informed when the DST has started/stopped
+    - DST is determined by the (offline) DST rules of its Windows time zone, if known
+    - otherwise, this tzinfo object must be informed when the DST has started/stopped
     - the `tzname` name is based upon the Windows scheme
     """
 
@@ -45,6 +79,9 @@ class EvoZoneInfo(tzinfo):
     _utcoffset: td
     _dst: td
 
+    _std_offset: td
+    _dst_rules: DstRulesT | None = None
+
     # NOTE: from https://docs.python.org/3/library/datetime.html#datetime.tzinfo:
     # Special requirement for pickling: A tzinfo subclass must have an __init__()
     # method that can be called with no arguments, otherwise it can be pickled but
@@ -92,15 +129,16 @@ class EvoZoneInfo(tzinfo):
 
         So this object can correctly maintain its `utcoffset` and `dst` attrs, this
         method should be called (on instantiation and):
-        - when the time zone enters or leaves DST
+        - when the time zone enters or leaves DST (unless its DST rules are known)
         - when the location starts or stops using DST switching (not expected)
         """
 
         if time_zone_info is not None:  # TZ shouldn't change, only the current offset
             self._time_zone_info = time_zone_info
 
+            self._std_offset = td(minutes=time_zone_info[SZ_OFFSET_MINUTES])
             self._utcoffset = td(minutes=time_zone_info[SZ_CURRENT_OFFSET_MINUTES])
-            self._dst = self._utcoffset - td(minutes=time_zone_info[SZ_OFFSET_MINUTES])
+            self._dst = self._utcoffset - self._std_offset
 
             self._tzname = time_zone_info[SZ_TIME_ZONE_ID] + (
                 " (DST)" if self._dst else " (STD)"
@@ -109,32 +147,99 @@ class EvoZoneInfo(tzinfo):
         if use_dst_switching is not None:
             self._use_dst_switching = use_dst_switching
 
+        self._dst_rules = (
+            dst_rules_from_windows_tz(self._time_zone_info[SZ_TIME_ZONE_ID])
+            if self._use_dst_switching
+            else None
+        )
+
         # if not self._use_dst_switching:
         #     assert self._dst == td(0), "DST is not enabled, but the offset is non-zero"
 
+    def _is_dst(self, dt: dt, rules: DstRulesT) -> bool:
+        """Return True if DST is in effect at a (local, wall clock) datetime.
+
+        As per PEP 495, a time in the gap (when DST starts) or in the fold (when DST
+        ends) is assumed to be before the transition, unless its fold attr is 1.
+        """
+
+        minutes, start_rule, end_rule = rules
+        delta = td(minutes=minutes)
+
+        local = dt.replace(tzinfo=None, fold=0)
+        start = _transition_time(local.year, start_rule)
+        end = _transition_time(local.year, end_rule)
+
+        if dt.fold:  # i.e. after the transition
+            end -= delta
+        else:
+            start += delta
+
+        if start_rule < end_rule:  # i.e. northern hemisphere
+            return start <= local < end
+        return not end <= local < start
+
     def dst(self, dt: dt | None) -> td:
         """Return the daylight saving time adjustment, as a timedelta object.
 
         Return 0 if DST not in effect. utcoffset() must include the DST offset.
+
+        If the DST rules of the time zone are not known, the current DST adjustment
+        (as last provided by the vendor) is returned, regardless of the datetime.
         """
 
-        if dt:  # we can't know when DST starts/stops
-            raise NotImplementedError("DST transitions are not implemented")
+        if dt is None or self._dst_rules is None:
+            return self._dst
 
-        return self._dst
+        if self._is_dst(dt, self._dst_rules):
+            return td(minutes=self._dst_rules[0])
+        return td(0)
 
-    def tzname(self, dt: dt | None) -> str:  # noqa: ARG002
+    def tzname(self, dt: dt | None) -> str:
         "datetime -> string name of time zone."
-        return self._tzname
 
-    def utcoffset(self, dt: dt | None) -> td:  # noqa: ARG002
+        if dt is None or self._dst_rules is None:
+            return self._tzname
+
+        return self._time_zone_info[SZ_TIME_ZONE_ID] + (
+            " (DST)" if self.dst(dt) else " (STD)"
+        )
+
+    def utcoffset(self, dt: dt | None) -> td:
         """Return offset of local time from UTC, as a timedelta object.
 
         The timedelta is positive east of UTC. If local time is west of UTC, this
         should be negative.
         """
 
-        return self._utcoffset
+        if dt is None or self._dst_rules is None:
+            return self._utcoffset
+
+        return self._std_offset + self.dst(dt)
+
+    def fromutc(self, dt: dt) -> dt:
+        """Return the local time (in this time zone) of a datetime that is in UTC."""
+
+        if self._dst_rules is None:
+            return super().fromutc(dt)
+
+        if dt.tzinfo is not self:
+            raise ValueError("fromutc: dt.tzinfo is not self")
+
+        minutes, start_rule, end_rule = self._dst_rules
+        delta = td(minutes=minutes)
+
+        utc = dt.replace(tzinfo=None)
+        start = _transition_time(utc.year, start_rule) - self._std_offset
+        end = _transition_time(utc.year, end_rule) - self._std_offset - delta
+
+        is_dst = (  # start_rule < end_rule, i.e. northern hemisphere
+            start <= utc < end if start_rule < end_rule else not end <= utc < start
+        )
+
+        return (dt + self._std_offset + (delta if is_dst else td(0))).replace(
+            fold=int(end <= utc < end + delta)  # i.e. the repeated hour/s
+        )
 
 
 ### TZ data for v2 location (newer API)...
@@ -170,3 +170,77 @@ WINDOWS_TO_IANA_LOOKUP = {
         | WINDOWS_TO_IANA_NASA
     ).items()
 }
+
+
+# The (current) DST rules of those Windows time zones that observe DST, as derived from
+# the IANA tz database for the zones above, as: (dst_minutes, start, end), where the
+# start/end of DST are each: (month, week, weekday, minutes), and:
+# - week is 1-4 (the nth such weekday of the month), or 5 (the last such weekday)
+# - weekday is 0-6 (Monday is 0)
+# - minutes is the local (wall clock) time of the transition, relative to midnight of
+#   that weekday, so it can be negative (the day before) or >= 1440 (the day after)
+# Time zones whose DST rules are not regular (e.g. Asia/Hebron) are excluded.
+
+_DST_RULES_AUS = (60, (10, 1, 6, 120), (4, 1, 6, 180))
+_DST_RULES_EET = (60, (3, 5, 6, 180), (10, 5, 6, 240))  # EU, at UTC+2
+_DST_RULES_CET = (60, (3, 5, 6, 120), (10, 5, 6, 180))  # EU, at UTC+1
+_DST_RULES_USA = (60, (3, 2, 6, 120), (11, 1, 6, 120))
+
+WINDOWS_DST_RULES_APAC = {
+    "AUS Eastern Standard Time": _DST_RULES_AUS,
+    "Cen. Australia Standard Time": _DST_RULES_AUS,
+    "Chatham Islands Standard Time": (60, (9, 5, 6, 165), (4, 1, 6, 225)),
+    "Easter Island Standard Time": (60, (9, 1, 5, 1320), (4, 1, 5, 1320)),
+    "Lord Howe Standard Time": (30, (10, 1, 6, 120), (4, 1, 6, 120)),
+    "New Zealand Standard Time": (60, (9, 5, 6, 120), (4, 1, 6, 180)),
+    "Norfolk Standard Time": _DST_RULES_AUS,
+    "Tasmania Standard Time": _DST_RULES_AUS,
+}
+
+WINDOWS_DST_RULES_ASIA = {
+    "Israel Standard Time": (60, (3, 4, 3, 1560), (10, 5, 6, 120)),
+    "Middle East Standard Time": (60, (3, 5, 6, 0), (10, 5, 6, 0)),
+}
+
+WINDOWS_DST_RULES_NASA = {
+    "Aleutian Standard Time": _DST_RULES_USA,
+    "Alaskan Standard Time": _DST_RULES_USA,
+    "Pacific Standard Time (Mexico)": _DST_RULES_USA,
+    "Pacific Standard Time": _DST_RULES_USA,
+    "Mountain Standard Time": _DST_RULES_USA,
+    "Central Standard Time": _DST_RULES_USA,
+    "Eastern Standard Time": _DST_RULES_USA,
+    "Haiti Standard Time": _DST_RULES_USA,
+    "Cuba Standard Time": (60, (3, 2, 6, 0), (11, 1, 6, 60)),
+    "US Eastern Standard Time": _DST_RULES_USA,
+    "Turks And Caicos Standard Time": _DST_RULES_USA,
+    "Atlantic Standard Time": _DST_RULES_USA,
+    "Pacific SA Standard Time": (60, (9, 1, 5, 1440), (4, 1, 5, 1440)),
+    "Newfoundland Standard Time": _DST_RULES_USA,
+    "Greenland Standard Time": (60, (3, 5, 6, -60), (10, 5, 6, 0)),
+    "Saint Pierre Standard Time": _DST_RULES_USA,
+}
+
+WINDOWS_DST_RULES_EMEA = {
+    "Azores Standard Time": (60, (3, 5, 6, 0), (10, 5, 6, 60)),
+    "GMT Standard Time": (60, (3, 5, 6, 60), (10, 5, 6, 120)),
+    "W. Europe Standard Time": _DST_RULES_CET,
+    "Central Europe Standard Time": _DST_RULES_CET,
+    "Romance Standard Time": _DST_RULES_CET,
+    "Central European Standard Time": _DST_RULES_CET,
+    "GTB Standard Time": _DST_RULES_EET,
+    "Egypt Standard Time": (60, (4, 5, 4, 0), (10, 5, 3, 1440)),
+    "E. Europe Standard Time": (60, (3, 5, 6, 120), (10, 5, 6, 180)),
+    "FLE Standard Time": _DST_RULES_EET,
+}
+
+
+WINDOWS_DST_RULES_LOOKUP = {
+    k.replace(" ", "").replace(".", ""): v
+    for k, v in (
+        WINDOWS_DST_RULES_APAC
+        | WINDOWS_DST_RULES_ASIA
+        | WINDOWS_DST_RULES_EMEA
+        | WINDOWS_DST_RULES_NASA
+    ).items()
+}
@@ -191,6 +191,7 @@ async def cli(
 
     async def cleanup() -> None:
         """Close the web session and save the access token to the cache."""
+        await evo.close()
         await token_manager.save_access_token()
         await websession.close()
 
@@ -12,6 +12,11 @@ from typing import Self
 
 import aiohttp
 
+from _evohome.rate_limiter import AbstractRateLimiter, RateLimiter
+from _evohome.response_cache import ResponseCache
+from _evohome.retry import RetryPolicy
+from _evohome.streaming import BackpressurePolicy
+
 from .auth import AbstractSessionManager
 from .entities import ControlSystem, Gateway, HotWater, Location, Zone
 from .exceptions import (
@@ -133,6 +138,12 @@ class EvohomeClientOld(EvohomeClient):
 __all__ = [  # noqa: RUF022
     "EvohomeClient",
     "AbstractSessionManager",
+    "AbstractRateLimiter",
+    "RateLimiter",
+    "ResponseCache",
+    "RetryPolicy",
+    #
+    "BackpressurePolicy",
     #
     "Location",
     "Gateway",
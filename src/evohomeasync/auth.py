@@ -21,6 +21,10 @@ if TYPE_CHECKING:
     import aiohttp
     from aiohttp.typedefs import StrOrURL
 
+    from _evohome.rate_limiter import AbstractRateLimiter
+    from _evohome.response_cache import ResponseCache
+    from _evohome.retry import RetryPolicy
+
     from .schemas import TccSessionResponseT
     from .typedefs import EvoSessionDictT, EvoUserAccountDictT
 
@@ -40,6 +44,11 @@ URL_CRED: Final = "WebAPI/api/session"
 # GET/PUT resource url (i.e. /WebAPI/api/...)
 URL_BASE: Final = "WebAPI/api"
 
+# GET urls of resources that change rarely, and how long to cache them (seconds)
+CACHE_TTLS: Final = {
+    r"^accountInfo$": 3600,
+}
+
 
 class SessionIdEntryT(TypedDict):
     session_id: str
@@ -61,6 +70,7 @@ class AbstractSessionManager(CredentialsManagerBase, ABC):
         /,
         *,
         logger: logging.Logger | None = None,
+        rate_limiter: AbstractRateLimiter | None = None,
         _hostname: str | None = None,
     ) -> None:
         """Initialise the session manager."""
@@ -68,7 +78,12 @@ class AbstractSessionManager(CredentialsManagerBase, ABC):
         logger = logger or logging.getLogger(__name__)
 
         super().__init__(
-            client_id, secret, websession, logger=logger, _hostname=_hostname
+            client_id,
+            secret,
+            websession,
+            logger=logger,
+            rate_limiter=rate_limiter,
+            _hostname=_hostname,
         )
         self.clear_session_id()  # initialise the attrs
 
@@ -100,11 +115,20 @@ class AbstractSessionManager(CredentialsManagerBase, ABC):
         """
 
         if not self.is_session_valid():  # although may be rejected for other reasons
-            await self.fetch_session_id()
-            await self.save_session_id()
+            await self._fetches(SZ_SESSION_ID, self._refresh_session_id)
 
         return self.session_id
 
+    async def _refresh_session_id(self) -> None:
+        """Fetch (and save) a new session id, unless another caller has done so.
+
+        Concurrent callers of get_session_id() will await the same refresh.
+        """
+
+        if not self.is_session_valid():
+            await self.fetch_session_id()
+            await self.save_session_id()
+
     def is_session_valid(self) -> bool:
         """Return True if the session id is valid (the server may still reject it)."""
         return self._session_id_expires > dt.now(tz=UTC) + td(seconds=15)
@@ -217,13 +241,23 @@ class Auth(AbstractAuth):
         /,
         *,
         logger: logging.Logger | None = None,
+        rate_limiter: AbstractRateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        response_cache: ResponseCache | None = None,
         _hostname: str | None = None,
     ) -> None:
         """A class for interacting with the v0 Resideo TCC API."""
 
         logger = logger or logging.getLogger(__name__)
 
-        super().__init__(websession, logger=logger, _hostname=_hostname)
+        super().__init__(
+            websession,
+            logger=logger,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            response_cache=response_cache,
+            _hostname=_hostname,
+        )
 
         self._session_id = session_manager.get_session_id
         self._url_base = f"https://{self.hostname}/{URL_BASE}"
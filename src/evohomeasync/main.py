@@ -7,6 +7,7 @@ from http import HTTPStatus
 from typing import TYPE_CHECKING, Final
 
 from _evohome.helpers import camel_to_snake
+from _evohome.streaming import BackpressurePolicy, poll_stream
 
 from . import exceptions as exc
 from .auth import AbstractSessionManager, Auth
@@ -15,8 +16,14 @@ from .entities import Location
 from .schemas import factory_location_response_list, factory_user_account_info_response
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
     import aiohttp
 
+    from _evohome.rate_limiter import AbstractRateLimiter
+    from _evohome.response_cache import ResponseCache
+    from _evohome.retry import RetryPolicy
+
     from .typedefs import EvoTcsInfoDictT, EvoUserAccountDictT
 
 SCH_GET_ACCOUNT_INFO: Final = factory_user_account_info_response(camel_to_snake)
@@ -37,6 +44,9 @@ class EvohomeClient:
         /,
         *,
         websession: aiohttp.ClientSession | None = None,
+        rate_limiter: AbstractRateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        response_cache: ResponseCache | None = None,
         debug: bool = False,
     ) -> None:
         """Construct the v0 EvohomeClient object."""
@@ -47,7 +57,13 @@ class EvohomeClient:
             self._logger.debug("Debug mode explicitly enabled via kwarg.")
 
         self._session_manager = session_manager
-        self.auth = Auth(session_manager, websession or session_manager.websession)
+        self.auth = Auth(
+            session_manager,
+            websession or session_manager.websession,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            response_cache=response_cache,
+        )
 
         # self.devices: dict[_ZoneIdT, _DeviceDictT] = {}  # dhw or zone by id
         # self.named_devices: dict[_ZoneNameT, _DeviceDictT] = {}  # zone by name
@@ -104,6 +120,52 @@ class EvohomeClient:
 
         return self._user_locs
 
+    def stream(
+        self,
+        interval: float,
+        /,
+        *,
+        buffer_size: int = 1,
+        policy: BackpressurePolicy = BackpressurePolicy.COALESCE,
+    ) -> AsyncGenerator[list[EvoTcsInfoDictT]]:
+        """Poll the config/status of all the user's locations every `interval` seconds.
+
+        Yields a snapshot per poll: the latest config/status of each location (in
+        order), as returned by update(). The polls are made at a fixed rate (a slow
+        poll delays, but does not overlap, the next), and up to `buffer_size` snapshots
+        are buffered for the consumer; when the buffer is full, then (as per `policy`)
+        the oldest snapshot is dropped, the snapshot is coalesced (i.e. replaced by the
+        newer one), or the polls are deferred (i.e. blocked) until there is room.
+
+        Failed polls are logged and retried at the next poll (if the session id was
+        rejected, it is re-authenticated); only bad credentials (or an unexpected
+        error) are raised to the consumer. Polling stops when the generator is closed
+        (e.g. via contextlib.aclosing()).
+        """
+
+        return poll_stream(
+            self._poll_status,
+            interval=interval,
+            logger=self._logger,
+            buffer_size=buffer_size,
+            policy=policy,
+        )
+
+    async def _poll_status(self) -> list[EvoTcsInfoDictT]:
+        """Update (and return) the config/status of the user's locations, for a stream.
+
+        If the session id is rejected, it is cleared, so that the next poll will
+        re-authenticate.
+        """
+
+        try:
+            return await self.update()
+
+        except exc.ApiCallFailedError as err:
+            if err.status == HTTPStatus.UNAUTHORIZED:  # 401
+                self._session_manager.clear_session_id()
+            raise
+
     async def _get_config(self) -> list[EvoTcsInfoDictT]:
         """Ensures the config of the user and their locations.
 
@@ -12,7 +12,14 @@ from typing import Self
 
 import aiohttp
 
+from _evohome.rate_limiter import AbstractRateLimiter, RateLimiter
+from _evohome.response_cache import ResponseCache
+from _evohome.retry import RetryPolicy
+from _evohome.shape_cache import ShapeCache
+from _evohome.streaming import BackpressurePolicy
+
 from .auth import AbstractTokenManager
+from .changes import ChangeType, StatusChange
 from .const import (
     DayOfWeek,
     DhwState,
@@ -26,7 +33,7 @@ from .const import (
     ZoneModelType,
     ZoneType,
 )
-from .control_system import ControlSystem
+from .control_system import ControlSystem, RestoreStatus, ScheduleRestoreResult
 from .exceptions import (
     ApiCallFailedError,
     ApiRateLimitExceededError,
@@ -52,6 +59,9 @@ from .gateway import Gateway
 from .hotwater import HotWater
 from .location import Location
 from .main import EvohomeClient
+from .planner import BudgetPlanner, PollAllocation
+from .polling import AdaptivePollingScheduler
+from .schedule_store import AbstractScheduleStore
 from .zone import Zone
 
 
@@ -120,6 +130,7 @@ class EvohomeClientOld(EvohomeClient):
 
     async def close(self) -> None:
         """Close the owned aiohttp.ClientSession, if any."""
+        await super().close()
         if self._owns_session:
             await self._token_manager.websession.close()
 
@@ -152,19 +163,33 @@ class EvohomeClientOld(EvohomeClient):
 
 __all__ = [  # noqa: RUF022
     "EvohomeClient",
+    "AdaptivePollingScheduler",
+    "BudgetPlanner",
     "AbstractTokenManager",
+    "AbstractScheduleStore",
+    "AbstractRateLimiter",
+    "RateLimiter",
+    "ResponseCache",
+    "RetryPolicy",
+    "ShapeCache",
     #
     "Location",
     "Gateway",
     "ControlSystem",
+    "ScheduleRestoreResult",
     "Zone",
     "HotWater",
+    "PollAllocation",
+    "StatusChange",
     #
+    "BackpressurePolicy",
+    "ChangeType",
     "DayOfWeek",
     "DhwState",
     "FanMode",
     "FaultType",
     "LocationType",
+    "RestoreStatus",
     "SystemMode",
     "TcsModelType",
     "TimingMode",
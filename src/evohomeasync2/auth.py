@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import logging
+import random
 from abc import ABC, abstractmethod
+from contextlib import suppress
 from datetime import UTC, datetime as dt, timedelta as td
 from http import HTTPStatus
 from typing import TYPE_CHECKING, Any, Final, TypedDict
@@ -22,6 +25,11 @@ if TYPE_CHECKING:
     import aiohttp
     from aiohttp.typedefs import StrOrURL
 
+    from _evohome.rate_limiter import AbstractRateLimiter
+    from _evohome.response_cache import ResponseCache
+    from _evohome.retry import RetryPolicy
+    from _evohome.shape_cache import ShapeCache
+
     from .schemas.account import TccOAuthTokenResponseT
     from .typedefs import EvoAuthTokensResponseT
 
@@ -72,12 +80,28 @@ CREDS_USER_PASSWORD: Final = {
 }
 
 
+# the lifetime of an access token, if not known (e.g. when loaded from a cache)
+_DEFAULT_EXPIRES_IN: Final = 1800  # seconds
+
+# the interval between attempts, if a background refresh of a token fails
+_REFRESH_RETRY_INTERVAL: Final = 60  # seconds
+
+_RANDOM: Final = random.SystemRandom()
+
+
 # POST authentication url (i.e. /Auth/OAuth/Token)
 URL_CRED: Final = "Auth/OAuth/Token"
 
 # GET/PUT resource url (e.g. /WebAPI/emea/api/v1/...)
 URL_BASE: Final = "WebAPI/emea/api/v1"
 
+# GET urls of resources that change rarely, and how long to cache them (seconds)
+CACHE_TTLS: Final = {
+    r"^userAccount$": 3600,
+    r"^location/installationInfo\?": 3600,  # (not location/{id}/installationInfo)
+    r"^(temperatureZone|domesticHotWater)/\d+/schedule$": 900,
+}
+
 
 class AbstractTokenManager(CredentialsManagerBase, ABC):
     """An ABC for managing the auth tokens used for HTTP authentication."""
@@ -93,6 +117,7 @@ class AbstractTokenManager(CredentialsManagerBase, ABC):
         websession: aiohttp.ClientSession,
         /,
         logger: logging.Logger | None = None,
+        rate_limiter: AbstractRateLimiter | None = None,
         _hostname: str | None = None,
     ) -> None:
         """Initialize the token manager."""
@@ -100,10 +125,18 @@ class AbstractTokenManager(CredentialsManagerBase, ABC):
         logger = logger or logging.getLogger(__name__)
 
         super().__init__(
-            client_id, secret, websession, logger=logger, _hostname=_hostname
+            client_id,
+            secret,
+            websession,
+            logger=logger,
+            rate_limiter=rate_limiter,
+            _hostname=_hostname,
         )
         self.clear_access_token()  # initialise the attrs
 
+        self._access_token_lifetime = td(seconds=_DEFAULT_EXPIRES_IN)
+        self._refresh_task: asyncio.Task[None] | None = None
+
     def clear_access_token(self) -> None:
         """Clear the auth tokens attrs (set to falsey state)."""
 
@@ -132,10 +165,102 @@ class AbstractTokenManager(CredentialsManagerBase, ABC):
         """
 
         if not self.is_token_valid():  # although may be rejected for other reasons
+            await self._fetches(SZ_ACCESS_TOKEN, self._refresh_access_token)
+
+        return self.access_token
+
+    async def _refresh_access_token(self) -> None:
+        """Fetch (and save) a new token, unless another caller has already done so.
+
+        Concurrent callers of get_access_token() will await the same refresh.
+        """
+
+        if not self.is_token_valid():
             await self.fetch_access_token()
             await self.save_access_token()
 
-        return self.access_token
+    def start_background_refresh(
+        self, *, fraction: float = 0.8, jitter: float = 0.05
+    ) -> None:
+        """Start renewing the access token in the background, before it expires.
+
+        The token is renewed (and saved) once a fraction of its lifetime (expires_in)
+        has passed, give or take some jitter, so that requests never have to wait
+        for the vendor's authenticator.
+        """
+
+        if not 0 < fraction - jitter <= fraction + jitter < 1:
+            raise ValueError(f"Invalid fraction/jitter: {fraction}/{jitter}")
+
+        if self._refresh_task and not self._refresh_task.done():
+            return
+
+        self._refresh_task = asyncio.create_task(
+            self._refresh_in_background(fraction, jitter)
+        )
+        self._refresh_task.add_done_callback(self._background_refresh_done)
+
+    def _background_refresh_done(self, task: asyncio.Task[None]) -> None:
+        """Log any unexpected exception that ended the background refresh."""
+
+        if task.cancelled() or (err := task.exception()) is None:
+            return
+
+        self._logger.error(
+            "Background refresh of access_token stopped unexpectedly",
+            exc_info=err,
+        )
+
+    async def stop_background_refresh(self) -> None:
+        """Stop renewing the access token in the background."""
+
+        if (task := self._refresh_task) is None:
+            return
+
+        self._refresh_task = None
+        if task.done():  # any exception has already been logged
+            return
+
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+    async def _refresh_in_background(self, fraction: float, jitter: float) -> None:
+        """Renew the access token (via the refresh token), until cancelled.
+
+        Also stops if the websession has been closed.
+        """
+
+        while True:
+            if self._access_token:  # otherwise, there is no token to renew (yet)
+                lifetime = self._access_token_lifetime.total_seconds()
+                refresh_at = self._access_token_expires - td(
+                    seconds=lifetime * (1 - fraction + _RANDOM.uniform(-jitter, jitter))
+                )
+                await asyncio.sleep(
+                    max((refresh_at - dt.now(tz=UTC)).total_seconds(), 0)
+                )
+
+            if self.websession.closed:
+                return
+
+            try:
+                await self._fetches(SZ_ACCESS_TOKEN, self._renew_access_token)
+
+            except exc.BadUserCredentialsError:  # the hint has already been logged
+                return
+
+            except exc.EvohomeError as err:  # e.g. AuthenticationFailedError
+                self._logger.warning(
+                    f"Background refresh of access_token failed: {err}"
+                )
+                await asyncio.sleep(_REFRESH_RETRY_INTERVAL)
+
+    async def _renew_access_token(self) -> None:
+        """Fetch (and save) a new token, even if the current token is still valid."""
+
+        await self.fetch_access_token()
+        await self.save_access_token()
 
     def is_token_valid(self) -> bool:
         """Return True if the access token is valid (the server may still reject it)."""
@@ -213,9 +338,8 @@ class AbstractTokenManager(CredentialsManagerBase, ABC):
 
         try:
             self._access_token = tokens[SZ_ACCESS_TOKEN]
-            self._access_token_expires = dt.now(tz=UTC) + td(
-                seconds=tokens[SZ_EXPIRES_IN]
-            )
+            self._access_token_lifetime = td(seconds=tokens[SZ_EXPIRES_IN])
+            self._access_token_expires = dt.now(tz=UTC) + self._access_token_lifetime
             self._refresh_token = tokens[SZ_REFRESH_TOKEN]
 
         except (KeyError, TypeError) as err:
@@ -242,6 +366,27 @@ class AbstractTokenManager(CredentialsManagerBase, ABC):
         Should ideally confirm the access token is valid before saving.
         """
 
+    def export_access_token(self) -> EvoAccessTokenEntryT:
+        """Return the auth tokens (e.g. for a snapshot of the client's state)."""
+        return self._export_access_token()
+
+    def import_access_token(self, tokens: EvoAccessTokenEntryT) -> bool:
+        """Import the auth tokens (e.g. from a snapshot), unless they are not newer.
+
+        Returns True if the tokens were imported. Raises ValueError if their expiry
+        is not a timezone-aware datetime.
+        """
+
+        expires = dt.fromisoformat(tokens[SZ_ACCESS_TOKEN_EXPIRES])
+        if expires.tzinfo is None:
+            raise ValueError(f"{SZ_ACCESS_TOKEN_EXPIRES} is not TZ-aware: {expires}")
+
+        if expires <= self._access_token_expires:
+            return False
+
+        self._import_access_token(tokens)
+        return True
+
     def _import_access_token(self, tokens: EvoAccessTokenEntryT) -> None:
         """Extract the token data from a (serialized) dictionary."""
 
@@ -269,13 +414,25 @@ class Auth(AbstractAuth):
         /,
         *,
         logger: logging.Logger | None = None,
+        rate_limiter: AbstractRateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        response_cache: ResponseCache | None = None,
+        shape_cache: ShapeCache | None = None,
         _hostname: str | None = None,
     ) -> None:
         """A class for interacting with the v2 Resideo TCC API."""
 
         logger = logger or logging.getLogger(__name__)
 
-        super().__init__(websession, logger=logger, _hostname=_hostname)
+        super().__init__(
+            websession,
+            logger=logger,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            response_cache=response_cache,
+            shape_cache=shape_cache,
+            _hostname=_hostname,
+        )
 
         self._access_token = token_manager.get_access_token
         self._url_base = f"https://{self.hostname}/{URL_BASE}"
@@ -0,0 +1,43 @@
+"""Provides the change-sets of the status updates of TCC entities.
+
+Each status update (i.e. Location.update()) is cascaded down the entity hierarchy,
+and each entity compares its new status to its previous status. The changes are passed
+to any listeners of the entity (and of its location, and of the client).
+"""
+
+from __future__ import annotations
+
+from enum import EnumCheck, StrEnum, verify
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .zone import EntityBase
+
+
+@verify(EnumCheck.UNIQUE)
+class ChangeType(StrEnum):
+    """The attr of an entity's status that has changed."""
+
+    FAULT_ADDED = "fault_added"  # old is None, new is the fault
+    FAULT_REMOVED = "fault_removed"  # old is the fault, new is None
+    MODE = "mode"  # the zone/DHW mode
+    NAME = "name"
+    OFFLINE = "offline"  # whether the location's gateways have lost communication
+    SETPOINT = "setpoint"  # the zone's target heat temperature
+    STATE = "state"  # the DHW's state
+    SYSTEM_MODE = "system_mode"
+    TEMPERATURE = "temperature"
+
+
+class StatusChange(NamedTuple):
+    """A change to an entity's status (old is None for the entity's first status)."""
+
+    entity: EntityBase[Any]
+    type: ChangeType
+    old: Any
+    new: Any
+
+
+type StatusListener = Callable[[list[StatusChange]], None]
@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import json
+from contextlib import AbstractAsyncContextManager, nullcontext
+from enum import EnumCheck, StrEnum, verify
 from functools import cached_property
-from typing import TYPE_CHECKING, Final, overload
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Final, NamedTuple, overload
 
+from _evohome.concurrency import MAX_CONCURRENCY, gather_with_limit
 from _evohome.helpers import as_aware_dtm, as_local_time
 
 from . import exceptions as exc
+from .changes import ChangeType
 from .const import (
     SZ_ACTIVE_FAULTS,
     SZ_ALLOWED_SYSTEM_MODES,
@@ -31,15 +36,16 @@ from .const import (
     TcsModelType,
 )
 from .hotwater import HotWater
+from .schemas.compiler import compile_schema
 from .schemas.const import TccEntityType
 from .schemas.helpers import Case
 from .schemas.status import factory_tcs_status
 from .typedefs import EvoTcsStatusT
-from .zone import ActiveFaultsBase, Zone
+from .zone import ActiveFaultsBase, Zone, _canonical_schedule
 
 if TYPE_CHECKING:
     import logging
-    from collections.abc import Mapping
+    from collections.abc import Awaitable, Mapping
     from datetime import datetime as dt
     from typing import Any
 
@@ -47,6 +53,7 @@ if TYPE_CHECKING:
 
     from . import Gateway, Location
     from .auth import Auth
+    from .changes import StatusChange
     from .typedefs import (
         EvoAllowedSystemModesT,
         EvoDhwScheduleDayOfWeekT,
@@ -61,6 +68,20 @@ if TYPE_CHECKING:
     )
 
 
+def _is_auth_error(err: exc.EvohomeError) -> bool:
+    """Return True if an error is due to a failure to authenticate.
+
+    A rejected access_token is an ApiCallFailedError with a 401 (not an
+    AuthenticationFailedError).
+    """
+
+    if isinstance(err, exc.AuthenticationFailedError):
+        return True
+    return isinstance(err, exc.ApiCallFailedError) and (
+        err.status == HTTPStatus.UNAUTHORIZED
+    )
+
+
 def _sched_id(schedule: Mapping[str, Any]) -> str:
     """Return the zone_id or dhw_id from a schedule."""
 
@@ -72,12 +93,32 @@ def _sched_id(schedule: Mapping[str, Any]) -> str:
     return dhw_id
 
 
+@verify(EnumCheck.UNIQUE)
+class RestoreStatus(StrEnum):
+    """The outcome of restoring the schedule of a zone/dhw."""
+
+    SUCCESS = "success"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+    UNCHANGED = "unchanged"  # is the same as the current schedule, so not uploaded
+    CHANGED = "changed"  # differs from the current schedule, but not uploaded (dry run)
+
+
+class ScheduleRestoreResult(NamedTuple):
+    """The outcome of restoring the schedule of a zone/dhw."""
+
+    id: str  # the zone_id/dhw_id
+    name: str | None
+    status: RestoreStatus
+    error: exc.EvohomeError | None = None  # why it failed (or was skipped)
+
+
 class ControlSystem(ActiveFaultsBase[EvoTcsStatusT]):
     """Instance of a gateway's TCS (temperatureControlSystem)."""
 
     _TCC_TYPE = TccEntityType.TCS
 
-    SCH_STATUS: vol.Schema = factory_tcs_status(Case.PYTHONIC)
+    SCH_STATUS: vol.Schema = compile_schema(factory_tcs_status(Case.PYTHONIC))
 
     def __init__(self, gateway: Gateway, config: EvoTcsConfigResponseT) -> None:
         super().__init__(config[SZ_SYSTEM_ID])
@@ -120,6 +161,13 @@ class ControlSystem(ActiveFaultsBase[EvoTcsStatusT]):
     def _logger(self) -> logging.Logger:
         return self.location.client.logger
 
+    def _deferred_saves(self) -> AbstractAsyncContextManager[None]:
+        """Save any schedule store once per batch (not once per zone/dhw)."""
+
+        if (store := self.location.client.schedule_store) is None:
+            return nullcontext()
+        return store.deferred_saves()
+
     @property  # not strictly static, but library largely assumes so
     def config(self) -> EvoTcsConfigT:
         """Return the latest config of the entity."""
@@ -166,15 +214,35 @@ class ControlSystem(ActiveFaultsBase[EvoTcsStatusT]):
 
     # Status (state) attrs & methods...
 
-    def _update_status(self, status: EvoTcsStatusResponseT) -> None:
-        """Update the TCS's status and cascade to its descendants."""
+    def _update_status(
+        self, status: EvoTcsStatusResponseT, *, notify: bool = True
+    ) -> list[StatusChange]:
+        """Update the TCS's status and cascade to its descendants.
+
+        Returns the change-set of the TCS and its descendants (the listeners are not
+        notified of it, if not `notify`).
+        """
+
+        old = self._tracked_values()
+
+        changes = self._update_faults(status[SZ_ACTIVE_FAULTS])
+
+        # the entity's own status, without its children's...
+        self._status = {
+            SZ_SYSTEM_ID: status[SZ_SYSTEM_ID],
+            SZ_ACTIVE_FAULTS: status[SZ_ACTIVE_FAULTS],
+            SZ_SYSTEM_MODE_STATUS: status[SZ_SYSTEM_MODE_STATUS],
+        }
 
-        self._update_faults(status[SZ_ACTIVE_FAULTS])
+        changes.extend(self._status_changes(old))
+        if notify:
+            self._notify_listeners(changes)
 
         # cascade the child status to descendants...
+        children: list[StatusChange] = []
         for zon_status in status[SZ_ZONES]:
             if zone := self.zone_by_id.get(zon_status[SZ_ZONE_ID]):
-                zone._update_status(zon_status)  # noqa: SLF001
+                children += zone._update_status(zon_status, notify=notify)  # noqa: SLF001
 
             else:
                 self._logger.warning(
@@ -184,7 +252,7 @@ class ControlSystem(ActiveFaultsBase[EvoTcsStatusT]):
 
         if dhw_status := status.get(SZ_DHW):
             if self.hotwater and self.hotwater.id == dhw_status[SZ_DHW_ID]:
-                self.hotwater._update_status(dhw_status)  # noqa: SLF001
+                children += self.hotwater._update_status(dhw_status, notify=notify)  # noqa: SLF001
 
             else:
                 self._logger.warning(
@@ -192,12 +260,10 @@ class ControlSystem(ActiveFaultsBase[EvoTcsStatusT]):
                     ", (has the system configuration been changed?)"
                 )
 
-        # the entity's own status, without its children's...
-        self._status = {
-            SZ_SYSTEM_ID: status[SZ_SYSTEM_ID],
-            SZ_ACTIVE_FAULTS: status[SZ_ACTIVE_FAULTS],
-            SZ_SYSTEM_MODE_STATUS: status[SZ_SYSTEM_MODE_STATUS],
-        }
+        return changes + children
+
+    def _status_values(self) -> dict[ChangeType, Any]:
+        return {ChangeType.SYSTEM_MODE: self.mode}
 
     @property
     def system_mode_status(self) -> EvoSystemModeStatusT:
@@ -380,8 +446,16 @@ class ControlSystem(ActiveFaultsBase[EvoTcsStatusT]):
 
     # these are convenience methods
 
-    async def get_schedules(self) -> list[EvoScheduleDhwT | EvoScheduleZoneT]:
-        """Backup all schedules from the TCS."""
+    async def get_schedules(
+        self, *, max_concurrency: int | None = MAX_CONCURRENCY
+    ) -> list[EvoScheduleDhwT | EvoScheduleZoneT]:
+        """Backup all schedules from the TCS.
+
+        The schedules are retrieved concurrently (at most `max_concurrency` at a time,
+        and subject to any rate limiter), but are returned in the same order as the
+        TCS's zones (then its DHW, if any). If any retrieval fails, the first failure
+        is raised (e.g. ApiCallFailedError), and any others are logged.
+        """
 
         @overload
         async def get_schedule(child: Zone) -> list[EvoZonScheduleDayOfWeekT]: ...
@@ -399,86 +473,126 @@ class ControlSystem(ActiveFaultsBase[EvoTcsStatusT]):
                 )
             return []
 
+        async def get_zon_schedule(zone: Zone) -> EvoScheduleZoneT:
+            return {
+                SZ_ZONE_ID: zone.id,
+                SZ_NAME: zone.name,
+                SZ_DAILY_SCHEDULES: await get_schedule(zone),
+            }
+
+        async def get_dhw_schedule(hotwater: HotWater) -> EvoScheduleDhwT:
+            return {
+                SZ_DHW_ID: hotwater.id,
+                SZ_NAME: hotwater.name,
+                SZ_DAILY_SCHEDULES: await get_schedule(hotwater),
+            }
+
         self._logger.info(
             f"Schedules: Backing up from {self.id} ({self.location.name})"
         )
 
-        schedules: list[EvoScheduleDhwT | EvoScheduleZoneT] = []
-
-        for zone in self.zones:
-            schedules.append(  # noqa: PERF401
-                {
-                    SZ_ZONE_ID: zone.id,
-                    SZ_NAME: zone.name,
-                    SZ_DAILY_SCHEDULES: await get_schedule(zone),
-                }
-            )
+        backups: list[Awaitable[EvoScheduleDhwT | EvoScheduleZoneT]] = [
+            get_zon_schedule(zone) for zone in self.zones
+        ]
         if hotwater := self.hotwater:
-            schedules.append(
-                {
-                    SZ_DHW_ID: hotwater.id,
-                    SZ_NAME: hotwater.name,
-                    SZ_DAILY_SCHEDULES: await get_schedule(hotwater),
-                }
-            )
+            backups.append(get_dhw_schedule(hotwater))
 
-        return schedules
+        try:
+            async with self._deferred_saves():
+                return await gather_with_limit(
+                    backups,
+                    limit=max_concurrency,
+                    message=f"Failed to backup some schedules of {self.id}",
+                )
+        except BaseExceptionGroup as err:  # raise only the first, as callers expect
+            for other in err.exceptions[1:]:
+                self._logger.warning(f"Schedules: Backup also failed: {other}")
+            raise err.exceptions[0] from None
 
-    async def set_schedules(
+    def _match_schedule(
         self,
-        schedules: list[EvoScheduleDhwT | EvoScheduleZoneT],
+        schedule: EvoScheduleDhwT | EvoScheduleZoneT,
+        /,
         *,
         match_by_name: bool | None = None,
-    ) -> bool:
-        """Restore all schedules to the TCS and return True if success.
+    ) -> HotWater | Zone | None:
+        """Return the zone/dhw of a schedule, or None (and log why) if no match."""
 
-        The default is to match a schedule to its zone/dhw by id.
-        """
-
-        async def restore_by_id(schedule: EvoScheduleDhwT | EvoScheduleZoneT) -> bool:
-            """Restore a schedule by id and return False if there was no match."""
+        name: str | None = schedule.get(SZ_NAME)  # name is NotRequired[str]
 
+        if not match_by_name:
             id_ = _sched_id(schedule)
 
             if self.hotwater and self.hotwater.id == id_:
-                await self.hotwater.set_schedule(
-                    json.dumps(schedule[SZ_DAILY_SCHEDULES])
-                )
+                return self.hotwater
+            if zone := self.zone_by_id.get(id_):
+                return zone
 
-            elif zone := self.zone_by_id.get(id_):
-                await zone.set_schedule(json.dumps(schedule[SZ_DAILY_SCHEDULES]))
+            self._logger.warning(
+                f"Ignoring schedule of {id_} ({name}): unknown id"
+                ", consider matching by name rather than by id"
+            )
+            return None
 
-            else:
-                self._logger.warning(
-                    f"Ignoring schedule of {id_} ({schedule.get(SZ_NAME)}): unknown id"
-                    ", consider matching by name rather than by id"
-                )
-                return False
+        if name and self.hotwater and name == self.hotwater.name:
+            return self.hotwater
+        if name and (zone := self.zone_by_name.get(name)):
+            return zone
 
-            return True
+        self._logger.warning(
+            f"Ignoring schedule of {_sched_id(schedule)} ({name}): unknown name"
+            ", consider matching by id rather than by name"
+        )
+        return None
 
-        async def restore_by_name(schedule: EvoScheduleDhwT | EvoScheduleZoneT) -> bool:
-            """Restore a schedule by name and return False if there was no match."""
+    async def _schedule_is_unchanged(
+        self,
+        child: HotWater | Zone,
+        schedule: EvoScheduleDhwT | EvoScheduleZoneT,
+    ) -> bool:
+        """Return True if a schedule is the same as the zone/dhw's current schedule.
 
-            name: str | None = schedule.get(SZ_NAME)  # name is NotRequired[str]
+        The current schedule is the one last got/set by this client (if it is not
+        stale), else it is got (from the schedule store only if it is still fresh).
+        """
 
-            if name and self.hotwater and name == self.hotwater.name:
-                await self.hotwater.set_schedule(
-                    json.dumps(schedule[SZ_DAILY_SCHEDULES])
-                )
+        new_schedule = _canonical_schedule(schedule[SZ_DAILY_SCHEDULES])
 
-            elif name and (zone := self.zone_by_name.get(name)):
-                await zone.set_schedule(json.dumps(schedule[SZ_DAILY_SCHEDULES]))
+        current: list[EvoDhwScheduleDayOfWeekT] | list[EvoZonScheduleDayOfWeekT]
+        if child._schedule_is_current():  # noqa: SLF001
+            current = child.schedule
+        else:  # e.g. restored from a store, so may have been changed by another client
+            try:
+                current = await child.get_schedule()
+            except exc.InvalidScheduleError:  # missing/invalid, so can't be the same
+                return False
 
-            else:
-                id_ = _sched_id(schedule)
+        return _canonical_schedule(current) == new_schedule
 
-                self._logger.warning(
-                    f"Ignoring schedule of {id_} ({name}): unknown name"
-                    ", consider matching by id rather than by name"
-                )
+    async def set_schedules(
+        self,
+        schedules: list[EvoScheduleDhwT | EvoScheduleZoneT],
+        *,
+        match_by_name: bool | None = None,
+        only_changed: bool = False,
+    ) -> bool:
+        """Restore all schedules to the TCS and return True if success.
+
+        The default is to match a schedule to its zone/dhw by id. If `only_changed` is
+        True, schedules that are the same as the current schedule are not uploaded.
+        """
+
+        async def restore(schedule: EvoScheduleDhwT | EvoScheduleZoneT) -> bool:
+            """Restore a schedule and return False if there was no match."""
+
+            child = self._match_schedule(schedule, match_by_name=match_by_name)
+            if child is None:
                 return False
 
+            if only_changed and await self._schedule_is_unchanged(child, schedule):
+                return True
+
+            await child.set_schedule(json.dumps(schedule[SZ_DAILY_SCHEDULES]))
             return True
 
         self._logger.info(
@@ -486,8 +600,8 @@ class ControlSystem(ActiveFaultsBase[EvoTcsStatusT]):
             f" to {self.id} ({self.location.name})"
         )
 
-        fnc = restore_by_name if match_by_name else restore_by_id
-        all_restored = all([await fnc(sch) for sch in schedules])
+        async with self._deferred_saves():
+            all_restored = all([await restore(sch) for sch in schedules])
 
         same_count = len(schedules) == len(self.zones) + (1 if self.hotwater else 0)
 
@@ -495,3 +609,90 @@ class ControlSystem(ActiveFaultsBase[EvoTcsStatusT]):
             self._logger.debug("Some schedules not restored (DHW?)")
 
         return success
+
+    async def restore_schedules(
+        self,
+        schedules: list[EvoScheduleDhwT | EvoScheduleZoneT],
+        *,
+        match_by_name: bool | None = None,
+        max_concurrency: int | None = MAX_CONCURRENCY,
+        stop_on_auth_error: bool = True,
+        only_changed: bool = False,
+        dry_run: bool = False,
+    ) -> list[ScheduleRestoreResult]:
+        """Restore all schedules to the TCS and return the outcome of each.
+
+        Unlike set_schedules(), the schedules are restored concurrently (at most
+        `max_concurrency` at a time, and subject to any rate limiter), and a failure
+        does not prevent the other schedules from being restored. The results are in
+        the same order as the schedules.
+
+        A schedule is skipped if it doesn't match a zone/dhw (by id, or by name), or if
+        an earlier upload failed to authenticate, e.g. was rejected with a 401 (and
+        `stop_on_auth_error` is True).
+
+        If `only_changed` is True, a schedule is compared with the current schedule of
+        its zone/dhw (in a canonical form), and is uploaded only if they differ. If
+        `dry_run` is True, they are compared but nothing is uploaded, so the results
+        report what would change.
+        """
+
+        auth_error: exc.EvohomeError | None = None
+
+        async def restore(
+            schedule: EvoScheduleDhwT | EvoScheduleZoneT,
+        ) -> ScheduleRestoreResult:
+            nonlocal auth_error
+
+            id_, name = _sched_id(schedule), schedule.get(SZ_NAME)
+
+            child = self._match_schedule(schedule, match_by_name=match_by_name)
+            if child is None:
+                return ScheduleRestoreResult(id_, name, RestoreStatus.SKIPPED)
+
+            if auth_error is not None:  # don't persist with invalid credentials
+                return ScheduleRestoreResult(
+                    child.id, child.name, RestoreStatus.SKIPPED, auth_error
+                )
+
+            try:
+                if (only_changed or dry_run) and await self._schedule_is_unchanged(
+                    child, schedule
+                ):
+                    return ScheduleRestoreResult(
+                        child.id, child.name, RestoreStatus.UNCHANGED
+                    )
+
+                if dry_run:
+                    return ScheduleRestoreResult(
+                        child.id, child.name, RestoreStatus.CHANGED
+                    )
+
+                await child.set_schedule(json.dumps(schedule[SZ_DAILY_SCHEDULES]))
+
+            except exc.EvohomeError as err:
+                if stop_on_auth_error and _is_auth_error(err):
+                    auth_error = err
+                error = err
+
+            else:
+                return ScheduleRestoreResult(
+                    child.id, child.name, RestoreStatus.SUCCESS
+                )
+
+            self._logger.warning(f"Failed to restore schedule of {child}: {error}")
+            return ScheduleRestoreResult(
+                child.id, child.name, RestoreStatus.FAILED, error
+            )
+
+        self._logger.info(
+            f"Schedules: Restoring (matched by {'name' if match_by_name else 'id'})"
+            f" to {self.id} ({self.location.name})"
+        )
+
+        async with self._deferred_saves():
+            return await gather_with_limit(
+                (restore(sch) for sch in schedules),
+                limit=max_concurrency,
+                message=f"Failed to restore some schedules of {self.id}",
+            )
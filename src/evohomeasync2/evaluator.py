@@ -0,0 +1,164 @@
+"""Provides the evaluation of the schedules of many zones/DHW at many datetimes.
+
+For example, to plan load, the scheduled setpoint of every zone at every 10-minute step
+of the coming week. NumPy is used if it is installed (it is an optional dependency of
+this library, i.e. evohome-async[numpy]), otherwise the evaluation falls back to pure
+Python (via bisect).
+"""
+
+from __future__ import annotations
+
+from itertools import chain
+from typing import TYPE_CHECKING, Any
+
+from _evohome.helpers import as_local_time
+
+from .zone import _MINUTES_PER_WEEK
+
+try:
+    import numpy as np
+except ModuleNotFoundError:  # is an optional dependency
+    _HAS_NUMPY = False
+else:
+    _HAS_NUMPY = True
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from datetime import datetime as dt, tzinfo
+
+    import numpy.typing as npt
+
+    from .hotwater import HotWater
+    from .zone import WeekTimeline, Zone
+
+
+def _minutes_of_week(timestamps: Sequence[dt], tzinfo: tzinfo) -> list[int]:
+    """Return the minute of the (local) week of each datetime, for a time zone."""
+
+    minutes: list[int] = []
+
+    for timestamp in timestamps:
+        local = as_local_time(timestamp, tzinfo)
+        minutes.append((local.weekday() * 24 + local.hour) * 60 + local.minute)
+
+    return minutes
+
+
+def _use_numpy(*, use_numpy: bool | None) -> bool:
+    """Return True if NumPy is to be used (by default, if it is installed)."""
+
+    if use_numpy is False:
+        return False
+
+    if not _HAS_NUMPY and use_numpy:  # it was explicitly required
+        raise ModuleNotFoundError(
+            "NumPy is required: install evohome-async[numpy]", name="numpy"
+        )
+
+    return _HAS_NUMPY
+
+
+def _evaluate_with_numpy(
+    timelines: Sequence[WeekTimeline],
+    minutes: Sequence[Sequence[int]],
+    rows: Sequence[int],
+) -> npt.NDArray[Any]:
+    """Return the (entities x timestamps) matrix of setpoints/states, via NumPy.
+
+    The timelines are packed into a single sorted array of keys, each entity in its own
+    band of (one week + 1) minutes; the first key of each band is a sentinel for the
+    last switchpoint of the previous week.
+    """
+
+    band = _MINUTES_PER_WEEK + 1
+    bands = np.arange(len(timelines)) * band
+
+    keys = np.asarray(list(chain.from_iterable((-1, *t.minutes) for t in timelines)))
+    keys += 1 + np.repeat(bands, [len(t) + 1 for t in timelines])
+
+    values = list(chain.from_iterable((t.values[-1], *t.values) for t in timelines))
+    dtype = float if all(isinstance(v, float) for v in values) else object
+
+    queries = np.asarray(minutes)[np.asarray(rows)]  # the minutes of each entity
+    queries += 1 + bands[:, None]
+
+    indices = np.searchsorted(keys, queries, side="right") - 1
+
+    matrix: npt.NDArray[Any] = np.asarray(values, dtype=dtype)[indices]
+    return matrix
+
+
+def _evaluate(
+    entities: Sequence[HotWater | Zone],
+    timestamps: Sequence[dt],
+    /,
+    *,
+    use_numpy: bool | None,
+) -> npt.NDArray[Any] | list[list[float | str]]:
+    """Return the (entities x timestamps) matrix of setpoints/states."""
+
+    timelines = [e.week_timeline() for e in entities]
+
+    # the timestamps are converted to minutes of the week once per time zone
+    row_by_tz: dict[int, int] = {}  # keyed by id(), as a tzinfo may not be hashable
+    minutes: list[list[int]] = []
+    rows: list[int] = []  # the row of minutes of each entity
+
+    for entity in entities:
+        tzinfo = entity.location.tzinfo
+        if (row := row_by_tz.get(id(tzinfo))) is None:
+            row = row_by_tz[id(tzinfo)] = len(minutes)
+            minutes.append(_minutes_of_week(timestamps, tzinfo))
+        rows.append(row)
+
+    if not _use_numpy(use_numpy=use_numpy):
+        return [t.values_at(minutes[r]) for t, r in zip(timelines, rows, strict=True)]
+
+    if not timelines or not timestamps:
+        return np.empty((len(timelines), len(timestamps)), dtype=object)
+
+    return _evaluate_with_numpy(timelines, minutes, rows)
+
+
+def evaluate_schedules(
+    entities: Sequence[HotWater | Zone],
+    timestamps: Sequence[dt],
+    /,
+    *,
+    use_numpy: bool | None = None,
+) -> list[list[float | str]]:
+    """Return the scheduled setpoint/state of each zone/DHW at each datetime.
+
+    The result is a (entities x timestamps) matrix: a row per entity (in order) and a
+    column per timestamp (in order). A zone's values are setpoints (float) and a DHW's
+    values are states (str). Each entity's schedule is evaluated in the local time of
+    its location (a naive timestamp is assumed to be in that local time).
+
+    Each entity must already have a schedule (e.g. via get_schedule(), or a schedule
+    store), else InvalidScheduleError is raised. NumPy is used if it is installed,
+    unless `use_numpy` is False (if it is True, then NumPy is required).
+    """
+
+    matrix = _evaluate(entities, timestamps, use_numpy=use_numpy)
+
+    result: list[list[float | str]] = (
+        matrix if isinstance(matrix, list) else matrix.tolist()
+    )
+    return result
+
+
+def evaluate_schedules_array(
+    entities: Sequence[HotWater | Zone],
+    timestamps: Sequence[dt],
+    /,
+) -> npt.NDArray[Any]:
+    """Return the scheduled setpoint/state of each zone/DHW at each datetime, via NumPy.
+
+    As evaluate_schedules(), but the matrix is a NumPy ndarray (of dtype float if every
+    entity is a zone, else object), which is faster when it is consumed by NumPy.
+    Raises ModuleNotFoundError if NumPy is not installed.
+    """
+
+    matrix = _evaluate(entities, timestamps, use_numpy=True)
+    assert not isinstance(matrix, list)  # mypy
+    return matrix
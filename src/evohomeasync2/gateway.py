@@ -7,13 +7,16 @@ from typing import TYPE_CHECKING, Final
 
 from .const import (
     SZ_ACTIVE_FAULTS,
+    SZ_FAULT_TYPE,
     SZ_GATEWAY_ID,
     SZ_GATEWAY_INFO,
     SZ_MAC,
     SZ_SYSTEM_ID,
     SZ_TEMPERATURE_CONTROL_SYSTEMS,
+    FaultType,
 )
 from .control_system import ControlSystem
+from .schemas.compiler import compile_schema
 from .schemas.const import TccEntityType
 from .schemas.helpers import Case
 from .schemas.status import factory_gwy_status
@@ -27,6 +30,7 @@ if TYPE_CHECKING:
 
     from . import Location
     from .auth import Auth
+    from .changes import StatusChange
     from .typedefs import EvoGwyConfigResponseT, EvoGwyConfigT, EvoGwyStatusResponseT
 
 
@@ -35,7 +39,7 @@ class Gateway(ActiveFaultsBase[EvoGwyStatusT]):
 
     _TCC_TYPE = TccEntityType.GWY
 
-    SCH_STATUS: vol.Schema = factory_gwy_status(Case.PYTHONIC)
+    SCH_STATUS: vol.Schema = compile_schema(factory_gwy_status(Case.PYTHONIC))
 
     def __init__(self, location: Location, config: EvoGwyConfigResponseT) -> None:
         super().__init__(config[SZ_GATEWAY_INFO][SZ_GATEWAY_ID])
@@ -75,15 +79,32 @@ class Gateway(ActiveFaultsBase[EvoGwyStatusT]):
 
     # Status (state) attrs & methods...
 
-    def _update_status(self, status: EvoGwyStatusResponseT) -> None:
-        """Update the GWY's status and cascade to its descendants."""
+    def is_offline(self) -> bool:
+        """Return True if the gateway has lost communication with the vendor's servers.
 
-        self._update_faults(status[SZ_ACTIVE_FAULTS])
+        If so, the status of its systems (and their DHW/zones) is stale.
+        """
+
+        return any(f[SZ_FAULT_TYPE] == FaultType.GWY_X_CL for f in self.active_faults)
+
+    def _update_status(
+        self, status: EvoGwyStatusResponseT, *, notify: bool = True
+    ) -> list[StatusChange]:
+        """Update the GWY's status and cascade to its descendants.
+
+        Returns the change-set of the GWY and its descendants (the listeners are not
+        notified of it, if not `notify`).
+        """
+
+        changes = self._update_faults(status[SZ_ACTIVE_FAULTS])
+        if notify:
+            self._notify_listeners(changes)
 
         # cascade the child status to descendants...
+        children: list[StatusChange] = []
         for tcs_status in status[SZ_TEMPERATURE_CONTROL_SYSTEMS]:
             if tcs := self.system_by_id.get(tcs_status[SZ_SYSTEM_ID]):
-                tcs._update_status(tcs_status)  # noqa: SLF001
+                children += tcs._update_status(tcs_status, notify=notify)  # noqa: SLF001
 
             else:
                 self._logger.warning(
@@ -96,3 +117,5 @@ class Gateway(ActiveFaultsBase[EvoGwyStatusT]):
             SZ_GATEWAY_ID: status[SZ_GATEWAY_ID],
             SZ_ACTIVE_FAULTS: status[SZ_ACTIVE_FAULTS],
         }
+
+        return changes + children
@@ -5,11 +5,12 @@
 from __future__ import annotations
 
 from functools import cached_property
-from typing import TYPE_CHECKING, Final
+from typing import TYPE_CHECKING, Any, Final
 
 from _evohome.helpers import as_aware_dtm, as_local_time
 
 from . import exceptions as exc
+from .changes import ChangeType
 from .const import (
     SZ_ALLOWED_MODES,
     SZ_ALLOWED_STATES,
@@ -24,6 +25,7 @@ from .const import (
     DhwState,
     ZoneMode,
 )
+from .schemas.compiler import compile_schema
 from .schemas.const import TccEntityType
 from .schemas.helpers import Case
 from .schemas.schedule import factory_dhw_schedule
@@ -52,8 +54,8 @@ class HotWater(_ZoneBase[EvoDhwStatusT, EvoDhwScheduleDayOfWeekT]):
 
     _TCC_TYPE = TccEntityType.DHW
 
-    SCH_SCHEDULE: vol.Schema = factory_dhw_schedule(Case.PYTHONIC)
-    SCH_STATUS: vol.Schema = factory_dhw_status(Case.PYTHONIC)
+    SCH_SCHEDULE: vol.Schema = compile_schema(factory_dhw_schedule(Case.PYTHONIC))
+    SCH_STATUS: vol.Schema = compile_schema(factory_dhw_status(Case.PYTHONIC))
 
     def __init__(self, tcs: ControlSystem, config: EvoDhwConfigResponseT) -> None:
         super().__init__(config[SZ_DHW_ID], tcs)
@@ -132,6 +134,13 @@ class HotWater(_ZoneBase[EvoDhwStatusT, EvoDhwScheduleDayOfWeekT]):
     def state(self) -> DhwState:
         return self.state_status[SZ_STATE]
 
+    def _status_values(self) -> dict[ChangeType, Any]:
+        return {
+            ChangeType.MODE: self.mode,
+            ChangeType.STATE: self.state,
+            ChangeType.TEMPERATURE: self.temperature,
+        }
+
     @property
     def until(self) -> dt | None:
         if (until := self.state_status.get(SZ_UNTIL)) is None:
@@ -8,13 +8,20 @@ from __future__ import annotations
 import logging
 from datetime import UTC, datetime as dt, tzinfo
 from functools import cached_property
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Final
 
+import voluptuous as vol
 from aiozoneinfo import async_get_time_zone
 
-from _evohome.helpers import convert_dtm_to_local_aware
-from _evohome.time_zone import EvoZoneInfo, iana_tz_from_windows_tz
+from _evohome.helpers import convert_dtm_to_local_aware, convert_dtms_to_iso_str
+from _evohome.time_zone import (
+    EvoZoneInfo,
+    dst_rules_from_windows_tz,
+    iana_tz_from_windows_tz,
+)
 
+from . import exceptions as exc
+from .changes import ChangeType, StatusChange
 from .const import (
     SZ_COUNTRY,
     SZ_GATEWAY_ID,
@@ -27,6 +34,7 @@ from .const import (
     SZ_USE_DAYLIGHT_SAVE_SWITCHING,
 )
 from .gateway import Gateway
+from .schemas.compiler import compile_schema
 from .schemas.config import factory_location_installation_info
 from .schemas.const import TccEntityType
 from .schemas.helpers import Case
@@ -35,7 +43,7 @@ from .typedefs import EvoLocStatusT
 from .zone import EntityBase
 
 if TYPE_CHECKING:
-    import voluptuous as vol
+    from collections.abc import Mapping
 
     from . import EvohomeClient
     from .auth import Auth
@@ -47,6 +55,8 @@ if TYPE_CHECKING:
     )
 
 
+SZ_STATUS: Final = "status"  # not a vendor key
+
 _LOGGER = logging.getLogger(__name__.rpartition(".")[0])
 
 
@@ -66,14 +76,17 @@ async def _create_tzinfo(
     except (KeyError, ModuleNotFoundError):
         pass
 
-    # DST support will be very limited, for example:
+    # the (offline) DST rules of the Windows TZ are used instead, but if they are not
+    # known, DST support will be very limited, for example:
     # - unable to adjust current utcoffset when DST starts & stops
     # - unable to determine if a given datetime was/will be during DST
 
     msg = f"Unable to find IANA TZ identifier for '{time_zone_id}'"
-    _LOGGER.warning(
-        msg + "; DST support will be very limited" if use_dst_switching else ""
-    )
+
+    if use_dst_switching and dst_rules_from_windows_tz(time_zone_id) is None:
+        _LOGGER.warning(f"{msg}; DST support will be very limited")
+    else:
+        _LOGGER.debug(f"{msg}; using its DST rules, if any")
 
     return EvoZoneInfo(
         time_zone_info=time_zone_info, use_dst_switching=use_dst_switching
@@ -107,8 +120,12 @@ class Location(EntityBase[EvoLocStatusT]):
 
     _TCC_TYPE = TccEntityType.LOC
 
-    SCH_CONFIG: vol.Schema = factory_location_installation_info(Case.PYTHONIC)
-    SCH_STATUS: vol.Schema = factory_loc_status(Case.PYTHONIC)
+    SCH_CONFIG: vol.Schema = compile_schema(
+        factory_location_installation_info(Case.PYTHONIC)
+    )
+    SCH_STATUS: vol.Schema = compile_schema(factory_loc_status(Case.PYTHONIC))
+
+    _status_response: EvoLocStatusResponseT | None = None  # incl. its descendants'
 
     def __init__(
         self,
@@ -128,6 +145,7 @@ class Location(EntityBase[EvoLocStatusT]):
         self.gateway_by_id: dict[str, Gateway] = {}
 
         self._config: EvoLocConfigT = config[SZ_LOCATION_INFO]  # ?exclude TZ/DST
+        self._last_changes: list[StatusChange] = []
 
         self._tzinfo = tzinfo or EvoZoneInfo(
             time_zone_info=config[SZ_LOCATION_INFO][SZ_TIME_ZONE],
@@ -257,15 +275,27 @@ class Location(EntityBase[EvoLocStatusT]):
             self._update_status(status)
         return status
 
-    def _update_status(self, status: EvoLocStatusResponseT) -> None:
-        """Update the LOC's status and cascade to its descendants."""
+    def _update_status(
+        self, status: EvoLocStatusResponseT, *, notify: bool = True
+    ) -> list[StatusChange]:
+        """Update the LOC's status and cascade to its descendants.
+
+        Returns the change-set of the LOC's descendants (and if it went offline/online).
+        If not `notify`, the listeners are not notified of it, and it is not retained
+        as the latest change-set.
+        """
+
+        self._status_response = status
+        changes: list[StatusChange] = []
+
+        was_offline = self.is_offline()
 
         # No ActiveFaults in location node of status
 
         # cascade the child status to descendants...
         for gwy_status in status[SZ_GATEWAYS]:
             if gwy := self.gateway_by_id.get(gwy_status[SZ_GATEWAY_ID]):
-                gwy._update_status(gwy_status)  # noqa: SLF001
+                changes += gwy._update_status(gwy_status, notify=notify)  # noqa: SLF001
 
             else:
                 self._logger.warning(
@@ -277,3 +307,63 @@ class Location(EntityBase[EvoLocStatusT]):
         self._status = {
             SZ_LOCATION_ID: status[SZ_LOCATION_ID],
         }
+
+        if (is_offline := self.is_offline()) != was_offline:
+            self._logger.info(
+                f"{self}: Its gateways are now {'offline' if is_offline else 'online'}"
+            )
+            changes.append(
+                StatusChange(self, ChangeType.OFFLINE, was_offline, is_offline)
+            )
+
+        if notify:
+            self._last_changes = changes
+            self._notify_listeners(changes)
+        return changes
+
+    def is_offline(self) -> bool:
+        """Return True if all the location's gateways have lost communication.
+
+        If so, the status of the location is stale, and pollers (e.g. the polling
+        scheduler, or the budget planner) will poll it only at their probe interval.
+        """
+
+        return bool(self.gateways) and all(g.is_offline() for g in self.gateways)
+
+    def last_changes(self) -> list[StatusChange]:
+        """Return the change-set of the latest status update of the location.
+
+        The change-set includes the changes to all of the location's descendants.
+        """
+        return self._last_changes
+
+    def export_state(self) -> dict[str, Any]:
+        """Return the (JSON serializable) latest status of the location.
+
+        The status includes that of its descendants (their other state is not
+        included, see their own export_state()).
+        """
+
+        if self._status_response is None:
+            return {}
+        return {SZ_STATUS: convert_dtms_to_iso_str(self._status_response)}
+
+    def import_state(self, state: Mapping[str, Any]) -> None:
+        """Restore the latest status of the location & its descendants, sans API calls.
+
+        The state (as returned by export_state()) is re-validated, and is replaced by
+        the next update(). The restored status is not a change, so the listeners are
+        not notified (and the next update() is compared with the restored status).
+        """
+
+        if (status := state.get(SZ_STATUS)) is None:
+            return
+
+        try:
+            status = self.SCH_STATUS(status)
+        except vol.Invalid as err:
+            raise exc.InvalidStatusError(f"{self}: Invalid state: {err}") from err
+
+        self._update_status(
+            convert_dtm_to_local_aware(status, self.tzinfo), notify=False
+        )
@@ -3,31 +3,79 @@
 from __future__ import annotations
 
 import logging
+import operator
+from datetime import UTC, datetime as dt
 from http import HTTPStatus
-from typing import TYPE_CHECKING, Final
+from typing import TYPE_CHECKING, Any, Final
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+import voluptuous as vol
 from aiozoneinfo import async_get_time_zone
 
+from _evohome.concurrency import MAX_CONCURRENCY, gather_with_limit
+from _evohome.streaming import BackpressurePolicy, poll_stream
+
 from . import exceptions as exc
-from .auth import AbstractTokenManager, Auth
-from .const import _ERR_NOT_AVAILABLE, SZ_USER_ID
+from .auth import SZ_ACCESS_TOKEN, SZ_ACCESS_TOKEN_EXPIRES, AbstractTokenManager, Auth
+from .const import _ERR_NOT_AVAILABLE, SZ_USER_ACCOUNT, SZ_USER_ID
 from .location import Location, create_location
 from .schemas.account import factory_user_account
+from .schemas.compiler import compile_schema
 from .schemas.config import factory_user_locations_installation_info
 from .schemas.helpers import Case
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Callable, Mapping
+
     import aiohttp
 
+    from _evohome.rate_limiter import AbstractRateLimiter
+    from _evohome.response_cache import ResponseCache
+    from _evohome.retry import RetryPolicy
+    from _evohome.shape_cache import ShapeCache
+
+    from .changes import StatusChange, StatusListener
     from .control_system import ControlSystem
-    from .typedefs import EvoLocConfigResponseT, EvoUsrAccountResponseT
+    from .gateway import Gateway
+    from .hotwater import HotWater
+    from .schedule_store import AbstractScheduleStore
+    from .typedefs import (
+        EvoConfigSnapshotT,
+        EvoLocConfigResponseT,
+        EvoLocStatusResponseT,
+        EvoStateSnapshotT,
+        EvoUsrAccountResponseT,
+    )
+    from .zone import Zone
+
+
+SCH_USR_ACCOUNT: Final = compile_schema(factory_user_account(Case.PYTHONIC))
+SCH_USR_LOCATIONS: Final = compile_schema(
+    factory_user_locations_installation_info(Case.PYTHONIC)
+)
+
+# the format of a config snapshot (bump if it, or the schemas above, change)
+CONFIG_SNAPSHOT_VERSION: Final = 1
+# the format of a state snapshot (bump if it, or any entity's state, changes)
+STATE_SNAPSHOT_VERSION: Final = 2
+
+SZ_CONFIG: Final = "config"
+SZ_ENTITIES: Final = "entities"
+SZ_FETCHED: Final = "fetched"
+SZ_USER_LOCATIONS: Final = "user_locations"
+SZ_VERSION: Final = "version"
+
+_URL_USER_ACCOUNT: Final = "userAccount"
 
+_LOGGER = logging.getLogger(__name__.rpartition(".")[0])  # "evohomeasync2"
 
-SCH_USR_ACCOUNT: Final = factory_user_account(Case.PYTHONIC)
-SCH_USR_LOCATIONS: Final = factory_user_locations_installation_info(Case.PYTHONIC)
 
-_LOGGER = logging.getLogger(__name__.rpartition(".")[0])  # "evohomeasync2"
+def _url_user_locations(user_id: str) -> str:
+    """Return the URL of the config of all the user's locations."""
+    return (
+        f"location/installationInfo?userId={user_id}"
+        "&includeTemperatureControlSystems=True"
+    )
 
 
 class EvohomeClient:
@@ -35,6 +83,7 @@ class EvohomeClient:
 
     _user_info: EvoUsrAccountResponseT | None = None
     _user_locs: list[EvoLocConfigResponseT] | None = None  # all locations of the user
+    _config_fetched: dt | None = None  # when the above were got from the vendor
 
     def __init__(
         self,
@@ -42,6 +91,11 @@ class EvohomeClient:
         /,
         *,
         websession: aiohttp.ClientSession | None = None,
+        rate_limiter: AbstractRateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        response_cache: ResponseCache | None = None,
+        shape_cache: ShapeCache | None = None,
+        schedule_store: AbstractScheduleStore | None = None,
         debug: bool = False,
     ) -> None:
         """Construct the v2 EvohomeClient object."""
@@ -52,11 +106,22 @@ class EvohomeClient:
             self._logger.debug("Debug mode explicitly enabled via kwarg.")
 
         self._token_manager = token_manager
-        self.auth = Auth(token_manager, websession or token_manager.websession)
+        self.auth = Auth(
+            token_manager,
+            websession or token_manager.websession,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            response_cache=response_cache,
+            shape_cache=shape_cache,
+        )
+
+        self.schedule_store = schedule_store
 
         self._locations: list[Location] | None = None  # to preserve the order
         self._location_by_id: dict[str, Location] | None = None
 
+        self._listeners: list[StatusListener] = []
+
         self._tzinfo: ZoneInfo | None = None
         self._tzinfo_initialized: bool = False
 
@@ -64,6 +129,13 @@ class EvohomeClient:
         """Return a string representation of this object."""
         return f"{self.__class__.__name__}(auth='{self.auth}')"
 
+    async def close(self) -> None:
+        """Stop any background activity of the client (e.g. token refresh).
+
+        The websession is not closed, as the client does not own it.
+        """
+        await self._token_manager.stop_background_refresh()
+
     @property
     def logger(self) -> logging.Logger:
         return self._logger
@@ -84,6 +156,7 @@ class EvohomeClient:
         /,
         *,
         dont_update_status: bool = False,
+        max_concurrency: int | None = MAX_CONCURRENCY,
         _reset_config: bool = False,  # for use by test suite
     ) -> list[EvoLocConfigResponseT]:
         """Retrieve the latest state of the user's locations.
@@ -96,6 +169,10 @@ class EvohomeClient:
 
         If `disable_status_update` is true, does not update the status of each location
         hierarchy (and so, does not make those additional API calls).
+
+        The locations are updated concurrently (at most `max_concurrency` at a time),
+        and a failure of one does not prevent the others from being updated. If one
+        location fails, its exception is raised; if several fail, an ExceptionGroup.
         """
 
         if _reset_config:
@@ -109,14 +186,127 @@ class EvohomeClient:
             await self._get_config(dont_update_status=dont_update_status)
 
         if not dont_update_status:  # don't retrieve/update status of location hierarchy
-            #
-            for loc in self.locations:
-                await loc.update()
-                #
+            await gather_with_limit(
+                (loc.update() for loc in self.locations),
+                limit=max_concurrency,
+                message="Failed to update some locations",
+            )
 
         assert self._user_locs is not None  # mypy
         return self._user_locs
 
+    def stream(
+        self,
+        interval: float,
+        /,
+        *,
+        buffer_size: int = 1,
+        policy: BackpressurePolicy = BackpressurePolicy.COALESCE,
+        max_concurrency: int | None = MAX_CONCURRENCY,
+    ) -> AsyncGenerator[list[EvoLocStatusResponseT]]:
+        """Poll the status of all the user's locations every `interval` seconds.
+
+        Yields a snapshot per poll: the latest status of each location (in order), as
+        returned by Location.update(). The polls are made at a fixed rate (a slow poll
+        delays, but does not overlap, the next), and up to `buffer_size` snapshots are
+        buffered for the consumer; when the buffer is full, then (as per `policy`) the
+        oldest snapshot is dropped, the snapshot is coalesced (i.e. replaced by the
+        newer one), or the polls are deferred (i.e. blocked) until there is room.
+
+        Failed polls are logged and retried at the next poll (if the access token was
+        rejected, it is re-authenticated); only bad credentials (or an unexpected
+        error) are raised to the consumer.
+
+        Polling stops when the generator is closed, so use contextlib.aclosing():
+
+            async with aclosing(evo.stream(300)) as stream:
+                async for statuses in stream:
+                    ...
+        """
+
+        return poll_stream(
+            lambda: self._poll_status(max_concurrency),
+            interval=interval,
+            logger=self._logger,
+            buffer_size=buffer_size,
+            policy=policy,
+        )
+
+    def stream_changes(
+        self,
+        interval: float,
+        /,
+        *,
+        buffer_size: int = 1,
+        policy: BackpressurePolicy = BackpressurePolicy.COALESCE,
+        max_concurrency: int | None = MAX_CONCURRENCY,
+    ) -> AsyncGenerator[list[StatusChange]]:
+        """Poll the status of all the user's locations every `interval` seconds.
+
+        As stream(), but yields the change-set of each poll that has changes (polls
+        without changes are not yielded), and change-sets are coalesced by
+        concatenation, so no changes are lost when the buffer is full.
+        """
+
+        async def poll() -> list[StatusChange] | None:
+            await self._poll_status(max_concurrency)
+            return self.last_changes() or None
+
+        return poll_stream(
+            poll,
+            interval=interval,
+            logger=self._logger,
+            buffer_size=buffer_size,
+            policy=policy,
+            coalesce=operator.add,
+        )
+
+    async def _poll_status(
+        self, max_concurrency: int | None
+    ) -> list[EvoLocStatusResponseT]:
+        """Update (and return) the status of all the user's locations, for a stream.
+
+        If the access token is rejected, it is cleared, so that the next poll will
+        re-authenticate.
+        """
+
+        try:
+            await self._get_config(dont_update_status=True)
+            return await gather_with_limit(
+                (loc.update() for loc in self.locations),
+                limit=max_concurrency,
+                message="Failed to update some locations",
+            )
+
+        except (exc.ApiCallFailedError, BaseExceptionGroup) as err:
+            self.clear_rejected_access_token(err)
+            raise
+
+    def clear_rejected_access_token(self, err: BaseException) -> bool:
+        """Clear the access token if a request was rejected with a 401.
+
+        The server may have revoked the token before it expires, so the next request
+        will re-authenticate (rather than fail until the token expires). If `err` is
+        an ExceptionGroup (e.g. several locations failed), any 401 will do.
+
+        Returns True if the access token was cleared.
+        """
+
+        def is_rejected(err: BaseException) -> bool:
+            return (
+                isinstance(err, exc.ApiCallFailedError)
+                and err.status == HTTPStatus.UNAUTHORIZED  # 401
+            )
+
+        if isinstance(err, BaseExceptionGroup):
+            if err.subgroup(is_rejected) is None:
+                return False
+        elif not is_rejected(err):
+            return False
+
+        self._token_manager.clear_access_token()
+        return True
+
     async def _async_init_tzinfo(self) -> None:
         """Initialize timezone info without blocking the event loop."""
 
@@ -143,7 +333,7 @@ class EvohomeClient:
             await self._async_init_tzinfo()
 
         if self._user_info is None:  # will handle access_token rejection
-            url = "userAccount"
+            url = _URL_USER_ACCOUNT
             try:
                 self._user_info = await self.auth.get(url, schema=SCH_USR_ACCOUNT)
 
@@ -172,9 +362,9 @@ class EvohomeClient:
                 ) from err
 
             self._user_locs = await self.auth.get(
-                f"location/installationInfo?userId={user_id}&includeTemperatureControlSystems=True",
-                schema=SCH_USR_LOCATIONS,
+                _url_user_locations(user_id), schema=SCH_USR_LOCATIONS
             )
+            self._config_fetched = dt.now(tz=UTC)
 
             assert self._user_locs is not None  # mypy
 
@@ -184,6 +374,7 @@ class EvohomeClient:
 
             for loc_config in self._user_locs:
                 loc = await create_location(self, loc_config)
+                loc.add_listener(self._notify_listeners)
                 self._locations.append(loc)
                 self._location_by_id[loc.id] = loc
 
@@ -196,6 +387,202 @@ class EvohomeClient:
 
         return self._user_locs
 
+    def add_listener(self, listener: StatusListener) -> Callable[[], None]:
+        """Add a listener for the changes to the status of all the user's locations.
+
+        The listener is called with the change-set of each location's status update
+        that has changes, and is retained if the locations are re-instantiated (e.g. by
+        refresh_config()). Returns a function to remove it.
+        """
+
+        self._listeners.append(listener)
+
+        def remove_listener() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return remove_listener
+
+    def _notify_listeners(self, changes: list[StatusChange]) -> None:
+        """Pass a location's change-set to the client's listeners."""
+
+        for listener in tuple(self._listeners):
+            try:
+                listener(changes)
+            except Exception:
+                self._logger.exception(f"{self}: Error in a status listener")
+
+    def last_changes(self) -> list[StatusChange]:
+        """Return the change-sets of the latest status update of each location."""
+
+        if self._locations is None:
+            return []
+        return [c for loc in self._locations for c in loc.last_changes()]
+
+    def export_config(self) -> EvoConfigSnapshotT:
+        """Return a snapshot of the (validated) config of the user and their locations.
+
+        The snapshot is JSON serializable, so it can be saved to a file, and later
+        imported via import_config(), e.g. when the client is next started.
+        """
+
+        if self._user_locs is None or self._config_fetched is None:
+            raise exc.InvalidConfigError(
+                _ERR_NOT_AVAILABLE.format("Installation information")
+            )
+
+        return {
+            SZ_VERSION: CONFIG_SNAPSHOT_VERSION,
+            SZ_FETCHED: self._config_fetched.isoformat(),
+            SZ_USER_ACCOUNT: self.user_account,
+            SZ_USER_LOCATIONS: self._user_locs,
+        }
+
+    async def import_config(self, snapshot: Mapping[str, Any], /) -> None:
+        """Instantiate the user's locations from a config snapshot, without API calls.
+
+        The snapshot must be from export_config() (it is re-validated). The config is
+        used as is, and may be refreshed later via refresh_config() (e.g. as a
+        background task). Raises InvalidConfigError if the snapshot is not valid.
+        """
+
+        if snapshot.get(SZ_VERSION) != CONFIG_SNAPSHOT_VERSION:
+            raise exc.InvalidConfigError(
+                f"Config snapshot is version {snapshot.get(SZ_VERSION)}, "
+                f"expected version {CONFIG_SNAPSHOT_VERSION}"
+            )
+
+        try:
+            user_info = SCH_USR_ACCOUNT(snapshot[SZ_USER_ACCOUNT])
+            user_locs = SCH_USR_LOCATIONS(snapshot[SZ_USER_LOCATIONS])
+            fetched = dt.fromisoformat(snapshot[SZ_FETCHED])
+        except (KeyError, TypeError, ValueError, vol.Invalid) as err:
+            raise exc.InvalidConfigError(f"Config snapshot is invalid: {err}") from err
+
+        self._user_info = user_info
+        self._user_locs = user_locs
+        self._config_fetched = fetched
+
+        self._locations = None
+        self._location_by_id = None
+
+        await self._get_config(dont_update_status=True)
+
+    async def refresh_config(self) -> bool:
+        """Retrieve the config of the user and their locations, and return if changed.
+
+        If the config has changed (e.g. since it was imported), the user's locations
+        are re-instantiated (so any references to the old entities are then stale).
+        The config is always retrieved from the vendor (never from a response cache).
+        """
+
+        user_info, user_locs = self._user_info, self._user_locs
+
+        self.auth.discard_cached(_URL_USER_ACCOUNT)
+        if user_info is not None:  # the user_id of an account doesn't change
+            self.auth.discard_cached(_url_user_locations(user_info[SZ_USER_ID]))
+
+        self._user_info = None
+        self._user_locs = None
+
+        try:
+            await self._get_config(dont_update_status=True)
+        except exc.EvohomeError:
+            self._user_info, self._user_locs = user_info, user_locs
+            raise
+
+        if self._user_info == user_info and self._user_locs == user_locs:
+            return False
+
+        self._locations = None
+        self._location_by_id = None
+
+        await self._get_config(dont_update_status=True)
+        return True
+
+    def _entities(self) -> list[Location | Gateway | ControlSystem | HotWater | Zone]:
+        """Return all the entities of the user's locations, parents before children."""
+
+        entities: list[Location | Gateway | ControlSystem | HotWater | Zone] = []
+
+        for loc in self.locations:
+            entities.append(loc)
+            for gwy in loc.gateways:
+                entities.append(gwy)
+                for tcs in gwy.systems:
+                    entities.append(tcs)
+                    entities.extend(tcs.zones)
+                    if tcs.hotwater:
+                        entities.append(tcs.hotwater)
+
+        return entities
+
+    def export_state(self, /, *, include_tokens: bool = False) -> EvoStateSnapshotT:
+        """Return a snapshot of the config and (latest) state of the client.
+
+        The state includes the latest status of every entity (incl. their active
+        faults, and when they were last logged), and their schedules. The snapshot is
+        JSON serializable, so it can be saved to a file, and later restored via
+        import_state(), e.g. after a restart.
+
+        Only the expiry of the access token is included, unless `include_tokens` is
+        true. The tokens are credentials, so such a snapshot must be kept secret.
+        """
+
+        valid = self._token_manager.is_token_valid()
+
+        entities: dict[str, dict[str, dict[str, Any]]] = {}
+        for e in self._entities():  # keyed by type, as ids are unique only by type
+            entities.setdefault(e._TCC_TYPE, {})[e.id] = e.export_state()  # noqa: SLF001
+
+        return {
+            SZ_VERSION: STATE_SNAPSHOT_VERSION,
+            SZ_CONFIG: self.export_config(),
+            SZ_ACCESS_TOKEN_EXPIRES: (
+                self._token_manager.access_token_expires.isoformat() if valid else None
+            ),
+            SZ_ACCESS_TOKEN: (
+                self._token_manager.export_access_token()
+                if valid and include_tokens
+                else None
+            ),
+            SZ_ENTITIES: entities,
+        }
+
+    async def import_state(self, snapshot: Mapping[str, Any], /) -> None:
+        """Restore the config and (latest) state of the client from a snapshot.
+
+        No API calls are made, so the entities' (last known) status is available
+        immediately, and is refreshed by the next update(). The auth tokens (if the
+        snapshot includes them) are restored only if they are newer than those of the
+        token manager. Raises InvalidConfigError/InvalidStatusError if the snapshot is
+        not valid.
+        """
+
+        if snapshot.get(SZ_VERSION) != STATE_SNAPSHOT_VERSION:
+            raise exc.InvalidStatusError(
+                f"State snapshot is version {snapshot.get(SZ_VERSION)}, "
+                f"expected version {STATE_SNAPSHOT_VERSION}"
+            )
+
+        await self.import_config(snapshot.get(SZ_CONFIG, {}))
+
+        if tokens := snapshot.get(SZ_ACCESS_TOKEN):
+            try:
+                self._token_manager.import_access_token(tokens)
+            except (KeyError, TypeError, ValueError) as err:
+                raise exc.InvalidStatusError(
+                    f"State snapshot has invalid tokens: {err}"
+                ) from err
+
+        states: Mapping[str, Mapping[str, Any]] = snapshot.get(SZ_ENTITIES, {})
+
+        # children before parents, so a location's status (which cascades) is last
+        for entity in reversed(self._entities()):
+            by_id = states.get(entity._TCC_TYPE, {})  # noqa: SLF001
+            if (state := by_id.get(entity.id)) is not None:
+                entity.import_state(state)
+
     @property
     def user_account(self) -> EvoUsrAccountResponseT:
         """Return the (config) information of the user account."""
@@ -0,0 +1,291 @@
+"""Provides the planning of polls across many locations, within a global budget.
+
+For example, a fleet of accounts (each a client), each with several locations, that
+must share a fixed number of API requests per hour. Each poll of a location costs one
+request (its status); the config of each client is assumed to be already known.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+from typing import TYPE_CHECKING, Final, NamedTuple
+
+from _evohome.streaming import is_transient_error
+
+from . import exceptions as exc
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from . import EvohomeClient
+    from .location import Location
+
+
+_GOLDEN_RATIO: Final = (math.sqrt(5) - 1) / 2  # spreads the phases of the polls
+_SECONDS_PER_HOUR: Final = 3600
+
+_LOGGER = logging.getLogger(__name__.rpartition(".")[0])
+
+
+class PollAllocation(NamedTuple):
+    """The share of the budget allocated to a location."""
+
+    location: Location
+    weight: float  # its priority, adjusted for its volatility & fault state
+    interval: float  # the seconds between its polls
+    phase: float  # the seconds by which its polls are offset (within the interval)
+    offline: bool  # if so, it is only probed (its weight is moot)
+
+
+def _has_active_faults(location: Location) -> bool:
+    """Return True if any entity of the location has an active fault."""
+
+    for gwy in location.gateways:
+        if gwy.active_faults:
+            return True
+
+        for tcs in gwy.systems:
+            if tcs.active_faults or any(z.active_faults for z in tcs.zones):
+                return True
+            if tcs.hotwater and tcs.hotwater.active_faults:
+                return True
+
+    return False
+
+
+class _LocationStats:
+    """The priority of a location, and the (recent) history of its polls."""
+
+    def __init__(self, priority: float, slot: int) -> None:
+        self.priority = priority
+        self.slot: Final = slot  # the order in which it was added (for its phase)
+
+        self.volatility: float = 0.0  # the moving average of changes per poll
+        self.has_faults: bool = False
+
+
+class BudgetPlanner:
+    """Allocate a global budget of polls (requests per hour) across many locations.
+
+    Each location is allocated a share of the budget in proportion to its weight: its
+    priority, multiplied by (1 + its volatility, i.e. the moving average of the number
+    of changes per poll), and by `fault_factor` if it has any active faults. Its poll
+    interval is bounded by `min_interval` and `max_interval` (seconds); any budget that
+    a location cannot use is reallocated to the others.
+
+    A location whose gateways are offline (its status is stale) is polled only every
+    `probe_interval` seconds, and its share of the budget is reallocated to the others
+    until its gateways are back online.
+
+    The polls of each location are offset by a phase (a fraction of its interval), so
+    that the polls of the fleet are spread out, rather than made all at once.
+    """
+
+    def __init__(
+        self,
+        requests_per_hour: float,
+        /,
+        *,
+        min_interval: float = 60,
+        max_interval: float = 3600,
+        fault_factor: float = 2.0,
+        volatility_smoothing: float = 0.2,
+        probe_interval: float = 3600,
+    ) -> None:
+        """Initialise the planner (the intervals are in seconds)."""
+
+        if requests_per_hour <= 0:
+            raise ValueError(f"Invalid requests_per_hour: {requests_per_hour}")
+        if not 0 < min_interval <= max_interval:
+            raise ValueError(f"Invalid min/max_interval: {min_interval}/{max_interval}")
+        if fault_factor <= 0:
+            raise ValueError(f"Invalid fault_factor: {fault_factor}")
+        if not 0 < volatility_smoothing <= 1:
+            raise ValueError(f"Invalid volatility_smoothing: {volatility_smoothing}")
+        if probe_interval <= 0:
+            raise ValueError(f"Invalid probe_interval: {probe_interval}")
+
+        self._budget: Final = requests_per_hour / _SECONDS_PER_HOUR  # per second
+        self._min_interval: Final = min_interval
+        self._max_interval: Final = max_interval
+        self._fault_factor: Final = fault_factor
+        self._smoothing: Final = volatility_smoothing
+        self._probe_interval: Final = probe_interval
+
+        self._stats: Final[dict[Location, _LocationStats]] = {}
+        self._allocations: dict[Location, PollAllocation] | None = None
+        self._next_slot: int = 0  # so that each location has a distinct phase
+
+    def __str__(self) -> str:
+        """Return a string representation of the object."""
+        return (
+            f"{self.__class__.__name__}(requests_per_hour="
+            f"{self._budget * _SECONDS_PER_HOUR}, locations={len(self._stats)})"
+        )
+
+    def add_location(self, location: Location, /, *, priority: float = 1.0) -> None:
+        """Add a location to the plan (or change its priority)."""
+
+        if priority <= 0:
+            raise ValueError(f"Invalid priority: {priority}")
+
+        self._allocations = None
+
+        if (stats := self._stats.get(location)) is not None:
+            stats.priority = priority
+            return
+
+        self._stats[location] = _LocationStats(priority, self._next_slot)
+        self._next_slot += 1
+
+        if self._budget * self._max_interval < len(self._stats):
+            _LOGGER.warning(
+                f"{self}: The budget is exceeded, as each location is polled at least "
+                f"every {self._max_interval} seconds"
+            )
+
+    def add_client(self, client: EvohomeClient, /, *, priority: float = 1.0) -> None:
+        """Add all the locations of a client to the plan (its config must be known)."""
+
+        for loc in client.locations:
+            self.add_location(loc, priority=priority)
+
+    def remove_location(self, location: Location, /) -> None:
+        """Remove a location from the plan."""
+
+        del self._stats[location]
+        self._allocations = None
+
+    def record_poll(self, location: Location, /) -> None:
+        """Update the volatility & fault state of a location, after it was polled."""
+
+        if (stats := self._stats.get(location)) is None:  # it has been removed
+            return
+
+        stats.volatility += self._smoothing * (
+            len(location.last_changes()) - stats.volatility
+        )
+        stats.has_faults = _has_active_faults(location)
+
+        self._allocations = None
+
+    def _weight(self, stats: _LocationStats) -> float:
+        """Return the weight of a location (its share of the budget is pro rata)."""
+
+        weight = stats.priority * (1 + stats.volatility)
+        return weight * self._fault_factor if stats.has_faults else weight
+
+    def _rates(
+        self, weights: dict[Location, float], budget: float
+    ) -> dict[Location, float]:
+        """Return the polls per second of each location, within the budget.
+
+        Each location is guaranteed its minimum rate, then the rest of the budget is
+        shared pro rata, except that no location exceeds its maximum rate (any excess
+        is shared among the others).
+        """
+
+        min_rate = 1 / self._max_interval
+        max_rate = 1 / self._min_interval
+
+        rates = dict.fromkeys(weights, min_rate)
+        remaining = budget - min_rate * len(weights)
+
+        uncapped = dict(weights)
+        while remaining > 0 and uncapped:
+            total = sum(uncapped.values())
+            shares = {loc: remaining * w / total for loc, w in uncapped.items()}
+
+            capped = [loc for loc, s in shares.items() if rates[loc] + s >= max_rate]
+            if not capped:
+                for loc, share in shares.items():
+                    rates[loc] += share
+                break
+
+            for loc in capped:
+                remaining -= max_rate - rates[loc]
+                rates[loc] = max_rate
+                del uncapped[loc]
+
+        return rates
+
+    def allocations(self) -> list[PollAllocation]:
+        """Return the current allocation of the budget to each location (in order)."""
+
+        if self._allocations is None:
+            weights = {loc: self._weight(s) for loc, s in self._stats.items()}
+            offline = {loc for loc in self._stats if loc.is_offline()}
+
+            # the offline locations are only probed, so the others share the rest
+            rates = self._rates(
+                {loc: w for loc, w in weights.items() if loc not in offline},
+                self._budget - len(offline) / self._probe_interval,
+            )
+            rates |= dict.fromkeys(offline, 1 / self._probe_interval)
+
+            self._allocations = {}
+            for loc, stats in self._stats.items():
+                interval = 1 / rates[loc]
+                self._allocations[loc] = PollAllocation(
+                    loc,
+                    weights[loc],
+                    interval,
+                    interval * ((stats.slot * _GOLDEN_RATIO) % 1),
+                    loc in offline,
+                )
+
+        return list(self._allocations.values())
+
+    def allocation(self, location: Location, /) -> PollAllocation:
+        """Return the current allocation of the budget to a location."""
+
+        self.allocations()
+
+        assert self._allocations is not None  # mypy
+        return self._allocations[location]
+
+    async def run(self, locations: Iterable[Location] | None = None) -> None:
+        """Poll the status of the planned locations, until cancelled.
+
+        The locations are those of the plan (or a subset of them). A poll that fails
+        transiently is logged and retried at the location's next poll; any other
+        failure stops all polling and is raised (as an ExceptionGroup). If a poll is
+        rejected with a 401, the access token is cleared, so the next poll will
+        re-authenticate.
+        """
+
+        async with asyncio.TaskGroup() as tg:
+            for loc in list(self._stats) if locations is None else locations:
+                tg.create_task(self._poll_location(loc))
+
+    async def _poll_location(self, location: Location) -> None:
+        """Poll the status of a location as per its allocation, until cancelled."""
+
+        loop = asyncio.get_running_loop()
+        next_poll = loop.time() + self.allocation(location).phase
+
+        while True:
+            await asyncio.sleep(max(next_poll - loop.time(), 0))
+
+            if location not in self._stats:  # it has been removed from the plan
+                return
+
+            interval = self.allocation(location).interval
+
+            try:
+                await location.update()
+
+            except exc.EvohomeError as err:
+                location.client.clear_rejected_access_token(err)
+                if not is_transient_error(err):
+                    raise
+                location.client.logger.warning(
+                    f"{location}: Poll failed (will retry at next poll): {err}"
+                )
+
+            else:
+                self.record_poll(location)
+
+            next_poll = max(next_poll + interval, loop.time())
@@ -0,0 +1,173 @@
+"""Provides the adaptive (schedule-aware) polling of the status of locations.
+
+The status of a location changes mostly at predictable times: at the switchpoints of
+its zones/DHW, when their overrides expire, and when its system mode expires. All of
+these are known locally (the schedules must already have been got, e.g. via a schedule
+store), so each location is polled densely around them and sparsely otherwise.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from datetime import UTC, datetime as dt, timedelta as td
+from typing import TYPE_CHECKING, Final
+
+from _evohome.streaming import is_transient_error
+
+from . import exceptions as exc
+from .const import ZoneMode
+from .control_system import ControlSystem
+
+if TYPE_CHECKING:
+    from . import EvohomeClient
+    from .hotwater import HotWater
+    from .location import Location
+    from .zone import Zone
+
+
+def _entity_events(
+    entity: ControlSystem | HotWater | Zone, start: dt, end: dt
+) -> list[dt]:
+    """Return the datetimes in [start, end) when an entity's status may change.
+
+    That is, when its mode expires, and (unless it is permanently overridden) its
+    switchpoints. An entity without a status, or without a schedule, has no (known)
+    switchpoints.
+    """
+
+    try:
+        until = entity.until
+    except exc.InvalidStatusError:  # the location has not been updated
+        return []
+
+    events = [until] if until is not None and start <= until < end else []
+
+    if isinstance(entity, ControlSystem) or entity.mode == ZoneMode.PERMANENT_OVERRIDE:
+        return events
+
+    with contextlib.suppress(exc.InvalidScheduleError):
+        events.extend(dtm for dtm, _ in entity.switchpoints_between(start, end))
+
+    return events
+
+
+def predicted_events(location: Location, start: dt, end: dt) -> list[dt]:
+    """Return the (sorted) datetimes in [start, end) when the location may change.
+
+    These are the expiries of the system modes and of the zone/DHW overrides, and the
+    switchpoints of the zones/DHW (of those that have a schedule).
+    """
+
+    events: list[dt] = []
+
+    for gwy in location.gateways:
+        for tcs in gwy.systems:
+            events += _entity_events(tcs, start, end)
+
+            for zone in tcs.zones:
+                events += _entity_events(zone, start, end)
+            if tcs.hotwater:
+                events += _entity_events(tcs.hotwater, start, end)
+
+    return sorted(events)
+
+
+class AdaptivePollingScheduler:
+    """Poll the status of each location of a client, as per its predicted events.
+
+    A location is polled every `min_interval` seconds while it is within
+    `event_window` seconds of a predicted event, and otherwise at most every
+    `max_interval` seconds (but always at the start of the window of its next event).
+
+    A location whose gateways are offline (its status is stale) is polled only every
+    `probe_interval` seconds, until they are back online.
+    """
+
+    def __init__(
+        self,
+        client: EvohomeClient,
+        /,
+        *,
+        min_interval: float = 60,
+        max_interval: float = 900,
+        event_window: float = 120,
+        probe_interval: float = 3600,
+    ) -> None:
+        """Initialise the scheduler (the intervals and window are in seconds)."""
+
+        if not 0 < min_interval <= max_interval:
+            raise ValueError(f"Invalid min/max_interval: {min_interval}/{max_interval}")
+        if event_window < 0:
+            raise ValueError(f"Invalid event_window: {event_window}")
+        if probe_interval <= 0:
+            raise ValueError(f"Invalid probe_interval: {probe_interval}")
+
+        self._client: Final = client
+
+        self._min_interval: Final = td(seconds=min_interval)
+        self._max_interval: Final = td(seconds=max_interval)
+        self._event_window: Final = td(seconds=event_window)
+        self._probe_interval: Final = td(seconds=probe_interval)
+
+    def __str__(self) -> str:
+        """Return a string representation of the object."""
+        return (
+            f"{self.__class__.__name__}(min_interval={self._min_interval}, "
+            f"max_interval={self._max_interval}, event_window={self._event_window})"
+        )
+
+    def next_poll(self, location: Location, /, now: dt | None = None) -> dt:
+        """Return when the location should next be polled (given it was polled now)."""
+
+        now = now or dt.now(tz=UTC)
+        window = self._event_window
+
+        if location.is_offline():  # its status is stale, so only probe it
+            return now + self._probe_interval
+
+        events = predicted_events(
+            location, now - window, now + self._max_interval + window
+        )
+
+        for event in events:
+            if event - window <= now:  # the location is within the window of an event
+                return now + self._min_interval
+            if event - window < now + self._max_interval:  # the next window starts
+                return max(event - window, now + self._min_interval)
+
+        return now + self._max_interval
+
+    async def run(self) -> None:
+        """Poll the status of each of the client's locations, until cancelled.
+
+        Each location is polled independently of the others. A poll that fails
+        transiently is logged and retried at the location's next poll; any other
+        failure stops all polling and is raised (as an ExceptionGroup). If a poll is
+        rejected with a 401, the access token is cleared, so the next poll will
+        re-authenticate.
+        """
+
+        await self._client.update(dont_update_status=True)  # ensure the locations
+
+        async with asyncio.TaskGroup() as tg:
+            for loc in self._client.locations:
+                tg.create_task(self._poll_location(loc))
+
+    async def _poll_location(self, location: Location) -> None:
+        """Poll the status of a location, until cancelled."""
+
+        while True:
+            try:
+                await location.update()
+
+            except exc.EvohomeError as err:
+                self._client.clear_rejected_access_token(err)
+                if not is_transient_error(err):
+                    raise
+                self._client.logger.warning(
+                    f"{location}: Poll failed (will retry at next poll): {err}"
+                )
+
+            now = dt.now(tz=UTC)
+            await asyncio.sleep((self.next_poll(location, now) - now).total_seconds())
@@ -0,0 +1,167 @@
+"""Provides a persistent store of the schedules of TCC zones (heating and DHW)."""
+
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime as dt, timedelta as td
+from typing import TYPE_CHECKING, Any, Final, TypedDict
+
+from .const import SZ_DAILY_SCHEDULES
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Mapping
+
+
+class EvoScheduleEntryT(TypedDict):
+    """Dict for storing/restoring a schedule to/from a store."""
+
+    daily_schedules: list[Any]
+    fetched: str  # dt.isoformat(), when the schedule was got from the vendor
+
+
+SZ_FETCHED: Final = "fetched"
+
+# how long a stored schedule is considered fresh, if not specified
+_DEFAULT_TTL: Final = td(hours=1)
+
+
+class AbstractScheduleStore(ABC):
+    """An ABC for persisting the schedules of zones/DHW (keyed by zone_id/dhw_id).
+
+    Schedules rarely change, so a zone/DHW's stored schedule is available as soon as it
+    is instantiated (e.g. via this_switchpoint), without a GET; so, load the schedules
+    before the client's first update() (or import_config()). Its get_schedule() will
+    use the stored schedule until it is older than the TTL, and then GET (and save) a
+    new schedule. Setting a schedule removes it from the store.
+
+    Saves never overlap, are skipped if nothing has changed since the last save, and
+    can be deferred until the end of a batch (e.g. a backup of all the schedules).
+    """
+
+    def __init__(self, *, ttl: td = _DEFAULT_TTL) -> None:
+        """Initialise the store (it is empty until the schedules are loaded)."""
+
+        if ttl < td(0):
+            raise ValueError(f"Invalid ttl: {ttl}")
+
+        self._ttl: Final = ttl
+        self._entries: Final[dict[str, EvoScheduleEntryT]] = {}
+
+        self._lock: Final = asyncio.Lock()  # so that saves don't overlap
+        self._changed = False  # since the last save
+        self._deferrals = 0  # the number of batches in progress
+
+    def __len__(self) -> int:
+        """Return the number of schedules in the store (some may be stale)."""
+        return len(self._entries)
+
+    def __str__(self) -> str:
+        """Return a string representation of the object."""
+        return f"{self.__class__.__name__}(size={len(self)}, ttl={self._ttl})"
+
+    @property
+    def ttl(self) -> td:
+        """Return how long a stored schedule is considered fresh."""
+        return self._ttl
+
+    def get(self, id_: str) -> list[Any] | None:
+        """Return the stored schedule of a zone/DHW (however old), or None."""
+
+        entry = self._entries.get(id_)
+        return None if entry is None else entry[SZ_DAILY_SCHEDULES]
+
+    def fetched(self, id_: str) -> dt | None:
+        """Return when the stored schedule of a zone/DHW was fetched, or None."""
+
+        entry = self._entries.get(id_)
+        return None if entry is None else dt.fromisoformat(entry[SZ_FETCHED])
+
+    def is_fresh(self, id_: str) -> bool:
+        """Return True if the stored schedule of a zone/DHW is younger than the TTL."""
+
+        fetched = self.fetched(id_)
+        return fetched is not None and fetched + self._ttl > dt.now(tz=UTC)
+
+    def set(self, id_: str, daily_schedules: list[Any]) -> None:
+        """Store the schedule of a zone/DHW, as fetched just now."""
+
+        self._entries[id_] = {
+            SZ_DAILY_SCHEDULES: daily_schedules,
+            SZ_FETCHED: dt.now(tz=UTC).isoformat(),
+        }
+        self._changed = True
+
+    def discard(self, id_: str) -> None:
+        """Remove the stored schedule of a zone/DHW (if there is one)."""
+
+        if self._entries.pop(id_, None) is not None:
+            self._changed = True
+
+    async def save(self) -> None:
+        """Save the schedules, if they have changed since they were last saved.
+
+        Does nothing while saves are deferred (the batch will save once it is done).
+        """
+
+        if self._deferrals:
+            return
+
+        async with self._lock:
+            if not self._changed:  # e.g. another caller has already saved them
+                return
+
+            self._changed = False
+            try:
+                await self.save_schedules()
+            except BaseException:
+                self._changed = True
+                raise
+
+    @asynccontextmanager
+    async def deferred_saves(self) -> AsyncGenerator[None]:
+        """Defer any saves until the end of a batch, then save (once) if required."""
+
+        self._deferrals += 1
+        try:
+            yield
+        finally:
+            self._deferrals -= 1
+            await self.save()
+
+    @abstractmethod
+    async def load_schedules(self) -> None:
+        """Load the (serialized) schedules from the store.
+
+        Should call _import_schedules() with whatever was saved by save_schedules().
+        """
+
+    @abstractmethod
+    async def save_schedules(self) -> None:
+        """Save the (serialized) schedules to the store.
+
+        Is called via save() after a schedule is added/removed (once per batch, if
+        deferred). Should save the result of _export_schedules(), which is JSON
+        serializable.
+        """
+
+    def _import_schedules(self, entries: Mapping[str, EvoScheduleEntryT]) -> None:
+        """Extract the schedules from a (serialized) dictionary.
+
+        A schedule is imported only if it is newer than any schedule already stored.
+        """
+
+        for id_, entry in entries.items():
+            if (fetched := self.fetched(id_)) is None or fetched < dt.fromisoformat(
+                entry[SZ_FETCHED]
+            ):
+                self._entries[id_] = {
+                    SZ_DAILY_SCHEDULES: entry[SZ_DAILY_SCHEDULES],
+                    SZ_FETCHED: entry[SZ_FETCHED],
+                }
+
+    def _export_schedules(self) -> dict[str, EvoScheduleEntryT]:
+        """Convert the schedules to a (serialized) dictionary."""
+
+        return {id_: entry.copy() for id_, entry in self._entries.items()}
@@ -12,6 +12,7 @@ camelCase, and is used for URL construction.
 
 The voluptuous schemas (TCC_*) are derived from those TypedDicts and serve a different
 purpose: runtime validation and coercion of the data returned by the API endpoints.
+Those used per request are compiled into faster validators (see compiler.py).
 
 Installation (of a user Account)
 └── 0-many Locations
@@ -17,6 +17,7 @@ import voluptuous as vol
 
 from _evohome.helpers import camel_to_snake, noop, redact
 
+from .compiler import compile_schema
 from .const import (
     S2_CITY,
     S2_CODE,
@@ -159,4 +160,4 @@ TCC_STATUS_RESPONSE: Final = factory_status_response()
 TCC_POST_OAUTH_TOKEN: Final = factory_post_oauth_token()
 
 # GET /userAccount
-TCC_GET_USR_ACCOUNT: Final = factory_user_account()
+TCC_GET_USR_ACCOUNT: Final = compile_schema(factory_user_account())
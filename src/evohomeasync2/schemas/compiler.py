@@ -0,0 +1,465 @@
+"""Compile the voluptuous schemas of the vendor's TCC v2 API into fast validators.
+
+Voluptuous interprets a schema every time it is called (tracking paths, collecting
+errors, etc.), which is the largest cost of processing a response. A compiled schema
+instead uses closures that are specialised for each node of the schema (e.g. enums
+are checked against precomputed tables), and which do only what is needed for valid
+data.
+
+Data that fails the compiled validator is re-validated by voluptuous, so that the
+errors raised (and their messages) are exactly as before. Any part of a schema that
+cannot be compiled is left to voluptuous.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import inspect
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any, Final
+
+import voluptuous as vol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    type _Validator = Callable[[Any], Any]
+    type _Coercer = Callable[[Any, list[Any]], Any]
+
+
+_MAX_MEMO_SIZE: Final = 1024  # the most valid strings to memoise, per vol.Datetime
+
+_SCALAR_TYPES: Final = (bool, int, float, str, type(None))
+
+# these check a value without changing it, and are skipped by a coercer
+_UNCOERCED_TYPES: Final = (vol.Length, vol.Match, vol.Range)
+
+
+class _MismatchError(Exception):
+    """The data failed a compiled validator (voluptuous will say why)."""
+
+
+# these are raised by a validator for invalid data (the latter is caught by voluptuous)
+_FAILURES: Final = (_MismatchError, vol.Invalid, ValueError)
+
+
+class CompiledSchema(vol.Schema):
+    """A voluptuous schema that uses a compiled validator for valid data."""
+
+    def __init__(self, schema: Any, *, required: bool = False, extra: int = vol.PREVENT_EXTRA) -> None:
+        """Initialise the schema, and compile its validator."""
+
+        super().__init__(schema, required=required, extra=extra)
+        self.validator: Final = _compile(schema, required=required, extra=extra)
+        self.coercer: Final = _compile_coercer(schema, required=required, extra=extra)
+
+    def __call__(self, data: Any) -> Any:
+        """Validate data, using voluptuous only if the compiled validator fails."""
+
+        try:
+            return self.validator(data)
+        except _FAILURES:
+            validate: _Validator = super().__call__
+            return validate(data)  # raise the voluptuous error (if any)
+
+    def coerce(self, data: Any) -> tuple[Any, list[Any] | None]:
+        """Coerce data (without validating its structure), and return it with its shape.
+
+        Only the values are checked (e.g. enums, datetimes) and converted. The shape
+        (the keys, and the types of the unchecked values) is returned, so that it can
+        be compared with that of data that has been validated (for the same result).
+
+        If the data can't be coerced, it is validated instead (and its shape is None).
+        """
+
+        if self.coercer is not None:
+            shape: list[Any] = []
+            try:
+                return self.coercer(data, shape), shape
+            except (*_FAILURES, AttributeError, KeyError, TypeError):
+                pass  # e.g. a list where a dict was expected
+
+        return self(data), None
+
+
+def compile_schema(schema: Any) -> CompiledSchema:
+    """Return a compiled version of a schema (or of a validator, e.g. a vol.Any).
+
+    The compiled schema is a drop-in replacement for the original, for both
+    Case.VENDOR and Case.PYTHONIC schemas.
+    """
+
+    if isinstance(schema, CompiledSchema):
+        return schema
+
+    if isinstance(schema, vol.Schema):
+        return CompiledSchema(schema.schema, required=schema.required, extra=schema.extra)
+
+    return CompiledSchema(schema)
+
+
+def _compile(node: Any, *, required: bool, extra: int) -> _Validator:
+    """Return a validator for a node of a schema (its semantics as per voluptuous)."""
+
+    if (validator := _compile_structure(node, required=required, extra=extra)) is None:
+        validator = _compile_scalar(node, required=required, extra=extra)
+    return validator
+
+
+def _compile_structure(node: Any, *, required: bool, extra: int) -> _Validator | None:
+    """Return a validator for a node that has sub-nodes (or None if it hasn't)."""
+
+    if isinstance(node, CompiledSchema):
+        return node.validator
+
+    if isinstance(node, vol.Schema):  # a nested schema has its own required/extra
+        return _compile(node.schema, required=node.required, extra=node.extra)
+
+    if type(node) is dict:
+        return _compile_dict(node, required=required, extra=extra)
+
+    if type(node) is list and len(node) == 1:
+        return _compile_list(node[0], required=required, extra=extra)
+
+    if type(node) in (vol.All, vol.Any) and node.msg is None and node.discriminant is None:
+        return _compile_sub_validators(node, extra=extra)
+
+    return None
+
+
+def _compile_scalar(node: Any, *, required: bool, extra: int) -> _Validator:
+    """Return a validator for a node that has no sub-nodes (e.g. a type, a vol.In)."""
+
+    validator: _Validator
+
+    if (compiler := _COMPILERS.get(type(node))) and getattr(node, "msg", None) is None:
+        validator = compiler(node)
+
+    elif inspect.isclass(node):
+        validator = _compile_type(node)
+
+    elif callable(node):  # e.g. the coercers from factory_enum(), factory_datetime()
+        validator = node
+
+    elif type(node) in _SCALAR_TYPES:
+        validator = _compile_literal(node)
+
+    else:  # anything else (e.g. a tuple) is left to voluptuous
+        validator = vol.Schema(node, required=required, extra=extra)
+
+    return validator
+
+
+def _compile_dict(node: dict[Any, Any], *, required: bool, extra: int) -> _Validator:
+    """Return a validator for a dict of str keys (each may be Required/Optional)."""
+
+    if (keys := _parse_keys(node, required=required)) is None:
+        return vol.Schema(node, required=required, extra=extra)
+
+    values, required_keys, defaults = keys
+    validators = {k: _compile(v, required=required, extra=extra) for k, v in values.items()}
+
+    return _dict_validator(validators, required_keys, defaults, extra=extra)
+
+
+def _parse_keys(
+    node: dict[Any, Any], *, required: bool
+) -> tuple[dict[str, Any], set[str], dict[str, Callable[[], Any]]] | None:
+    """Return the values, required keys and defaults of a dict, by (str) key.
+
+    Return None if the dict has keys that can't be compiled.
+    """
+
+    values: dict[str, Any] = {}
+    defaults: dict[str, Callable[[], Any]] = {}
+    required_keys: set[str] = set()
+
+    for key, value in node.items():
+        # an unmarked key is required only if the schema says so
+        marker = (vol.Required(key) if required else vol.Optional(key)) if type(key) is str else key
+
+        if (
+            type(marker) not in (vol.Required, vol.Optional)
+            or type(marker.schema) is not str
+            or marker.schema in values
+        ):
+            # e.g. vol.Extra, vol.Remove, vol.Exclusive, a non-str key, or a duplicate
+            return None
+
+        if type(marker) is vol.Required:
+            required_keys.add(marker.schema)
+        if not isinstance(marker.default, vol.Undefined):
+            defaults[marker.schema] = marker.default
+
+        values[marker.schema] = value
+
+    return values, required_keys, defaults
+
+
+def _dict_validator(
+    validators: dict[str, _Validator],
+    required_keys: set[str],
+    defaults: dict[str, Callable[[], Any]],
+    *,
+    extra: int,
+) -> _Validator:
+    """Return a validator for a dict, given a validator for each of its keys."""
+
+    def validate_dict(data: Any) -> dict[Any, Any]:
+        if type(data) is not dict:
+            raise _MismatchError
+
+        result = {}
+        for key, value in data.items():
+            if (validate := validators.get(key)) is not None:
+                result[key] = validate(value)
+            elif extra == vol.ALLOW_EXTRA:
+                result[key] = value
+            elif extra != vol.REMOVE_EXTRA:
+                raise _MismatchError
+
+        for key, default in defaults.items():
+            if key not in data:
+                result[key] = validators[key](default())
+
+        if not required_keys <= result.keys():
+            raise _MismatchError
+        return result
+
+    return validate_dict
+
+
+def _compile_coercer(node: Any, *, required: bool, extra: int) -> _Coercer | None:
+    """Return a coercer for a node of a schema (or None if there is nothing to coerce).
+
+    A coercer appends the shape of the data to a list, rather than validating it. The
+    values of types, literals and vol.Length/Match/Range are neither checked nor
+    coerced, but anything else is (e.g. a vol.Any, as it needs the structure of the
+    data to choose an alternative).
+    """
+
+    if isinstance(node, CompiledSchema):
+        return node.coercer
+
+    if isinstance(node, vol.Schema):  # a nested schema has its own required/extra
+        return _compile_coercer(node.schema, required=node.required, extra=node.extra)
+
+    if type(node) is dict and (keys := _parse_keys(node, required=required)) is not None:
+        values, _, defaults = keys
+        coercers = {k: _compile_coercer(v, required=required, extra=extra) for k, v in values.items()}
+        return _dict_coercer(coercers, defaults)
+
+    if type(node) is list and len(node) == 1:
+        return _list_coercer(_compile_coercer(node[0], required=required, extra=extra))
+
+    if inspect.isclass(node) or type(node) in (*_SCALAR_TYPES, *_UNCOERCED_TYPES):
+        return None
+
+    validate = _compile(node, required=required, extra=extra)
+
+    def coerce_value(data: Any, _: list[Any]) -> Any:
+        return validate(data)
+
+    return coerce_value
+
+
+def _dict_coercer(coercers: dict[str, _Coercer | None], defaults: dict[str, Callable[[], Any]]) -> _Coercer:
+    """Return a coercer for a dict, given a coercer (if any) for each of its keys."""
+
+    def coerce_dict(data: Any, shape: list[Any]) -> dict[Any, Any]:
+        shape.append(type(data))
+
+        result = {}
+        for key, value in data.items():
+            shape.append(key)
+            if (coerce := coercers.get(key)) is None:  # incl. unexpected keys
+                shape.append(type(value))
+                result[key] = value
+            else:
+                result[key] = coerce(value, shape)
+
+        for key, default in defaults.items():
+            if key not in data:
+                coerce = coercers[key]
+                result[key] = default() if coerce is None else coerce(default(), [])
+
+        shape.append(None)  # the end of the dict
+        return result
+
+    return coerce_dict
+
+
+def _list_coercer(coerce: _Coercer | None) -> _Coercer:
+    """Return a coercer for a list, given a coercer (if any) for its items."""
+
+    def coerce_list(data: Any, shape: list[Any]) -> list[Any]:
+        shape.append(type(data))
+
+        if coerce is None:
+            shape.extend(type(v) for v in data)
+            result = list(data)
+        else:
+            result = [coerce(v, shape) for v in data]
+
+        shape.append(None)  # the end of the list
+        return result
+
+    return coerce_list
+
+
+def _compile_list(node: Any, *, required: bool, extra: int) -> _Validator:
+    """Return a validator for a list, all of whose items share a schema."""
+
+    validate = _compile(node, required=required, extra=extra)
+
+    def validate_list(data: Any) -> list[Any]:
+        if type(data) is not list:
+            raise _MismatchError
+        return [validate(v) for v in data]
+
+    return validate_list
+
+
+def _compile_sub_validators(node: vol.All | vol.Any, *, extra: int) -> _Validator:
+    """Return a validator for a vol.All (a chain), or a vol.Any (the first to pass)."""
+
+    validators = [_compile(v, required=node.required, extra=extra) for v in node.validators]
+
+    if type(node) is vol.All:
+
+        def validate_all(data: Any) -> Any:
+            for validate in validators:
+                data = validate(data)
+            return data
+
+        return validate_all
+
+    def validate_any(data: Any) -> Any:
+        for validate in validators:
+            try:
+                return validate(data)
+            except _FAILURES:
+                pass
+        raise _MismatchError
+
+    return validate_any
+
+
+def _compile_in(node: vol.In) -> _Validator:
+    """Return a validator for a vol.In, using a precomputed table where possible."""
+
+    container: Any = node.container
+    members = container
+    if isinstance(container, list | tuple | set) or (isinstance(container, type) and issubclass(container, StrEnum)):
+        with contextlib.suppress(TypeError):  # if any members are unhashable
+            members = frozenset(container)
+
+    def validate_in(data: Any) -> Any:
+        try:
+            if data in members:
+                return data
+        except TypeError:  # e.g. the data is unhashable
+            pass
+        raise _MismatchError
+
+    return validate_in
+
+
+def _compile_match(node: vol.Match) -> _Validator:
+    """Return a validator for a vol.Match (the data is returned unchanged)."""
+
+    match = node.pattern.match
+
+    def validate_match(data: Any) -> Any:
+        if type(data) is not str or not match(data):
+            raise _MismatchError
+        return data
+
+    return validate_match
+
+
+def _compile_range(node: vol.Range) -> _Validator:
+    """Return a validator for a vol.Range (the data is returned unchanged)."""
+
+    min_, max_ = node.min, node.max
+    min_included, max_included = node.min_included, node.max_included
+
+    def validate_range(data: Any) -> Any:
+        try:
+            if min_ is not None and not (data >= min_ if min_included else data > min_):
+                raise _MismatchError
+            if max_ is not None and not (data <= max_ if max_included else data < max_):
+                raise _MismatchError
+        except TypeError:
+            raise _MismatchError from None
+        return data
+
+    return validate_range
+
+
+def _compile_length(node: vol.Length) -> _Validator:
+    """Return a validator for a vol.Length (the data is returned unchanged)."""
+
+    min_, max_ = node.min, node.max
+
+    def validate_length(data: Any) -> Any:
+        try:
+            length = len(data)
+        except TypeError:
+            raise _MismatchError from None
+        if (min_ is not None and length < min_) or (max_ is not None and length > max_):
+            raise _MismatchError
+        return data
+
+    return validate_length
+
+
+def _compile_datetime(node: vol.Datetime) -> _Validator:
+    """Return a validator for a vol.Datetime, memoising the strings that are valid.
+
+    Parsing with strptime() is slow, and such strings are highly repetitive (e.g.
+    the times of day of switchpoints).
+    """
+
+    valid: set[str] = set()
+
+    def validate_datetime(data: Any) -> Any:
+        if type(data) is str and data in valid:
+            return data
+        node(data)  # raises vol.Invalid if the string can't be parsed
+        if type(data) is str and len(valid) < _MAX_MEMO_SIZE:
+            valid.add(data)
+        return data
+
+    return validate_datetime
+
+
+def _compile_type(cls: type) -> _Validator:
+    """Return a validator for a type (e.g. float), which is an isinstance() check."""
+
+    def validate_type(data: Any) -> Any:
+        if not isinstance(data, cls):
+            raise _MismatchError
+        return data
+
+    return validate_type
+
+
+def _compile_literal(value: Any) -> _Validator:
+    """Return a validator for a literal value (e.g. True)."""
+
+    def validate_literal(data: Any) -> Any:
+        if data != value:
+            raise _MismatchError
+        return data
+
+    return validate_literal
+
+
+_COMPILERS: Final[dict[type, Callable[[Any], _Validator]]] = {
+    vol.Datetime: _compile_datetime,
+    vol.In: _compile_in,
+    vol.Length: _compile_length,
+    vol.Match: _compile_match,
+    vol.Range: _compile_range,
+}
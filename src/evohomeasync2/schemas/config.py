@@ -17,6 +17,7 @@ import voluptuous as vol
 
 from _evohome.helpers import camel_to_snake, noop, redact
 
+from .compiler import compile_schema
 from .const import (
     REGEX_DHW_ID,
     REGEX_SYSTEM_ID,
@@ -543,7 +544,7 @@ def factory_user_locations_installation_info(
 
 
 # GET /location/installationInfo?userId={usr_id}&includeTemperatureControlSystems=True
-TCC_GET_USR_LOCATIONS: Final = factory_user_locations_installation_info()
+TCC_GET_USR_LOCATIONS: Final = compile_schema(factory_user_locations_installation_info())
 
 # GET /location/{loc_id}/installationInfo?includeTemperatureControlSystems=True
-TCC_GET_LOC_INSTALLATION_INFO: Final = factory_location_installation_info()
+TCC_GET_LOC_INSTALLATION_INFO: Final = compile_schema(factory_location_installation_info())
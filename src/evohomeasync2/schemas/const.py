@@ -14,7 +14,10 @@ from __future__ import annotations
 from enum import EnumCheck, StrEnum, verify
 from typing import Final
 
-from _evohome.helpers import TCC_DTM_STRFTIME as TCC_DTM_STRFTIME  # noqa: PLC0414
+from _evohome.helpers import (
+    TCC_DTM_STRFTIME as TCC_DTM_STRFTIME,  # noqa: PLC0414
+    precompute_key_translations,
+)
 
 # OAuth API strings — JSON key names use snake_case
 
@@ -149,6 +152,115 @@ S2_ZONE_TYPE: Final = "zoneType"
 S2_ZONES: Final = "zones"
 
 
+# the vendor's JSON keys, precomputed as they are translated for every request/response
+VENDOR_JSON_KEYS: Final = (
+    S2_ACTIVE_FAULTS,
+    S2_ALLOWED_FAN_MODES,
+    S2_ALLOWED_MODES,
+    S2_ALLOWED_SETPOINT_MODES,
+    S2_ALLOWED_STATES,
+    S2_ALLOWED_SYSTEM_MODES,
+    S2_CAN_BE_CHANGED,
+    S2_CAN_BE_PERMANENT,
+    S2_CAN_BE_TEMPORARY,
+    S2_CAN_CONTROL_COOL,
+    S2_CAN_CONTROL_HEAT,
+    S2_CITY,
+    S2_CODE,
+    S2_COOL_SETPOINT,
+    S2_COOL_SETPOINT_VALUE,
+    S2_COUNTRY,
+    S2_CRC,
+    S2_CURRENT_OFFSET_MINUTES,
+    S2_DAILY_SCHEDULES,
+    S2_DAY_OF_WEEK,
+    S2_DHW,
+    S2_DHW_ID,
+    S2_DHW_STATE,
+    S2_DHW_STATE_CAPABILITIES_RESPONSE,
+    S2_DISPLAY_NAME,
+    S2_DURATION,
+    S2_ERROR,
+    S2_FAN_MODE,
+    S2_FAN_STATUS,
+    S2_FAULT_TYPE,
+    S2_FIRSTNAME,
+    S2_GATEWAY_ID,
+    S2_GATEWAY_INFO,
+    S2_GATEWAYS,
+    S2_HEAT_SETPOINT,
+    S2_HEAT_SETPOINT_VALUE,
+    S2_IS_AVAILABLE,
+    S2_IS_CANCELABLE,
+    S2_IS_CHANGEABLE,
+    S2_IS_PERMANENT,
+    S2_IS_WI_FI,
+    S2_LANGUAGE,
+    S2_LASTNAME,
+    S2_LOCATION_ID,
+    S2_LOCATION_INFO,
+    S2_LOCATION_OWNER,
+    S2_LOCATION_TYPE,
+    S2_MAC,
+    S2_MAX_COOL_SETPOINT,
+    S2_MAX_DURATION,
+    S2_MAX_HEAT_SETPOINT,
+    S2_MAX_SWITCHPOINTS_PER_DAY,
+    S2_MESSAGE,
+    S2_MIN_COOL_SETPOINT,
+    S2_MIN_DURATION,
+    S2_MIN_HEAT_SETPOINT,
+    S2_MIN_SWITCHPOINTS_PER_DAY,
+    S2_MODE,
+    S2_MODEL_TYPE,
+    S2_NAME,
+    S2_OFFSET_MINUTES,
+    S2_PERIOD,
+    S2_PERMANENT,
+    S2_POSTCODE,
+    S2_SCHEDULE_CAPABILITIES,
+    S2_SCHEDULE_CAPABILITIES_RESPONSE,
+    S2_SETPOINT_CAPABILITIES,
+    S2_SETPOINT_DEADBAND,
+    S2_SETPOINT_MODE,
+    S2_SETPOINT_STATUS,
+    S2_SETPOINT_VALUE_RESOLUTION,
+    S2_SINCE,
+    S2_STATE,
+    S2_STATE_STATUS,
+    S2_STREET_ADDRESS,
+    S2_SUPPORTS_DAYLIGHT_SAVING,
+    S2_SWITCHPOINTS,
+    S2_SYSTEM_ID,
+    S2_SYSTEM_MODE,
+    S2_SYSTEM_MODE_STATUS,
+    S2_TARGET_COOL_TEMPERATURE,
+    S2_TARGET_HEAT_TEMPERATURE,
+    S2_TEMPERATURE,
+    S2_TEMPERATURE_CONTROL_SYSTEMS,
+    S2_TEMPERATURE_STATUS,
+    S2_TIME_OF_DAY,
+    S2_TIME_UNTIL,
+    S2_TIME_ZONE,
+    S2_TIME_ZONE_ID,
+    S2_TIMING_MODE,
+    S2_TIMING_RESOLUTION,
+    S2_UNTIL,
+    S2_UNTIL_TIME,
+    S2_USE_DAYLIGHT_SAVE_SWITCHING,
+    S2_USER_ACCOUNT,
+    S2_USER_ID,
+    S2_USERNAME,
+    S2_VACATION_HOLD_CAPABILITIES,
+    S2_VALUE_RESOLUTION,
+    S2_ZONE_ID,
+    S2_ZONE_TYPE,
+    S2_ZONES,
+)
+
+precompute_key_translations(VENDOR_JSON_KEYS)
+
+
 # Vendor API strings — URL path components use camelCase
 # - these are not JSON keys; they appear only in URL construction
 
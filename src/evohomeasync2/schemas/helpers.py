@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import contextlib
 from datetime import datetime as dt
 from enum import StrEnum
 from typing import TYPE_CHECKING
@@ -48,8 +49,17 @@ def factory_enum(
 
     evo_cls: type[StrEnum] = getattr(const, tcc_cls.__name__.removeprefix("Tcc"))
 
+    # precompute the vendor's values (and the members themselves, for idempotency)
+    table: dict[object, StrEnum] = {m: m for m in evo_cls}
+    for value in tcc_cls:
+        with contextlib.suppress(ValueError):  # e.g. the user-facing enum is incomplete
+            table[str(value)] = evo_cls(camel_to_snake(value))
+
     def coerce_enum(value: object) -> StrEnum:
-        return evo_cls(camel_to_snake(str(value)))
+        try:
+            return table[value]
+        except (KeyError, TypeError):  # TypeError if value is unhashable
+            return evo_cls(camel_to_snake(str(value)))
 
     return coerce_enum
 
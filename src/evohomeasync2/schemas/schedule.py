@@ -17,6 +17,7 @@ import voluptuous as vol
 
 from _evohome.helpers import camel_to_snake, noop
 
+from .compiler import compile_schema
 from .const import (
     S2_COOL_SETPOINT,
     S2_DAILY_SCHEDULES,
@@ -126,13 +127,13 @@ def factory_zon_schedule(case: Case = Case.VENDOR) -> vol.Schema:
 
 
 # GET /domesticHotWater/{dhw_id}/schedule
-TCC_GET_DHW_SCHEDULE: Final = factory_dhw_schedule()
+TCC_GET_DHW_SCHEDULE: Final = compile_schema(factory_dhw_schedule())
 
 # PUT /domesticHotWater/{dhw_id}/schedule
 TCC_PUT_DHW_SCHEDULE: Final = TCC_GET_DHW_SCHEDULE
 
 # GET /temperatureZone/{zone_id}/schedule
-TCC_GET_ZON_SCHEDULE: Final = factory_zon_schedule()
+TCC_GET_ZON_SCHEDULE: Final = compile_schema(factory_zon_schedule())
 
 # PUT /temperatureZone/{zone_id}/schedule
 TCC_PUT_ZON_SCHEDULE: Final = TCC_GET_ZON_SCHEDULE
@@ -148,5 +149,5 @@ def factory_get_schedule(_: Case = Case.VENDOR) -> vol.Schema:
     )
 
 
-TCC_GET_SCHEDULE: Final = factory_get_schedule()
+TCC_GET_SCHEDULE: Final = compile_schema(factory_get_schedule())
 TCC_PUT_SCHEDULE: Final = TCC_GET_SCHEDULE
@@ -17,6 +17,7 @@ import voluptuous as vol
 
 from _evohome.helpers import camel_to_snake, noop
 
+from .compiler import compile_schema
 from .const import (
     REGEX_DHW_ID,
     REGEX_GATEWAY_ID,
@@ -317,19 +318,19 @@ def factory_loc_status(case: Case = Case.VENDOR) -> vol.Schema:
 
 
 # GET /location/{loc_id}/status?includeTemperatureControlSystems=True
-TCC_GET_LOC_STATUS: Final = factory_loc_status()
+TCC_GET_LOC_STATUS: Final = compile_schema(factory_loc_status())
 
 # GET /gateway/{gwy_id}/status...
-TCC_GET_GWY_STATUS: Final = factory_gwy_status()
+TCC_GET_GWY_STATUS: Final = compile_schema(factory_gwy_status())
 
 # GET /temperatureControlSystem/{tcs_id}/status
-TCC_GET_TCS_STATUS: Final = factory_tcs_status()
+TCC_GET_TCS_STATUS: Final = compile_schema(factory_tcs_status())
 
 # GET /domesticHotWater/{dhw_id}/status
-TCC_GET_DHW_STATUS: Final = factory_dhw_status()
+TCC_GET_DHW_STATUS: Final = compile_schema(factory_dhw_status())
 
 # GET /temperatureZone/{zone_id}/heatSetpoint
 # TODO:
 
 # GET /temperatureZone/{zone_id}/status
-TCC_GET_ZON_STATUS: Final = factory_zon_status()
+TCC_GET_ZON_STATUS: Final = compile_schema(factory_zon_status())
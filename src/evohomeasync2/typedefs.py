@@ -42,11 +42,12 @@ These are not part of the vendor's schema, but useful to the library:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal, NotRequired, TypedDict
+from typing import TYPE_CHECKING, Any, Literal, NotRequired, TypedDict
 
 if TYPE_CHECKING:
     from datetime import datetime as dt
 
+    from .auth import EvoAccessTokenEntryT
     from .const import (
         DayOfWeek,
         DhwState,
@@ -455,6 +456,29 @@ class EvoScheduleT(EvoDailySchedulesT):  # for export/import to/from file
     name: NotRequired[str]  # would normally be present, but be OK if not
 
 
+#######################################################################################
+# Not vendor schemas at all, but this library's own formats for exporting/importing...
+
+
+class EvoConfigSnapshotT(TypedDict):  # for export/import to/from file
+    """The (validated) config of a user account and its locations."""
+
+    version: int  # the format of the snapshot (it is rejected if not current)
+    fetched: str  # dt.isoformat(), when the config was got from the vendor
+    user_account: EvoUsrAccountResponseT
+    user_locations: list[EvoLocConfigResponseT]
+
+
+class EvoStateSnapshotT(TypedDict):  # for export/import to/from file
+    """The config and (latest) state of a client, and of all its entities."""
+
+    version: int  # the format of the snapshot (it is rejected if not current)
+    config: EvoConfigSnapshotT
+    access_token_expires: str | None  # None if there is no valid token
+    access_token: EvoAccessTokenEntryT | None  # None, unless exported with the tokens
+    entities: dict[str, dict[str, dict[str, Any]]]  # keyed by entity type, then id
+
+
 #######################################################################################
 # Schema for the entity's own attrs, as returned by its .config / .status properties...
 #
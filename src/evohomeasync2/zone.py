@@ -3,19 +3,29 @@
 from __future__ import annotations
 
 import json
+from bisect import bisect_left, bisect_right
 from datetime import UTC, datetime as dt, time as tm, timedelta as td
 from functools import cached_property
 from http import HTTPStatus
 from typing import TYPE_CHECKING, Any, Final
 
-from _evohome.helpers import as_aware_dtm, as_local_time, convert_dtm_to_local_aware
+import voluptuous as vol
+
+from _evohome.helpers import (
+    as_aware_dtm,
+    as_local_time,
+    camel_to_snake,
+    convert_dtm_to_local_aware,
+)
 
 from . import exceptions as exc
+from .changes import ChangeType, StatusChange
 from .const import (
     _ERR_NOT_AVAILABLE,
     SZ_ACTIVE_FAULTS,
     SZ_ALLOWED_SETPOINT_MODES,
     SZ_DAILY_SCHEDULES,
+    SZ_DAY_OF_WEEK,
     SZ_DHW_STATE,
     SZ_FAULT_TYPE,
     SZ_HEAT_SETPOINT,
@@ -44,6 +54,7 @@ from .const import (
     ZoneModelType,
     ZoneType,
 )
+from .schemas.compiler import compile_schema
 from .schemas.const import TccEntityType
 from .schemas.helpers import Case
 from .schemas.schedule import factory_zon_schedule
@@ -52,14 +63,13 @@ from .typedefs import EvoZonScheduleDayOfWeekT, EvoZonStatusResponseT, EvoZonSta
 
 if TYPE_CHECKING:
     import logging
-    from collections.abc import Mapping
-    from datetime import tzinfo
+    from collections.abc import Callable, Iterable, Mapping
     from typing import TypedDict
 
-    import voluptuous as vol
-
     from . import ControlSystem, Location
     from .auth import Auth
+    from .changes import StatusListener
+    from .schedule_store import AbstractScheduleStore
     from .typedefs import (
         EvoActiveFaultT,
         EvoDhwScheduleDayOfWeekT,
@@ -74,6 +84,7 @@ if TYPE_CHECKING:
     )
 
     _SwitchPoint = tuple[dt, float | str]
+    _CanonicalScheduleT = tuple[tuple[tuple[tm, float | str], ...], ...]
 
     class _DailySchedulesT[DayT](TypedDict):
         daily_schedules: list[DayT]
@@ -81,6 +92,18 @@ if TYPE_CHECKING:
 
 _ONE_DAY = td(days=1)
 
+_NEVER_LOGGED: Final = dt.min.replace(tzinfo=UTC)
+
+SZ_LAST_LOGGED: Final = "last_logged"  # not a vendor key
+
+_DAY_INDEX: Final[dict[str, int]] = {d: i for i, d in enumerate(DayOfWeek)}
+
+_MINUTES_PER_DAY: Final = 24 * 60
+_MINUTES_PER_WEEK: Final = 7 * _MINUTES_PER_DAY
+
+# a switchpoint that has already passed, so that this/next will be (re-)calculated
+_EXPIRED_SWITCHPOINT: Final = (dt.min.replace(tzinfo=UTC), 0.0)
+
 
 class EntityBase[StatusT]:
     _TCC_TYPE: TccEntityType  # e.g. "temperatureControlSystem", "domesticHotWater"
@@ -90,6 +113,8 @@ class EntityBase[StatusT]:
     def __init__(self, entity_id: str) -> None:
         self._id: Final = entity_id
 
+        self._listeners: list[StatusListener] = []
+
     def __str__(self) -> str:
         """Return a string representation of the entity."""
         return f"{self.__class__.__name__}(id='{self._id}')"
@@ -126,6 +151,50 @@ class EntityBase[StatusT]:
 
         raise NotImplementedError("Use Location.update() to update status")
 
+    def add_listener(self, listener: StatusListener) -> Callable[[], None]:
+        """Add a listener for the changes to the entity's status.
+
+        The listener is called with the change-set of each status update that has
+        changes (it is not called otherwise). Returns a function to remove it.
+        """
+
+        self._listeners.append(listener)
+
+        def remove_listener() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return remove_listener
+
+    def _notify_listeners(self, changes: list[StatusChange]) -> None:
+        """Pass a (non-empty) change-set to the entity's listeners."""
+
+        if not changes:
+            return
+
+        for listener in tuple(self._listeners):
+            try:
+                listener(changes)
+            except Exception:
+                self._logger.exception(f"{self}: Error in a status listener")
+
+    def _status_values(self) -> dict[ChangeType, Any]:
+        """Return the values of the (current) status that are tracked for changes."""
+        return {}
+
+    def _tracked_values(self) -> dict[ChangeType, Any]:
+        """Return the tracked values of the status, if there is a status."""
+        return {} if self._status is None else self._status_values()
+
+    def _status_changes(self, old: Mapping[ChangeType, Any]) -> list[StatusChange]:
+        """Return the changes to the tracked values of the status (since old)."""
+
+        return [
+            StatusChange(self, k, old.get(k), v)
+            for k, v in self._tracked_values().items()
+            if old.get(k) != v
+        ]
+
 
 class ActiveFaultsBase[StatusT](EntityBase[StatusT]):
     """Provide the base for active faults."""
@@ -143,8 +212,13 @@ class ActiveFaultsBase[StatusT](EntityBase[StatusT]):
     def _update_faults(
         self,
         active_faults: list[EvoActiveFaultT],
-    ) -> None:
-        """Maintain self._active_faults list and self._last_logged dict."""
+    ) -> list[StatusChange]:
+        """Maintain self._active_faults list and self._last_logged dict.
+
+        Returns the faults that have been added/removed, as a change-set.
+        """
+
+        changes: list[StatusChange] = []
 
         def hash_(fault: EvoActiveFaultT) -> str:
             return f"{fault[SZ_SINCE]}_{fault[SZ_FAULT_TYPE]}"
@@ -168,17 +242,51 @@ class ActiveFaultsBase[StatusT](EntityBase[StatusT]):
         for fault in [f for f in self._active_faults if f not in active_faults]:
             log_as_resolved(fault)
             self._active_faults.remove(fault)
+            changes.append(StatusChange(self, ChangeType.FAULT_REMOVED, fault, None))
 
-        # Add new (active) faults
+        # Add new (active) faults (they may have been logged before a restart)
         for fault in [f for f in active_faults if f not in self._active_faults]:
-            log_as_active(fault)
+            self._last_logged.setdefault(hash_(fault), _NEVER_LOGGED)
             self._active_faults.append(fault)
+            changes.append(StatusChange(self, ChangeType.FAULT_ADDED, None, fault))
+
+        # Forget any faults that were logged, but are no longer active
+        for key in self._last_logged.keys() - map(hash_, self._active_faults):
+            del self._last_logged[key]
 
-        # Re-log active faults if necessary
+        # Log new active faults, and re-log active faults if necessary
         for fault in self._active_faults:
             if dt.now(tz=UTC) - self._last_logged[hash_(fault)] > _ONE_DAY:
                 log_as_active(fault)
 
+        return changes
+
+    def export_state(self) -> dict[str, Any]:
+        """Return the (JSON serializable) state of the entity that is not in its status.
+
+        That is, when each of its active faults was last logged.
+        """
+
+        return {
+            SZ_LAST_LOGGED: {k: v.isoformat() for k, v in self._last_logged.items()}
+        }
+
+    def import_state(self, state: Mapping[str, Any]) -> None:
+        """Restore the state of the entity (as returned by export_state()).
+
+        This should be done before its status is restored, so that its active faults
+        are not logged again (unless they were last logged more than a day ago).
+        """
+
+        try:
+            last_logged = {
+                k: dt.fromisoformat(v) for k, v in state.get(SZ_LAST_LOGGED, {}).items()
+            }
+        except (AttributeError, TypeError, ValueError) as err:
+            raise exc.InvalidStatusError(f"{self}: Invalid state: {err}") from err
+
+        self._last_logged.update(last_logged)
+
     @property
     def active_faults(self) -> tuple[EvoActiveFaultT, ...]:
         """
@@ -193,62 +301,101 @@ class ActiveFaultsBase[StatusT](EntityBase[StatusT]):
         return tuple(self._active_faults)
 
 
-def _dt_to_dow_and_tod(dtm: dt, tzinfo: tzinfo) -> tuple[DayOfWeek, str]:
-    """Return a pair of strings representing the local day of week and time of day."""
-    dtm = as_local_time(dtm, tzinfo)
-    day_of_week = list(DayOfWeek)[dtm.weekday()]  # locale-independent
-    return DayOfWeek(day_of_week), dtm.strftime("%H:%M")  # TODO: localize, e.g. Montag?
+class WeekTimeline:
+    """A schedule, compiled into a sorted array of (minute of week, setpoint/state).
 
+    Minute 0 is Monday 00:00 (local time). The switchpoints repeat every week, so an
+    index outside the week is valid (e.g. -1 is the last switchpoint of the previous
+    week, and len() is the first switchpoint of the next week).
+    """
 
-def _find_switchpoints[DayT: (EvoZonScheduleDayOfWeekT, EvoDhwScheduleDayOfWeekT)](
-    schedule: list[DayT],
-    day_of_week: DayOfWeek,
-    time_of_day: str,
-) -> tuple[Mapping[str, Any], int, Mapping[str, Any], int]:
-    """Find this/next switchpoints for a given day of week and time of day."""
+    def __init__(self, schedule: Iterable[Mapping[str, Any]]) -> None:
+        """Compile the schedule (the days may be in any order)."""
 
-    if not schedule:
-        raise exc.InvalidScheduleError("No schedule (daily schedules are empty)")
+        def minute_of_week(day_of_week: str, time_of_day: str) -> int:
+            day = _DAY_INDEX[camel_to_snake(str(day_of_week))]  # also "Monday"
+            tod = tm.fromisoformat(time_of_day)
+            return day * _MINUTES_PER_DAY + tod.hour * 60 + tod.minute
 
-    # assumes 1+ switchpoint per day, which could be this_sp or next_sp only
+        try:
+            switchpoints = sorted(
+                (
+                    minute_of_week(day[SZ_DAY_OF_WEEK], sp[SZ_TIME_OF_DAY]),
+                    sp[SZ_DHW_STATE] if SZ_DHW_STATE in sp else sp[SZ_HEAT_SETPOINT],
+                )
+                for day in schedule
+                for sp in day[SZ_SWITCHPOINTS]
+            )
+        except (KeyError, TypeError, ValueError) as err:
+            raise exc.InvalidScheduleError(f"Invalid schedule: {err}") from err
 
-    try:
-        day_idx = list(DayOfWeek).index(day_of_week)
-    except ValueError as err:
-        raise TypeError(f"Invalid parameter: {day_of_week}") from err
+        if not switchpoints:
+            raise exc.InvalidScheduleError("No schedule (there are no switchpoints)")
+
+        self._minutes: Final[list[int]] = [m for m, _ in switchpoints]
+        self._values: Final[list[float | str]] = [v for _, v in switchpoints]
+
+    def __len__(self) -> int:
+        """Return the number of switchpoints in the week."""
+        return len(self._minutes)
+
+    @property
+    def minutes(self) -> tuple[int, ...]:
+        """Return the minute of the week of each switchpoint (in order)."""
+        return tuple(self._minutes)
+
+    @property
+    def values(self) -> tuple[float | str, ...]:
+        """Return the setpoint/state of each switchpoint (in order)."""
+        return tuple(self._values)
 
-    this_sp: Mapping[str, Any] | None = None
-    next_sp: Mapping[str, Any] | None = None
+    def values_at(self, minutes: Iterable[int]) -> list[float | str]:
+        """Return the setpoint/state in effect at each of many minutes of the week."""
 
-    this_offset = 0
-    next_offset = 0
+        values = self._values  # NOTE: values[-1] is that of the previous week
+        return [values[bisect_right(self._minutes, m) - 1] for m in minutes]
 
-    # Check the switchpoints of the given day of week
-    for sp in schedule[day_idx][SZ_SWITCHPOINTS]:
-        if sp[SZ_TIME_OF_DAY] <= time_of_day:
-            this_sp = sp
-            continue
+    def index_at(self, minute: int) -> int:
+        """Return the index of the switchpoint in effect at a minute of the week."""
+        return bisect_right(self._minutes, minute) - 1
 
-        if sp[SZ_TIME_OF_DAY] > time_of_day:
-            if this_sp is None:
-                if not (prev_day := schedule[(day_idx + 6) % 7][SZ_SWITCHPOINTS]):
-                    raise exc.InvalidScheduleError("No switchpoints for previous day")
-                this_sp = prev_day[-1]
-                this_offset = -1
+    def index_from(self, minute: int) -> int:
+        """Return the index of the first switchpoint at/after a minute of the week."""
+        return bisect_left(self._minutes, minute)
 
-            next_sp = sp
-            break
+    def switchpoint(self, index: int) -> tuple[int, float | str]:
+        """Return the minute (relative to this week) and setpoint/state of an index."""
 
-    else:
-        assert this_sp is not None  # mypy
+        weeks, idx = divmod(index, len(self._minutes))
+        return self._minutes[idx] + weeks * _MINUTES_PER_WEEK, self._values[idx]
 
-        if next_sp is None:
-            if not (next_day := schedule[(day_idx + 1) % 7][SZ_SWITCHPOINTS]):
-                raise exc.InvalidScheduleError("No switchpoints for next day")
-            next_sp = next_day[0]
-            next_offset = +1
 
-    return this_sp, this_offset, next_sp, next_offset
+def _canonical_schedule(
+    daily_schedules: Iterable[Mapping[str, Any]],
+) -> _CanonicalScheduleT:
+    """Return a schedule in a canonical form, so that two schedules can be compared.
+
+    The days are in DayOfWeek order and their switchpoints in time order, with times of
+    day as time objects, setpoints as floats and DHW states as snake_case.
+    """
+
+    def canonical_switchpoint(sp: Mapping[str, Any]) -> tuple[tm, float | str]:
+        tod = tm.fromisoformat(sp[SZ_TIME_OF_DAY])  # "07:00" == "07:00:00"
+        if SZ_DHW_STATE in sp:
+            return tod, camel_to_snake(str(sp[SZ_DHW_STATE]))
+        return tod, float(sp[SZ_HEAT_SETPOINT])
+
+    try:
+        days = {
+            DayOfWeek(camel_to_snake(str(d[SZ_DAY_OF_WEEK]))): d[SZ_SWITCHPOINTS]
+            for d in daily_schedules
+        }
+        return tuple(
+            tuple(sorted(canonical_switchpoint(sp) for sp in days.get(dow, [])))
+            for dow in DayOfWeek
+        )
+    except (KeyError, TypeError, ValueError) as err:
+        raise exc.InvalidScheduleError(f"Invalid schedule: {err}") from err
 
 
 class _ScheduleBase[
@@ -260,9 +407,12 @@ class _ScheduleBase[
     SCH_SCHEDULE: vol.Schema
 
     _schedule: list[DayT] | None = None
+    _schedule_fetched: dt | None = None  # when got/set via the API (not if restored)
+
+    _timeline: WeekTimeline | None = None  # compiled from the schedule, when needed
 
     _this_switchpoint: _SwitchPoint  # is float for zones...
-    _next_switchpoint: _SwitchPoint  # and str for DHW
+    _next_switchpoint: _SwitchPoint = _EXPIRED_SWITCHPOINT  # and str for DHW
 
     location: Location  # used to get tzinfo
 
@@ -304,8 +454,90 @@ class _ScheduleBase[
 
         return self._next_switchpoint
 
+    @property
+    def _schedule_store(self) -> AbstractScheduleStore | None:
+        return self.location.client.schedule_store
+
+    def _schedule_is_current(self) -> bool:
+        """Return True if the schedule was got/set by this client, and is not stale.
+
+        A schedule restored from a store (or a snapshot) may have since been changed
+        by another client, and, if there is a store, a schedule older than its TTL is
+        stale.
+        """
+
+        if not self._schedule or self._schedule_fetched is None:
+            return False
+
+        store = self._schedule_store
+        return store is None or self._schedule_fetched + store.ttl > dt.now(tz=UTC)
+
+    def _restore_schedule(self) -> bool:
+        """Restore the schedule from the store (if any), and return True if restored."""
+
+        store = self._schedule_store
+        if store is None or (daily_schedules := store.get(self.id)) is None:
+            return False
+
+        if not self._load_schedule(daily_schedules):  # the store may be stale/corrupt
+            store.discard(self.id)
+            return False
+
+        return True
+
+    def _load_schedule(self, daily_schedules: list[Any]) -> bool:
+        """Use a (stored) schedule if it is valid, and return True if it was used."""
+
+        try:
+            response: _DailySchedulesT[DayT] = self.SCH_SCHEDULE(
+                {SZ_DAILY_SCHEDULES: daily_schedules}
+            )
+        except vol.Invalid as err:
+            self._logger.warning(f"{self}: Ignoring stored schedule: {err}")
+            return False
+
+        self._update_schedule(response[SZ_DAILY_SCHEDULES])
+
+        self._this_switchpoint, self._next_switchpoint = self._find_switchpoints(
+            dt.now(tz=UTC)
+        )
+
+        return True
+
+    def export_state(self) -> dict[str, Any]:
+        """Return the (JSON serializable) state of the entity that is not in its status.
+
+        That is, when each of its active faults was last logged, and its schedule.
+        """
+
+        state = super().export_state()
+        if self._schedule:
+            state[SZ_DAILY_SCHEDULES] = self._schedule
+        return state
+
+    def import_state(self, state: Mapping[str, Any]) -> None:
+        """Restore the state of the entity (as returned by export_state()).
+
+        An invalid schedule is ignored (its switchpoints are re-calculated as needed).
+        """
+
+        super().import_state(state)
+
+        if (daily_schedules := state.get(SZ_DAILY_SCHEDULES)) is not None:
+            self._load_schedule(daily_schedules)
+
     async def get_schedule(self) -> list[DayT]:
-        """Get the schedule for this DHW/zone object."""
+        """Get the schedule for this DHW/zone object.
+
+        If there is a schedule store, use its schedule unless it is stale.
+        """
+
+        store = self._schedule_store  # NOTE: an empty store is falsey
+
+        if store is not None and store.is_fresh(self.id) and self._restore_schedule():
+            self._logger.debug(f"{self}: Got schedule from store")
+            self._schedule_fetched = store.fetched(self.id)
+            return self.schedule
 
         self._logger.debug(f"{self}: Getting schedule...")
 
@@ -322,13 +554,95 @@ class _ScheduleBase[
                 ) from err
             raise
 
-        self._schedule = response[SZ_DAILY_SCHEDULES]
+        schedule = response[SZ_DAILY_SCHEDULES]
+        self._update_schedule(schedule, fetched=dt.now(tz=UTC))
 
         self._this_switchpoint, self._next_switchpoint = self._find_switchpoints(
             dt.now(tz=UTC)
         )
 
-        return self._schedule
+        if store is not None:
+            store.set(self.id, schedule)
+            await store.save()
+
+        return schedule
+
+    def _update_schedule(
+        self, schedule: list[DayT], *, fetched: dt | None = None
+    ) -> None:
+        """Replace the schedule (its timeline & switchpoints are re-calculated lazily).
+
+        The schedule was got/set via the vendor's API at `fetched`, if not None.
+        """
+
+        self._schedule = schedule
+        self._schedule_fetched = fetched
+        self._timeline = None
+        self._next_switchpoint = _EXPIRED_SWITCHPOINT
+
+    def week_timeline(self) -> WeekTimeline:
+        """Return the schedule as a week timeline (compiled when first required)."""
+
+        if self._timeline is None:
+            self._timeline = WeekTimeline(self.schedule)
+        return self._timeline
+
+    def _week_of(self, dtm: dt) -> tuple[dt, int]:
+        """Return the (naive, local) start of the week of a datetime, and its minute."""
+
+        local = as_local_time(dtm, self.location.tzinfo).replace(tzinfo=None)
+        week = dt.combine(local.date() - td(days=local.weekday()), tm())
+        return week, (local - week) // td(minutes=1)
+
+    def _as_switchpoint(
+        self, week: dt, switchpoint: tuple[int, float | str]
+    ) -> _SwitchPoint:
+        """Return a switchpoint of the timeline as a (local, aware) datetime & value."""
+
+        minute, value = switchpoint
+        dtm = week + td(minutes=minute)
+        return dtm.replace(tzinfo=self.location.tzinfo), value
+
+    def switchpoint_at(self, dtm: dt) -> _SwitchPoint:
+        """Return the start datetime and setpoint of the switchpoint in effect at dtm."""
+
+        timeline = self.week_timeline()
+        week, minute = self._week_of(dtm)
+
+        return self._as_switchpoint(
+            week, timeline.switchpoint(timeline.index_at(minute))
+        )
+
+    def switchpoint_after(self, dtm: dt) -> _SwitchPoint:
+        """Return the start datetime and setpoint of the first switchpoint after dtm."""
+
+        timeline = self.week_timeline()
+        week, minute = self._week_of(dtm)
+
+        return self._as_switchpoint(
+            week, timeline.switchpoint(timeline.index_at(minute) + 1)
+        )
+
+    def switchpoints_between(self, start: dt, end: dt) -> list[_SwitchPoint]:
+        """Return the start datetime and setpoint of every switchpoint in [start, end).
+
+        The resolution is one minute (as is that of the schedule).
+        """
+
+        timeline = self.week_timeline()
+        week, first = self._week_of(start)
+        last = (
+            as_local_time(end, self.location.tzinfo).replace(tzinfo=None) - week
+        ) // td(minutes=1)
+
+        switchpoints: list[_SwitchPoint] = []
+
+        index = timeline.index_from(first)
+        while (switchpoint := timeline.switchpoint(index))[0] < last:
+            switchpoints.append(self._as_switchpoint(week, switchpoint))
+            index += 1
+
+        return switchpoints
 
     def _find_switchpoints(self, dtm: dt) -> tuple[_SwitchPoint, _SwitchPoint]:
         """Find the current (this) and next switchpoints for a given datetime.
@@ -342,33 +656,14 @@ class _ScheduleBase[
         }
         """
 
-        dtm = as_local_time(dtm, self.location.tzinfo)
-
-        this_sp, this_offset, next_sp, next_offset = _find_switchpoints(
-            self.schedule, *_dt_to_dow_and_tod(dtm, self.location.tzinfo)
-        )
-
-        this_tod = tm.fromisoformat(this_sp[SZ_TIME_OF_DAY])
-        next_tod = tm.fromisoformat(next_sp[SZ_TIME_OF_DAY])
+        timeline = self.week_timeline()
+        week, minute = self._week_of(dtm)
 
-        this_dtm = dt.combine(dtm + td(days=this_offset), this_tod)
-        next_dtm = dt.combine(dtm + td(days=next_offset), next_tod)
-
-        # exactly one of "dhw_state" (str) or "heat_setpoint" (float) will be present
-        this_val = (
-            this_sp[SZ_DHW_STATE]
-            if SZ_DHW_STATE in this_sp
-            else this_sp[SZ_HEAT_SETPOINT]
-        )
-        next_val = (
-            next_sp[SZ_DHW_STATE]
-            if SZ_DHW_STATE in next_sp
-            else next_sp[SZ_HEAT_SETPOINT]
-        )
+        index = timeline.index_at(minute)
 
         return (
-            (this_dtm.replace(tzinfo=self.location.tzinfo), this_val),
-            (next_dtm.replace(tzinfo=self.location.tzinfo), next_val),
+            self._as_switchpoint(week, timeline.switchpoint(index)),
+            self._as_switchpoint(week, timeline.switchpoint(index + 1)),
         )
 
     async def set_schedule(
@@ -410,7 +705,11 @@ class _ScheduleBase[
 
         # TODO: check the status of the task
 
-        self._schedule = schedule
+        self._update_schedule(schedule, fetched=dt.now(tz=UTC))
+
+        if (store := self._schedule_store) is not None:  # is now stale
+            store.discard(self.id)
+            await store.save()
 
 
 class _ZoneBase[
@@ -427,6 +726,8 @@ class _ZoneBase[
         self.location = tcs.location
         self.tcs = tcs
 
+        self._restore_schedule()  # if there is a schedule store
+
     @cached_property
     def _auth(self) -> Auth:
         return self.location.client.auth
@@ -459,11 +760,23 @@ class _ZoneBase[
             self._update_status(status)
         return status
 
-    def _update_status(self, status: StatusT) -> None:
-        """Update the DHW/ZON's status."""
+    def _update_status(
+        self, status: StatusT, *, notify: bool = True
+    ) -> list[StatusChange]:
+        """Update the DHW/ZON's status, and return its change-set.
+
+        The listeners are not notified of the change-set, if not `notify`.
+        """
+
+        old = self._tracked_values()
 
-        self._update_faults(status[SZ_ACTIVE_FAULTS])
+        changes = self._update_faults(status[SZ_ACTIVE_FAULTS])
         self._status = status
+        changes.extend(self._status_changes(old))
+
+        if notify:
+            self._notify_listeners(changes)
+        return changes
 
     @property
     def temperature_status(self) -> EvoTemperatureStatusT:
@@ -490,8 +803,8 @@ class Zone(_ZoneBase[EvoZonStatusT, EvoZonScheduleDayOfWeekT]):
 
     _TCC_TYPE = TccEntityType.ZON
 
-    SCH_SCHEDULE: vol.Schema = factory_zon_schedule(Case.PYTHONIC)
-    SCH_STATUS: vol.Schema = factory_zon_status(Case.PYTHONIC)
+    SCH_SCHEDULE: vol.Schema = compile_schema(factory_zon_schedule(Case.PYTHONIC))
+    SCH_STATUS: vol.Schema = compile_schema(factory_zon_status(Case.PYTHONIC))
 
     def __init__(self, tcs: ControlSystem, config: EvoZonConfigResponseT) -> None:
         super().__init__(config[SZ_ZONE_ID], tcs)
@@ -529,6 +842,14 @@ class Zone(_ZoneBase[EvoZonStatusT, EvoZonScheduleDayOfWeekT]):
             return self._status[SZ_NAME]
         return self._config[SZ_NAME]
 
+    def _status_values(self) -> dict[ChangeType, Any]:
+        return {
+            ChangeType.NAME: self.name,
+            ChangeType.MODE: self.mode,
+            ChangeType.SETPOINT: self.target_heat_temperature,
+            ChangeType.TEMPERATURE: self.temperature,
+        }
+
     @cached_property
     def type(self) -> ZoneType:
         return self._config[SZ_ZONE_TYPE]
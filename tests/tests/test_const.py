@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import inspect
+from datetime import UTC, datetime as dt
 from enum import StrEnum
 
 import evohomeasync2.const as evo_const
 import evohomeasync2.schemas.const as tcc_const
-from _evohome.helpers import camel_to_snake
+from _evohome import helpers
+from _evohome.helpers import camel_to_snake, snake_to_camel
+from evohomeasync2.const import DayOfWeek, SystemMode, ZoneMode
 
 # Pythonic SZ_* constants with no vendor equivalent (keys invented by the library)
 NON_TCC_SZ = {"SZ_ID", "SZ_SCHEDULE", "SZ_SETPOINT", "SZ_THERMOSTAT"}
@@ -105,3 +108,60 @@ def test_evo_str_enums_complete_and_correct() -> None:
         assert not wrong, (
             f"{evo_cls.__name__} values don't match camel_to_snake({tcc_name}): {wrong}"
         )
+
+
+def test_key_translation_tables() -> None:
+    """Check the precomputed key translations agree with the case converters."""
+
+    s2 = {
+        v
+        for n, v in vars(tcc_const).items()
+        if n.startswith("S2_") and isinstance(v, str)
+    }
+
+    # every vendor's S2_ JSON key (i.e. not a URL component) is precomputed...
+    assert set(tcc_const.VENDOR_JSON_KEYS) == s2 - set(tcc_const.TccEntityType)
+    assert set(tcc_const.VENDOR_JSON_KEYS) <= set(helpers._SNAKE_CASE_KEYS)
+
+    # and translates as per camel_to_snake()/snake_to_camel()
+    snake = helpers.convert_keys_to_snake_case(dict.fromkeys(s2))
+    assert snake == {camel_to_snake(k): None for k in s2}
+    assert all(helpers._SNAKE_CASE_KEYS[k] == camel_to_snake(k) for k in s2)
+
+    camel = helpers.convert_keys_to_camel_case(snake)
+    assert camel == {snake_to_camel(k): None for k in snake}
+    assert all(helpers._CAMEL_CASE_KEYS[k] == snake_to_camel(k) for k in snake)
+
+    # other keys (incl. nested keys) are translated, and memoised
+    data = {"someNewKey": [{"anotherKey": 1}]}
+
+    assert helpers.convert_keys_to_snake_case(data) == {
+        "some_new_key": [{"another_key": 1}]
+    }
+    assert helpers._SNAKE_CASE_KEYS["anotherKey"] == "another_key"
+
+
+def test_vendor_json_encoder() -> None:
+    """Check the single-pass encoder agrees with the individual converters."""
+
+    data = {
+        "daily_schedules": [
+            {
+                "day_of_week": DayOfWeek.MONDAY,
+                "switchpoints": [{"heat_setpoint": 21.0, "time_of_day": "06:30:00"}],
+            }
+        ],
+        "setpoint_mode": ZoneMode.TEMPORARY_OVERRIDE,
+        "system_mode": SystemMode.AUTO_WITH_ECO,
+        "time_until": dt(2024, 7, 10, 21, 10, tzinfo=UTC),
+        "name": "auto_with_eco",  # not a StrEnum, so left as is
+        "permanent": True,
+    }
+
+    expected = helpers.convert_keys_to_camel_case(
+        helpers.convert_str_enums_to_pascal_case(helpers.convert_dtms_to_utc_str(data))
+    )
+
+    assert helpers.convert_to_vendor_json(data) == expected
+    assert expected["systemMode"] == "AutoWithEco"
+    assert expected["timeUntil"] == "2024-07-10T21:10:00Z"
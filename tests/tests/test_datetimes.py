@@ -3,14 +3,21 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime as dt, timedelta as td, timezone as tz
+from typing import TYPE_CHECKING
+from zoneinfo import ZoneInfo
 
 import pytest
 import voluptuous as vol
 
 from _evohome.helpers import as_aware_dtm, convert_dtms_to_utc_str
+from _evohome.time_zone import EvoZoneInfo, _transition_time
+from _evohome.windows_zones import WINDOWS_DST_RULES_LOOKUP, WINDOWS_TO_IANA_LOOKUP
 from evohomeasync2 import BadApiRequestError
 from evohomeasync2.schemas.helpers import Case, factory_datetime
 
+if TYPE_CHECKING:
+    from evohomeasync2.typedefs import EvoTimeZoneT
+
 # a fixed +01:00 offset (e.g. London in summer); avoids a tzdata dependency
 PLUS_ONE = tz(td(hours=1))
 
@@ -119,3 +126,95 @@ def test_factory_datetime_vendor_validates_but_keeps_string() -> None:
     assert validate("2023-11-30T22:10:00Z") == "2023-11-30T22:10:00Z"
     with pytest.raises(vol.Invalid):
         validate("not-a-datetime")
+
+
+# --- EvoZoneInfo: offline DST rules ---------------------------------------------------
+
+
+def _time_zone_info(time_zone_id: str, offset: td, current: td) -> EvoTimeZoneT:
+    return {
+        "time_zone_id": time_zone_id,
+        "display_name": time_zone_id,
+        "offset_minutes": offset // td(minutes=1),
+        "current_offset_minutes": current // td(minutes=1),
+        "supports_daylight_saving": True,
+    }
+
+
+@pytest.mark.parametrize("time_zone_id", sorted(WINDOWS_DST_RULES_LOOKUP))
+def test_evo_zone_info_dst_rules(time_zone_id: str) -> None:
+    """The DST rules of a Windows TZ match its IANA TZ, around every transition."""
+
+    zinfo = ZoneInfo(WINDOWS_TO_IANA_LOOKUP[time_zone_id])
+
+    winter = dt(2026, 1, 15, tzinfo=zinfo)  # DST in the southern hemisphere
+    utcoffset, dst = winter.utcoffset(), winter.dst()
+    assert utcoffset is not None
+    assert dst is not None
+    offset = utcoffset - dst
+
+    # the current (vendor) offset is deliberately wrong half of the time
+    tzinfo = EvoZoneInfo(
+        time_zone_info=_time_zone_info(time_zone_id, offset, offset),
+        use_dst_switching=True,
+    )
+
+    _, *transitions = WINDOWS_DST_RULES_LOOKUP[time_zone_id]
+
+    for year in range(2025, 2029):
+        for transition in transitions:
+            local = _transition_time(year, transition)
+
+            for minutes in range(-26 * 60, 26 * 60, 15):
+                wall = local + td(minutes=minutes)  # includes the gaps/folds
+
+                for fold in (0, 1):
+                    evo = wall.replace(tzinfo=tzinfo, fold=fold)
+                    iana = wall.replace(tzinfo=zinfo, fold=fold)
+
+                    assert evo.utcoffset() == iana.utcoffset(), evo
+                    assert evo.dst() == iana.dst(), evo
+
+                utc = (wall - offset).replace(tzinfo=UTC)
+
+                evo = utc.astimezone(tzinfo)
+                iana = utc.astimezone(zinfo)
+
+                assert evo.replace(tzinfo=None) == iana.replace(tzinfo=None), utc
+                assert evo.fold == iana.fold, utc
+                assert evo.utcoffset() == iana.utcoffset(), utc
+
+
+def test_evo_zone_info_without_dst_rules() -> None:
+    """Without DST rules, the current (vendor) DST adjustment is used for any dt."""
+
+    summer = dt(2026, 7, 15, 12, 0, tzinfo=UTC)
+    winter = dt(2026, 1, 15, 12, 0, tzinfo=UTC)
+
+    # a location that doesn't use DST switching (the vendor says it is in DST)...
+    tzinfo = EvoZoneInfo(
+        time_zone_info=_time_zone_info("GMTStandardTime", td(0), td(hours=1)),
+        use_dst_switching=False,
+    )
+
+    assert winter.astimezone(tzinfo).utcoffset() == td(hours=1)
+    assert winter.astimezone(tzinfo).dst() == td(hours=1)
+
+    # a location with DST switching, but a time zone with unknown DST rules...
+    tzinfo = EvoZoneInfo(
+        time_zone_info=_time_zone_info("UnknownStandardTime", td(0), td(0)),
+        use_dst_switching=True,
+    )
+
+    assert summer.astimezone(tzinfo).utcoffset() == td(0)
+    assert summer.astimezone(tzinfo).tzname() == "UnknownStandardTime (STD)"
+
+    # a location with DST switching, and a time zone with known DST rules...
+    tzinfo = EvoZoneInfo(
+        time_zone_info=_time_zone_info("GMTStandardTime", td(0), td(0)),
+        use_dst_switching=True,
+    )
+
+    assert summer.astimezone(tzinfo).utcoffset() == td(hours=1)
+    assert summer.astimezone(tzinfo).tzname() == "GMTStandardTime (DST)"
+    assert winter.astimezone(tzinfo).tzname() == "GMTStandardTime (STD)"
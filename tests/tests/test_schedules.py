@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime as dt, timedelta as td, timezone as tz
+from datetime import UTC, datetime as dt, time as tm, timedelta as td, timezone as tz
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
 from zoneinfo import ZoneInfo
 
 import pytest
@@ -12,13 +13,22 @@ import pytest
 from _evohome.helpers import convert_keys_to_snake_case
 from evohomeasync2 import exceptions as exc
 from evohomeasync2.const import DayOfWeek
+from evohomeasync2.evaluator import (
+    _minutes_of_week,
+    evaluate_schedules,
+    evaluate_schedules_array,
+)
 from evohomeasync2.schemas.schedule import TCC_GET_DHW_SCHEDULE, TCC_GET_ZON_SCHEDULE
-from evohomeasync2.zone import _dt_to_dow_and_tod, _find_switchpoints
+from evohomeasync2.zone import WeekTimeline, _canonical_schedule
 
-from .conftest import JsonObjectType, load_fixture
+from .conftest import FIXTURES_V2, JsonObjectType, load_fixture
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from evohomeasync2 import HotWater, Zone
     from evohomeasync2.typedefs import EvoZonScheduleDayOfWeekT
+    from tests.conftest import EvohomeClientV2
 
 SCHEDULES_DIR = Path(__file__).parent / "schedules"
 
@@ -114,61 +124,207 @@ def test_schema_schedule_zone() -> None:
     assert get_sched == TCC_GET_ZON_SCHEDULE(get_sched)
 
 
+def _find_switchpoints(
+    schedule: list[EvoZonScheduleDayOfWeekT],
+    day_of_week: DayOfWeek,
+    time_of_day: str,
+) -> tuple[Mapping[str, Any], Mapping[str, Any]]:
+    """Find this/next switchpoints via a linear scan (a reference for WeekTimeline).
+
+    Assumes the days are in order, and have 1+ switchpoints each.
+    """
+
+    day_idx = list(DayOfWeek).index(day_of_week)
+
+    this_sp: Mapping[str, Any] | None = None
+
+    for sp in schedule[day_idx]["switchpoints"]:
+        if sp["time_of_day"] > time_of_day:
+            if this_sp is None:
+                this_sp = schedule[(day_idx + 6) % 7]["switchpoints"][-1]
+            return this_sp, sp
+        this_sp = sp
+
+    assert this_sp is not None
+    return this_sp, schedule[(day_idx + 1) % 7]["switchpoints"][0]
+
+
+def _minute(day_of_week: DayOfWeek, time_of_day: str) -> int:
+    """Return the minute of the week of a day of week and (HH:MM) time of day."""
+
+    hours, minutes = time_of_day.split(":")
+    return (list(DayOfWeek).index(day_of_week) * 24 + int(hours)) * 60 + int(minutes)
+
+
 def test_find_switchpoints() -> None:
-    """Test the find_switchpoints method."""
+    """Test the timeline of a schedule finds this/next switchpoints."""
 
     schedule: list[EvoZonScheduleDayOfWeekT] = SCHEDULE["daily_schedules"]  # type: ignore[assignment]
 
-    assert _find_switchpoints(schedule, DayOfWeek.MONDAY, "00:00:00") == (
-        {"heat_setpoint": 14.8, "time_of_day": "21:30:00"},
-        -1,
-        {"heat_setpoint": 23.2, "time_of_day": "06:30:00"},
-        0,
-    )
+    timeline = WeekTimeline(schedule)
+    week = _minute(DayOfWeek.SUNDAY, "24:00")
+
+    def find(day_of_week: DayOfWeek, time_of_day: str) -> tuple[Any, Any]:
+        index = timeline.index_at(_minute(day_of_week, time_of_day))
+        return timeline.switchpoint(index), timeline.switchpoint(index + 1)
 
-    assert _find_switchpoints(schedule, DayOfWeek.TUESDAY, "07:59:59") == (
-        {"heat_setpoint": 19.2, "time_of_day": "06:30:00"},
-        0,
-        {"heat_setpoint": 18.2, "time_of_day": "08:00:00"},
-        0,
+    assert find(DayOfWeek.MONDAY, "00:00") == (  # wraps to the week before
+        (_minute(DayOfWeek.SUNDAY, "21:30") - week, 14.8),
+        (_minute(DayOfWeek.MONDAY, "06:30"), 23.2),
     )
 
-    assert _find_switchpoints(schedule, DayOfWeek.TUESDAY, "08:00:00") == (
-        {"heat_setpoint": 18.2, "time_of_day": "08:00:00"},
-        0,
-        {"heat_setpoint": 19.3, "time_of_day": "17:00:00"},
-        0,
+    assert find(DayOfWeek.TUESDAY, "07:59") == (
+        (_minute(DayOfWeek.TUESDAY, "06:30"), 19.2),
+        (_minute(DayOfWeek.TUESDAY, "08:00"), 18.2),
     )
 
-    assert _find_switchpoints(schedule, DayOfWeek.TUESDAY, "08:00:01") == (
-        {"heat_setpoint": 18.2, "time_of_day": "08:00:00"},
-        0,
-        {"heat_setpoint": 19.3, "time_of_day": "17:00:00"},
-        0,
+    assert find(DayOfWeek.TUESDAY, "08:00") == (
+        (_minute(DayOfWeek.TUESDAY, "08:00"), 18.2),
+        (_minute(DayOfWeek.TUESDAY, "17:00"), 19.3),
     )
 
-    assert _find_switchpoints(schedule, DayOfWeek.SUNDAY, "23:59:59") == (
-        {"heat_setpoint": 14.8, "time_of_day": "21:30:00"},
-        0,
-        {"heat_setpoint": 23.2, "time_of_day": "06:30:00"},
-        1,
+    assert find(DayOfWeek.SUNDAY, "23:59") == (  # wraps to the week after
+        (_minute(DayOfWeek.SUNDAY, "21:30"), 14.8),
+        (_minute(DayOfWeek.MONDAY, "06:30") + week, 23.2),
     )
 
 
 def test_find_switchpoints_invalid_day() -> None:
-    """Test _find_switchpoints with an invalid day_of_week value."""
+    """Test a timeline with an invalid day_of_week value."""
+
+    with pytest.raises(exc.InvalidScheduleError, match="Invalid schedule"):
+        WeekTimeline(
+            [
+                {
+                    "day_of_week": "Montag",
+                    "switchpoints": [{"heat_setpoint": 20.0, "time_of_day": "08:00"}],
+                }
+            ]
+        )
+
+
+def test_week_timeline() -> None:
+    """Test the timeline of a schedule finds the same switchpoints as a linear scan."""
 
     schedule: list[EvoZonScheduleDayOfWeekT] = SCHEDULE["daily_schedules"]  # type: ignore[assignment]
 
-    with pytest.raises(TypeError, match="Invalid parameter"):
-        _find_switchpoints(schedule, "Montag", "08:00:00")  # type: ignore[arg-type]
+    timeline = WeekTimeline(schedule)
+    assert len(timeline) == sum(len(d["switchpoints"]) for d in schedule)
+
+    for minute in range(0, 7 * 24 * 60, 5):
+        day_of_week = list(DayOfWeek)[minute // (24 * 60)]
+        time_of_day = f"{minute // 60 % 24:02d}:{minute % 60:02d}:00"
+
+        this_sp, next_sp = _find_switchpoints(schedule, day_of_week, time_of_day)
+
+        index = timeline.index_at(minute)
+        assert timeline.switchpoint(index)[1] == this_sp["heat_setpoint"]
+        assert timeline.switchpoint(index + 1)[1] == next_sp["heat_setpoint"]
+
+    with pytest.raises(exc.InvalidScheduleError, match="no switchpoints"):
+        WeekTimeline([])
+
+
+@pytest.mark.parametrize("fixture_folder", [FIXTURES_V2 / "default"], ids=["default"])
+async def test_switchpoint_lookups(evohome_v2: EvohomeClientV2) -> None:
+    """Test the switchpoints at, after and between datetimes."""
 
+    zone = evohome_v2.tcs.zones[0]
+    await zone.get_schedule()
 
-def test_find_switchpoints_empty_schedule() -> None:
-    """Test _find_switchpoints raises InvalidScheduleError on empty schedule."""
+    tzinfo = zone.location.tzinfo
+    monday = dt(2026, 2, 23, tzinfo=tzinfo)  # 00:00 on a Monday
+    sunday = monday - td(days=1)
 
-    with pytest.raises(exc.InvalidScheduleError, match="daily schedules are empty"):
-        _find_switchpoints([], DayOfWeek.MONDAY, "08:00:00")
+    week = zone.switchpoints_between(monday, monday + td(days=7))
+    assert len(week) == sum(len(d["switchpoints"]) for d in zone.schedule)
+    assert week == sorted(week)
+
+    assert zone.switchpoints_between(monday + td(days=7), monday + td(days=14)) == [
+        (d + td(days=7), v) for d, v in week
+    ]
+
+    assert zone.switchpoint_at(week[1][0]) == week[1]
+    assert zone.switchpoint_at(week[1][0] - td(minutes=1)) == week[0]
+    assert zone.switchpoint_after(week[1][0]) == week[2]
+
+    last = zone.switchpoints_between(sunday, monday)[-1]  # wraps to the week before
+    assert zone.switchpoint_at(monday) == last
+    assert last == (week[-1][0] - td(days=7), week[-1][1])
+
+    assert zone.switchpoints_between(monday, monday) == []
+
+    this_sp, next_sp = zone.this_switchpoint, zone.next_switchpoint
+    assert zone.switchpoint_after(this_sp[0]) == next_sp
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+@pytest.mark.parametrize("fixture_folder", [FIXTURES_V2 / "default"], ids=["default"])
+async def test_evaluate_schedules(evohome_v2: EvohomeClientV2, backend: str) -> None:
+    """Test the schedules of many zones/DHW are evaluated at many datetimes at once."""
+
+    if use_numpy := backend == "numpy":
+        pytest.importorskip("numpy")
+
+    tcs = evohome_v2.tcs
+    entities: list[HotWater | Zone] = [*tcs.zones]
+    if tcs.hotwater:
+        entities.append(tcs.hotwater)
+
+    for entity in entities:
+        await entity.get_schedule()
+
+    start = dt(2026, 3, 23, 0, 5, tzinfo=UTC)  # the week of a DST transition (in EU)
+    timestamps = [start + td(minutes=10 * i) for i in range(2 * 7 * 24 * 6)]
+
+    matrix = evaluate_schedules(entities, timestamps, use_numpy=use_numpy)
+
+    assert matrix == [[e.switchpoint_at(t)[1] for t in timestamps] for e in entities]
+
+    if use_numpy:  # the same matrix, but as an ndarray
+        assert evaluate_schedules_array(entities, timestamps).tolist() == matrix
+    assert evaluate_schedules(entities, [], use_numpy=use_numpy) == [[]] * len(entities)
+
+    # without NumPy, the evaluation falls back to pure Python (unless NumPy is required)
+    with patch("evohomeasync2.evaluator._HAS_NUMPY", new=False):
+        assert evaluate_schedules(entities, timestamps) == matrix
+
+        with pytest.raises(ModuleNotFoundError, match=r"evohome-async\[numpy\]"):
+            evaluate_schedules_array(entities, timestamps)
+
+
+def test_canonical_schedule() -> None:
+    """Test schedules that differ only in form have the same canonical form."""
+
+    schedule: list[EvoZonScheduleDayOfWeekT] = SCHEDULE["daily_schedules"]  # type: ignore[assignment]
+
+    canonical = _canonical_schedule(schedule)
+    assert canonical[0][0] == (tm(6, 30), 23.2)  # Monday's first switchpoint
+
+    other: list[
+        dict[str, Any]
+    ] = [  # reversed days & switchpoints, vendor strings, HH:MM, int setpoints
+        {
+            "day_of_week": str(d["day_of_week"]).title(),
+            "switchpoints": [
+                {
+                    "heat_setpoint": int(s["heat_setpoint"])
+                    if s["heat_setpoint"].is_integer()
+                    else s["heat_setpoint"],
+                    "time_of_day": s["time_of_day"][:5],
+                }
+                for s in reversed(d["switchpoints"])
+            ],
+        }
+        for d in reversed(schedule)
+    ]
+    assert _canonical_schedule(other) == canonical
+
+    other[0]["switchpoints"][0]["heat_setpoint"] = 99.0
+    assert _canonical_schedule(other) != canonical
+
+    with pytest.raises(exc.InvalidScheduleError, match="Invalid schedule"):
+        _canonical_schedule([{"day_of_week": "Montag", "switchpoints": []}])
 
 
 @pytest.mark.parametrize(
@@ -211,16 +367,12 @@ def test_find_switchpoints_empty_schedule() -> None:
         ),
     ],
 )
-def test_dt_to_dow_and_tod(
+def test_minutes_of_week(
     dtm: dt,
     tz_info: tz,
     expected_dow: DayOfWeek,
     expected_tod: str,
 ) -> None:
-    """Test _dt_to_dow_and_tod returns locale-independent day names."""
-
-    dow, tod = _dt_to_dow_and_tod(dtm, tz_info)
+    """Test _minutes_of_week uses the local (and locale-independent) day of week."""
 
-    assert dow == expected_dow
-    assert dow in DayOfWeek  # always a valid enum member
-    assert tod == expected_tod
+    assert _minutes_of_week([dtm], tz_info) == [_minute(expected_dow, expected_tod)]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import uuid
 from http import HTTPStatus
@@ -191,3 +192,39 @@ async def test_session_manager(  # noqa: PLR0917  # pytest injects fixtures by k
         wrt.assert_called_once()
 
     assert session_manager.is_session_valid() is True
+
+
+async def test_session_id_single_flight(
+    client_session: aiohttp.ClientSession,
+    credentials: tuple[str, str],
+    cache_path: Path,
+) -> None:
+    """Test concurrent calls to .get_session_id() share a single fetch."""
+
+    async def post_session_id_request(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        await asyncio.sleep(0.01)  # so the other callers arrive while in flight
+        return {"sessionId": "new_session_id...", "userInfo": {}}
+
+    session_manager = TokenCacheManager(
+        *credentials, client_session, cache_path=cache_path
+    )
+
+    with (
+        patch(
+            "evohomeasync.auth.AbstractSessionManager._post_session_id_request",
+            new_callable=AsyncMock,
+            side_effect=post_session_id_request,
+        ) as req,
+        patch(
+            "evohome_cli.auth.TokenCacheManager.save_session_id",
+            new_callable=AsyncMock,
+        ) as wrt,
+    ):
+        results = await asyncio.gather(
+            *(session_manager.get_session_id() for _ in range(5))
+        )
+
+        assert results == ["new_session_id..."] * 5
+
+        req.assert_awaited_once()
+        wrt.assert_awaited_once()
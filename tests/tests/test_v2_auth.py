@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import uuid
 from http import HTTPMethod, HTTPStatus
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, patch
 
+import aiohttp
 import pytest
 
 from evohome_cli.auth import TokenCacheManager
@@ -21,7 +23,6 @@ from .test_v2_urls_cred import POST_CREDS  # HACK, should be in const.py, or a f
 if TYPE_CHECKING:
     from pathlib import Path
 
-    import aiohttp
     from freezegun.api import FrozenDateTimeFactory
 
     from evohome_cli.auth import CacheDataT
@@ -246,3 +247,202 @@ async def test_token_manager(  # noqa: PLR0917  # pytest injects fixtures by key
         wrt.assert_called_once()
 
     assert token_manager.is_token_valid() is True
+
+
+async def test_token_refresh_single_flight(
+    client_session: aiohttp.ClientSession,
+    credentials: tuple[str, str],
+    cache_path: Path,
+) -> None:
+    """Test concurrent calls to .get_access_token() share a single refresh."""
+
+    async def post_access_token_request(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        await asyncio.sleep(0.01)  # so the other callers arrive while in flight
+        return {
+            "access_token": "new_access_token...",
+            "expires_in": 1800,
+            "refresh_token": "new_refresh_token...",
+            "token_type": "bearer",
+        }
+
+    token_manager = TokenCacheManager(
+        *credentials, client_session, cache_path=cache_path
+    )
+
+    with (
+        patch(
+            "evohomeasync2.auth.AbstractTokenManager._post_access_token_request",
+            new_callable=AsyncMock,
+            side_effect=post_access_token_request,
+        ) as req,
+        patch(
+            "evohome_cli.auth.TokenCacheManager.save_access_token",
+            new_callable=AsyncMock,
+        ) as wrt,
+    ):
+        results = await asyncio.gather(
+            *(token_manager.get_access_token() for _ in range(5))
+        )
+
+        assert results == ["new_access_token..."] * 5
+
+        req.assert_awaited_once()
+        wrt.assert_awaited_once()
+
+    #
+    # all callers should see the same error, too
+    async def post_request_failed(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        await asyncio.sleep(0.01)
+        raise exc.AuthenticationFailedError("Authenticator response is invalid")
+
+    token_manager.clear_access_token()
+
+    with patch(
+        "evohomeasync2.auth.AbstractTokenManager._post_access_token_request",
+        new_callable=AsyncMock,
+        side_effect=post_request_failed,
+    ) as req:
+        errors = await asyncio.gather(
+            *(token_manager.get_access_token() for _ in range(5)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(e, exc.AuthenticationFailedError) for e in errors)
+
+        req.assert_awaited_once()
+
+    assert token_manager.is_token_valid() is False
+
+
+async def test_token_background_refresh(
+    client_session: aiohttp.ClientSession,
+    credentials: tuple[str, str],
+    cache_path: Path,
+) -> None:
+    """Test the access token is renewed in the background, before it expires."""
+
+    token_manager = TokenCacheManager(
+        *credentials, client_session, cache_path=cache_path
+    )
+
+    with pytest.raises(ValueError, match="Invalid fraction"):
+        token_manager.start_background_refresh(fraction=0.8, jitter=0.3)
+
+    with (
+        patch(
+            "evohomeasync2.auth.AbstractTokenManager._post_access_token_request",
+            new_callable=AsyncMock,
+        ) as req,
+        patch(
+            "evohome_cli.auth.TokenCacheManager.save_access_token",
+            new_callable=AsyncMock,
+        ) as wrt,
+    ):
+        req.return_value = {
+            "access_token": "new_access_token...",
+            "expires_in": 1,  # seconds, so renewals are due every ~0.1 seconds
+            "refresh_token": "new_refresh_token...",
+            "token_type": "bearer",
+        }
+
+        token_manager.start_background_refresh(fraction=0.1, jitter=0.0)
+        await asyncio.sleep(0.25)
+        await token_manager.stop_background_refresh()
+
+        assert req.await_count > 1
+        assert wrt.await_count == req.await_count
+
+        # the refresh_token is used for all renewals after the first
+        kwargs = req.await_args_list[-1].kwargs
+        assert kwargs["data"]["grant_type"] == "refresh_token"
+
+        await asyncio.sleep(0.15)  # the background task has stopped
+        assert wrt.await_count == req.await_count
+
+
+async def test_token_background_refresh_errors(
+    client_session: aiohttp.ClientSession,
+    credentials: tuple[str, str],
+    cache_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the background refresh survives errors, and logs an unexpected one."""
+
+    token_manager = TokenCacheManager(
+        *credentials, client_session, cache_path=cache_path
+    )
+
+    with (
+        patch("evohomeasync2.auth._REFRESH_RETRY_INTERVAL", 0.05),
+        patch(
+            "evohomeasync2.auth.AbstractTokenManager._post_access_token_request",
+            new_callable=AsyncMock,
+        ) as req,
+        patch(
+            "evohome_cli.auth.TokenCacheManager.save_access_token",
+            new_callable=AsyncMock,
+        ),
+        caplog.at_level(logging.WARNING),
+    ):
+        req.side_effect = responses = [
+            exc.ApiCallFailedError("Service unavailable", status=503),
+            {
+                "access_token": "new_access_token...",
+                "expires_in": 1,  # seconds, so renewals are due every ~0.1 seconds
+                "refresh_token": "new_refresh_token...",
+                "token_type": "bearer",
+            },
+            RuntimeError("Unexpected"),
+        ]
+
+        token_manager.start_background_refresh(fraction=0.1, jitter=0.0)
+        task = token_manager._refresh_task
+        assert task is not None
+
+        await asyncio.sleep(0.4)
+
+        assert req.await_count == len(responses)
+        assert task.done()
+
+    assert "Background refresh of access_token failed" in caplog.text
+    assert "Background refresh of access_token stopped unexpectedly" in caplog.text
+
+    await token_manager.stop_background_refresh()  # the task has already ended
+
+
+async def test_token_background_refresh_stops_on_close(
+    credentials: tuple[str, str],
+    cache_path: Path,
+) -> None:
+    """Test the background refresh stops once the websession is closed."""
+
+    websession = aiohttp.ClientSession()
+    token_manager = TokenCacheManager(*credentials, websession, cache_path=cache_path)
+
+    with (
+        patch(
+            "evohomeasync2.auth.AbstractTokenManager._post_access_token_request",
+            new_callable=AsyncMock,
+        ) as req,
+        patch(
+            "evohome_cli.auth.TokenCacheManager.save_access_token",
+            new_callable=AsyncMock,
+        ),
+    ):
+        req.return_value = {
+            "access_token": "new_access_token...",
+            "expires_in": 1,  # seconds, so renewals are due every ~0.1 seconds
+            "refresh_token": "new_refresh_token...",
+            "token_type": "bearer",
+        }
+
+        token_manager.start_background_refresh(fraction=0.1, jitter=0.0)
+        task = token_manager._refresh_task
+        assert task is not None
+
+        await asyncio.sleep(0.05)
+        await websession.close()
+        await asyncio.sleep(0.15)
+
+        assert task.done()
+        assert req.await_count == 1
@@ -0,0 +1,126 @@
+"""evohome-async - validate the change-sets of the status updates of the v2 entities."""
+
+from __future__ import annotations
+
+from copy import deepcopy
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from evohomeasync2 import ChangeType, StatusChange, SystemMode
+
+from .conftest import FIXTURES_V2 as FIXTURES
+
+if TYPE_CHECKING:
+    from tests.conftest import EvohomeClientV2
+
+
+@pytest.mark.parametrize("fixture_folder", [FIXTURES / "default"], ids=["default"])
+async def test_status_changes(evohome_v2: EvohomeClientV2) -> None:
+    """Test the change-set of a status update, and its listeners."""
+
+    loc = evohome_v2.locations[0]
+    tcs = evohome_v2.tcs
+    zone = tcs.zones[0]
+
+    assert loc._status_response is not None
+    status: Any = deepcopy(loc._status_response)
+
+    client_changes: list[list[StatusChange]] = []
+    zone_changes: list[list[StatusChange]] = []
+
+    evohome_v2.add_listener(client_changes.append)
+    remove_listener = zone.add_listener(zone_changes.append)
+
+    # an unchanged status has no changes, and listeners are not called...
+    assert loc._update_status(deepcopy(status)) == []
+    assert loc.last_changes() == []
+    assert client_changes == []
+    assert zone_changes == []
+
+    # a changed status has only the changes...
+    tcs_status = status["gateways"][0]["temperature_control_systems"][0]
+    old_mode = tcs.mode
+    tcs_status["system_mode_status"]["mode"] = SystemMode.AWAY
+    zon_status = tcs_status["zones"][0]
+    old_setpoint = zon_status["setpoint_status"]["target_heat_temperature"]
+    zon_status["setpoint_status"]["target_heat_temperature"] = old_setpoint + 1.0
+
+    changes = loc._update_status(deepcopy(status))
+
+    assert changes == [
+        StatusChange(tcs, ChangeType.SYSTEM_MODE, old_mode, SystemMode.AWAY),
+        StatusChange(zone, ChangeType.SETPOINT, old_setpoint, old_setpoint + 1.0),
+    ]
+
+    assert evohome_v2.last_changes() == changes
+    assert client_changes == [changes]
+    assert zone_changes == [[c for c in changes if c.entity is zone]]
+
+    # a removed listener is not called...
+    remove_listener()
+    tcs_status["system_mode_status"]["mode"] = old_mode
+
+    changes = loc._update_status(deepcopy(status))
+    assert changes == [
+        StatusChange(tcs, ChangeType.SYSTEM_MODE, SystemMode.AWAY, old_mode)
+    ]
+    assert client_changes[-1] == changes
+    assert len(zone_changes) == 1
+
+
+@pytest.mark.parametrize("fixture_folder", [FIXTURES / "default"], ids=["default"])
+async def test_status_changes_faults(evohome_v2: EvohomeClientV2) -> None:
+    """Test the change-set of a status update includes faults added/removed."""
+
+    loc = evohome_v2.locations[0]
+    zone = evohome_v2.tcs.zone_by_id["3432521"]
+
+    fault = zone.active_faults[0]
+
+    status: Any = deepcopy(loc._status_response)
+    tcs_status = status["gateways"][0]["temperature_control_systems"][0]
+    zon_status = next(z for z in tcs_status["zones"] if z["zone_id"] == zone.id)
+
+    zon_status["active_faults"] = []
+    changes = loc._update_status(deepcopy(status))
+
+    assert changes == [StatusChange(zone, ChangeType.FAULT_REMOVED, fault, None)]
+    assert zone.active_faults == ()
+
+    zon_status["active_faults"] = [fault]
+    changes = loc._update_status(deepcopy(status))
+
+    assert changes == [StatusChange(zone, ChangeType.FAULT_ADDED, None, fault)]
+
+
+@pytest.mark.parametrize("fixture_folder", [FIXTURES / "system_004"], ids=["004"])
+async def test_status_changes_offline(evohome_v2: EvohomeClientV2) -> None:
+    """Test listeners are notified when a location's gateways go offline/online."""
+
+    loc = next(loc for loc in evohome_v2.locations if loc.is_offline())
+    gwy = loc.gateways[0]
+
+    changes: list[list[StatusChange]] = []
+    loc.add_listener(changes.append)
+
+    status: Any = deepcopy(loc._status_response)
+    faults = status["gateways"][0]["active_faults"]
+
+    status["gateways"][0]["active_faults"] = []
+    loc._update_status(deepcopy(status))
+
+    assert not loc.is_offline()
+    assert [(c.entity, c.type, c.old, c.new) for c in changes[-1]] == [
+        (gwy, ChangeType.FAULT_REMOVED, faults[0], None),
+        (loc, ChangeType.OFFLINE, True, False),
+    ]
+
+    status["gateways"][0]["active_faults"] = faults
+    loc._update_status(deepcopy(status))
+
+    assert loc.is_offline()
+    assert [(c.entity, c.type, c.old, c.new) for c in changes[-1]] == [
+        (gwy, ChangeType.FAULT_ADDED, None, faults[0]),
+        (loc, ChangeType.OFFLINE, False, True),
+    ]
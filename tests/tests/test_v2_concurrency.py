@@ -0,0 +1,276 @@
+"""evohome-async - validate the concurrency of requests by the v2 EvohomeClient."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import ExitStack
+from copy import deepcopy
+from functools import partial
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from _evohome.concurrency import gather_with_limit
+from evohomeasync2 import EvohomeClient, RestoreStatus, exceptions as exc
+
+from .aioresponses import aioresponses
+from .conftest import FIXTURES_V2 as FIXTURES
+
+if TYPE_CHECKING:
+    from evohome_cli.auth import TokenCacheManager
+    from evohomeasync2 import HotWater, Zone
+    from tests.conftest import EvohomeClientV2
+
+
+class _Tracker:
+    """Track the number of calls in flight (and the most ever in flight)."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, result: object = None) -> object:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+async def test_gather_with_limit() -> None:
+    """Test awaitables are awaited concurrently, up to the limit, and in order."""
+
+    tracker = _Tracker()
+    limit = 3
+
+    results = await gather_with_limit((tracker(i) for i in range(10)), limit=limit)
+
+    assert results == list(range(10))
+    assert tracker.max_in_flight == limit
+
+    results = await gather_with_limit((tracker(i) for i in range(10)), limit=None)
+    assert tracker.max_in_flight == len(results)
+
+    with pytest.raises(ValueError, match="Invalid limit"):
+        await gather_with_limit([], limit=0)
+
+
+async def test_gather_with_limit_errors() -> None:
+    """Test a failure doesn't stop the other awaitables, and is raised afterwards."""
+
+    tracker = _Tracker()
+    first, second = exc.ApiRequestFailedError("first"), exc.ApiRequestFailedError("2")
+
+    results = [0, first, 2, 3]
+    with pytest.raises(exc.ApiRequestFailedError) as exc_info:
+        await gather_with_limit(tracker(r) for r in results)
+    assert exc_info.value is first
+
+    results = [first, 1, second, 3]
+    with pytest.raises(ExceptionGroup) as grp_info:
+        await gather_with_limit((tracker(r) for r in results), message="Failed")
+    assert grp_info.value.exceptions == (first, second)
+    assert grp_info.value.message == "Failed"
+
+
+async def test_update_locations_concurrently(
+    credentials_manager: TokenCacheManager,
+) -> None:
+    """Test the locations are updated concurrently, and all despite any failures."""
+
+    tracker = _Tracker()
+    limit = 2
+
+    updates = [AsyncMock(side_effect=tracker.__call__) for _ in range(5)]
+
+    evo = EvohomeClient(credentials_manager)
+    evo._user_locs = []  # so the config is not fetched
+    evo._locations = [Mock(update=u) for u in updates]
+
+    await evo.update(max_concurrency=limit)
+
+    assert tracker.max_in_flight == limit
+    assert all(u.await_count == 1 for u in updates)
+
+    updates[1].side_effect = exc.ApiRequestFailedError("Bad location")
+
+    with pytest.raises(exc.ApiRequestFailedError):
+        await evo.update()
+    assert all(u.await_count > 1 for u in updates)
+
+
+@pytest.mark.parametrize("fixture_folder", [FIXTURES / "default"], ids=["default"])
+async def test_get_schedules_concurrently(evohome_v2: EvohomeClientV2) -> None:
+    """Test the schedules are backed up concurrently, and in order."""
+
+    tracker = _Tracker()
+    limit = 3
+
+    tcs = evohome_v2.tcs
+    children: list[HotWater | Zone] = [*tcs.zones]
+    if tcs.hotwater:
+        children.append(tcs.hotwater)
+
+    get_schedules = {
+        c.id: AsyncMock(side_effect=partial(tracker.__call__, [])) for c in children
+    }
+    get_schedules[children[1].id].side_effect = exc.InvalidScheduleError("Bad")
+
+    with ExitStack() as stack:
+        for c in children:
+            stack.enter_context(patch.object(c, "get_schedule", get_schedules[c.id]))
+
+        schedules = await tcs.get_schedules(max_concurrency=limit)
+
+    assert tracker.max_in_flight == limit
+    assert [s.get("zone_id", s.get("dhw_id")) for s in schedules] == [
+        c.id for c in children
+    ]
+    assert all(s["daily_schedules"] == [] for s in schedules)  # incl. the bad one
+
+
+@pytest.mark.parametrize("fixture_folder", [FIXTURES / "default"], ids=["default"])
+async def test_restore_schedules_concurrently(evohome_v2: EvohomeClientV2) -> None:
+    """Test the schedules are restored concurrently, with an outcome for each."""
+
+    tracker = _Tracker()
+    limit = 2
+
+    tcs = evohome_v2.tcs
+    children: list[HotWater | Zone] = [*tcs.zones]
+    if tcs.hotwater:
+        children.append(tcs.hotwater)
+
+    schedules = await tcs.get_schedules()
+    schedules.append({"zone_id": "0000000", "name": "Unknown", "daily_schedules": []})
+
+    bad_schedule = exc.BadScheduleUploadedError("Bad")
+    set_schedules = {c.id: AsyncMock(side_effect=tracker.__call__) for c in children}
+    set_schedules[children[1].id].side_effect = bad_schedule
+
+    with ExitStack() as stack:
+        for c in children:
+            stack.enter_context(patch.object(c, "set_schedule", set_schedules[c.id]))
+
+        results = await tcs.restore_schedules(schedules, max_concurrency=limit)
+
+    assert tracker.max_in_flight == limit
+    assert [r.id for r in results] == [*(c.id for c in children), "0000000"]
+
+    expected = [RestoreStatus.SUCCESS] * len(children) + [RestoreStatus.SKIPPED]
+    expected[1] = RestoreStatus.FAILED
+    assert [r.status for r in results] == expected
+    assert results[1].error is bad_schedule
+    assert all(s.await_count == 1 for s in set_schedules.values())
+
+
+@pytest.mark.parametrize("fixture_folder", [FIXTURES / "default"], ids=["default"])
+async def test_restore_schedules_auth_error(evohome_v2: EvohomeClientV2) -> None:
+    """Test the restore of schedules stops after an authentication failure."""
+
+    tcs = evohome_v2.tcs
+    schedules = await tcs.get_schedules()
+
+    auth_error = exc.AuthenticationFailedError("Bad credentials")
+    set_schedule = AsyncMock(side_effect=auth_error)
+
+    with ExitStack() as stack:
+        for c in [*tcs.zones, *([tcs.hotwater] if tcs.hotwater else [])]:
+            stack.enter_context(patch.object(c, "set_schedule", set_schedule))
+
+        results = await tcs.restore_schedules(schedules, max_concurrency=1)
+        assert [r.status for r in results] == [RestoreStatus.FAILED] + [
+            RestoreStatus.SKIPPED
+        ] * (len(schedules) - 1)
+        assert all(r.error is auth_error for r in results)
+        assert set_schedule.await_count == 1
+
+        results = await tcs.restore_schedules(
+            schedules, max_concurrency=1, stop_on_auth_error=False
+        )
+        assert all(r.status == RestoreStatus.FAILED for r in results)
+        assert set_schedule.await_count == 1 + len(schedules)
+
+
+@pytest.mark.parametrize("fixture_folder", [FIXTURES / "default"], ids=["default"])
+async def test_restore_schedules_unauthorized(evohome_v2: EvohomeClientV2) -> None:
+    """Test the restore of schedules stops after a PUT is rejected with a 401."""
+
+    tcs = evohome_v2.tcs
+    schedules = await tcs.get_schedules()
+
+    zone = tcs.zones[0]
+    url = f"{evohome_v2.auth.url_base}/{zone._TCC_TYPE}/{zone.id}/schedule"
+
+    with aioresponses() as rsp:
+        rsp.put(url, status=HTTPStatus.UNAUTHORIZED)
+
+        results = await tcs.restore_schedules(schedules, max_concurrency=1)
+
+    assert [r.status for r in results] == [RestoreStatus.FAILED] + [
+        RestoreStatus.SKIPPED
+    ] * (len(schedules) - 1)
+
+    assert isinstance(results[0].error, exc.ApiCallFailedError)
+    assert results[0].error.status == HTTPStatus.UNAUTHORIZED
+    assert all(r.error is results[0].error for r in results)
+
+    assert sum(len(r) for r in rsp.requests.values()) == 1
+
+
+@pytest.mark.parametrize("fixture_folder", [FIXTURES / "default"], ids=["default"])
+async def test_restore_schedules_only_changed(evohome_v2: EvohomeClientV2) -> None:
+    """Test only the schedules that differ from the current schedules are restored."""
+
+    tcs = evohome_v2.tcs
+    schedules = await tcs.get_schedules()
+
+    changed: list[Any] = deepcopy(schedules)
+    changed[0]["daily_schedules"][0]["switchpoints"][0]["heat_setpoint"] = 99.0
+
+    expected = [RestoreStatus.CHANGED] + [RestoreStatus.UNCHANGED] * (
+        len(schedules) - 1
+    )
+
+    with patch("_evohome.auth.AbstractAuth.request") as mock_request:
+        results = await tcs.restore_schedules(changed, dry_run=True)
+        assert [r.status for r in results] == expected
+        assert mock_request.call_count == 0  # compared with the cached schedules
+
+        results = await tcs.restore_schedules(changed, only_changed=True)
+        expected[0] = RestoreStatus.SUCCESS
+        assert [r.status for r in results] == expected
+        assert mock_request.call_count == 1
+
+        assert await tcs.set_schedules(changed, only_changed=True) is True
+        assert mock_request.call_count == 1  # now the same as the cached schedule
+
+
+@pytest.mark.parametrize("fixture_folder", [FIXTURES / "default"], ids=["default"])
+async def test_get_schedules_failures(evohome_v2: EvohomeClientV2) -> None:
+    """Test a failed backup raises the first failure, not an ExceptionGroup."""
+
+    tcs = evohome_v2.tcs
+    children: list[HotWater | Zone] = [*tcs.zones]
+    if tcs.hotwater:
+        children.append(tcs.hotwater)
+
+    get_schedules = {c.id: AsyncMock(return_value=[]) for c in children}
+    get_schedules[children[0].id].side_effect = exc.ApiRequestFailedError("First")
+    get_schedules[children[1].id].side_effect = exc.ApiRequestFailedError("Second")
+
+    with ExitStack() as stack:
+        for c in children:
+            stack.enter_context(patch.object(c, "get_schedule", get_schedules[c.id]))
+
+        with pytest.raises(exc.ApiRequestFailedError, match="First"):
+            await tcs.get_schedules()
+
+    assert all(g.await_count == 1 for g in get_schedules.values())
@@ -0,0 +1,167 @@
+"""evohome-async - validate the planning of polls across many v2 locations."""
+
+from __future__ import annotations
+
+import asyncio
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from evohomeasync2 import BudgetPlanner, exceptions as exc
+from evohomeasync2.planner import _has_active_faults
+
+from .conftest import FIXTURES_V2 as FIXTURES
+
+if TYPE_CHECKING:
+    from evohomeasync2 import Location
+    from tests.conftest import EvohomeClientV2
+
+
+REQUESTS_PER_HOUR = 120
+MAX_INTERVAL = 3600
+FAULT_FACTOR = 2.0
+NUM_LOCATIONS = 4  # in the fixture
+OFFLINE = 2  # the index of the location with a gateway_communication_lost fault
+NUM_POLLS = 3  # the number of polls of each location
+
+
+@pytest.mark.parametrize("fixture_folder", [FIXTURES / "system_004"], ids=["004"])
+async def test_allocations(evohome_v2: EvohomeClientV2) -> None:
+    """Test the budget is allocated by priority, within the min/max intervals."""
+
+    locs = evohome_v2.locations
+    assert len(locs) == NUM_LOCATIONS
+
+    planner = BudgetPlanner(
+        REQUESTS_PER_HOUR, min_interval=60, max_interval=MAX_INTERVAL
+    )
+    planner.add_client(evohome_v2)
+    planner.add_location(locs[0], priority=6)
+
+    allocations = planner.allocations()
+
+    assert [a.location for a in allocations] == locs
+    assert sum(3600 / a.interval for a in allocations) == pytest.approx(
+        REQUESTS_PER_HOUR
+    )
+
+    # the budget is pro rata, except that a location is not polled more than min_interval
+    assert allocations[0].interval == pytest.approx(60)
+    assert allocations[1].interval == allocations[3].interval
+
+    # and a location whose gateway is offline is only probed
+    assert [a.offline for a in allocations] == [
+        i == OFFLINE for i in range(NUM_LOCATIONS)
+    ]
+    assert allocations[OFFLINE].interval == MAX_INTERVAL  # the probe_interval
+
+    # once it is back online, it is allocated its share of the budget again
+    with patch.object(locs[OFFLINE], "is_offline", return_value=False):
+        planner.record_poll(locs[OFFLINE])
+        allocation = planner.allocation(locs[OFFLINE])
+        other = planner.allocation(locs[1])
+
+    assert not allocation.offline
+    assert allocation.interval < other.interval  # as it has a fault
+
+    # the polls of the locations are spread out (are not in phase)
+    phases = [a.phase / a.interval for a in allocations]
+    assert len(set(phases)) == len(phases)
+    assert all(0 <= p < 1 for p in phases)
+
+    # without budget to spare, each location is polled every max_interval
+    planner = BudgetPlanner(1, min_interval=60, max_interval=MAX_INTERVAL)
+    planner.add_client(evohome_v2)
+
+    assert all(a.interval == MAX_INTERVAL for a in planner.allocations())
+
+    with pytest.raises(ValueError, match="Invalid requests_per_hour"):
+        BudgetPlanner(0)
+
+
+@pytest.mark.parametrize("fixture_folder", [FIXTURES / "system_004"], ids=["004"])
+async def test_allocations_volatility(evohome_v2: EvohomeClientV2) -> None:
+    """Test volatile locations, and those with faults, are allocated more polls."""
+
+    locs = evohome_v2.locations
+
+    planner = BudgetPlanner(
+        REQUESTS_PER_HOUR,
+        min_interval=1,
+        max_interval=MAX_INTERVAL,
+        fault_factor=FAULT_FACTOR,
+    )
+    planner.add_client(evohome_v2)
+
+    intervals = [a.interval for a in planner.allocations() if not a.offline]
+    assert len(set(intervals)) == 1  # the same priority, with no history
+
+    def last_changes(loc: Location) -> list[object]:
+        return [object()] * 3 if loc is locs[1] else []
+
+    with patch("evohomeasync2.location.Location.last_changes", last_changes):
+        for loc in locs:
+            planner.record_poll(loc)
+
+    allocations = {a.location: a for a in planner.allocations()}
+
+    faulty = [loc for loc in locs if _has_active_faults(loc)]
+    assert faulty  # the fixture has a gateway_communication_lost fault
+
+    for loc in locs:
+        weight = FAULT_FACTOR if loc in faulty else 1
+        if loc is locs[1]:
+            assert allocations[loc].weight > weight
+        else:
+            assert allocations[loc].weight == weight
+
+    assert allocations[locs[1]].interval < min(
+        a.interval for loc, a in allocations.items() if loc not in (*faulty, locs[1])
+    )
+
+
+@pytest.mark.parametrize("fixture_folder", [FIXTURES / "system_004"], ids=["004"])
+async def test_planner_run(evohome_v2: EvohomeClientV2) -> None:
+    """Test the planner polls each location, and stops polling removed ones."""
+
+    locs = evohome_v2.locations
+
+    planner = BudgetPlanner(
+        3600 * 100, min_interval=0.01, max_interval=0.05, probe_interval=0.02
+    )
+    planner.add_client(evohome_v2)
+
+    polls: dict[Location, int] = dict.fromkeys(locs, 0)
+    done = asyncio.Event()
+
+    async def update(self: Location) -> None:
+        polls[self] += 1
+        if polls[self] == 1 and self is locs[2]:
+            raise exc.ApiRequestFailedError("Transient")
+        if polls[self] == 1 and self is locs[3]:
+            raise exc.ApiRequestFailedError("Revoked", status=HTTPStatus.UNAUTHORIZED)
+        if all(n >= NUM_POLLS for n in polls.values()):
+            done.set()
+
+    with (
+        patch("evohomeasync2.location.Location.update", update),
+        patch.object(evohome_v2._token_manager, "clear_access_token") as clear,
+    ):
+        task = asyncio.create_task(planner.run())
+        await asyncio.wait_for(done.wait(), timeout=1)
+
+        planner.remove_location(locs[0])
+        count = polls[locs[0]]
+        await asyncio.sleep(0.1)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    assert polls[locs[0]] <= count + 1  # at most, the poll that was in flight
+
+    # a 401 cleared the (rejected) access token, so the next poll re-authenticates
+    clear.assert_called_once()
+    assert polls[locs[1]] > NUM_POLLS
@@ -0,0 +1,162 @@
+"""evohome-async - validate the adaptive polling of the status of v2 locations."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime as dt, timedelta as td
+from http import HTTPStatus
+from itertools import pairwise
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from evohomeasync2 import AdaptivePollingScheduler, ZoneMode, exceptions as exc
+from evohomeasync2.polling import predicted_events
+
+from .conftest import FIXTURES_V2 as FIXTURES
+
+if TYPE_CHECKING:
+    from tests.conftest import EvohomeClientV2
+
+
+MIN_INTERVAL = td(seconds=60)
+MAX_INTERVAL = td(seconds=900)
+EVENT_WINDOW = td(seconds=120)
+PROBE_INTERVAL = td(seconds=3600)
+
+
+@pytest.mark.parametrize("fixture_folder", [FIXTURES / "default"], ids=["default"])
+async def test_predicted_events(evohome_v2: EvohomeClientV2) -> None:
+    """Test the predicted events of a location are its zones' switchpoints, etc."""
+
+    loc = evohome_v2.locations[0]
+    tcs = evohome_v2.tcs
+
+    now = dt.now(tz=UTC)
+    end = now + td(days=1)
+
+    # without schedules, there are only the expiries of any overrides/modes
+    untils = [u for u in (tcs.until, *(z.until for z in tcs.zones)) if u]
+    untils = [u for u in untils if now <= u < end]
+    assert predicted_events(loc, now, end) == sorted(untils)
+
+    await tcs.get_schedules()
+
+    expected = [*untils]
+    for zone in tcs.zones:
+        if zone.mode != ZoneMode.PERMANENT_OVERRIDE:
+            expected += [sp[0] for sp in zone.switchpoints_between(now, end)]
+    if tcs.hotwater and tcs.hotwater.mode != ZoneMode.PERMANENT_OVERRIDE:
+        expected += [sp[0] for sp in tcs.hotwater.switchpoints_between(now, end)]
+
+    events = predicted_events(loc, now, end)
+
+    assert events == sorted(expected)
+    assert all(now <= e < end for e in events)
+
+
+@pytest.mark.parametrize("fixture_folder", [FIXTURES / "default"], ids=["default"])
+async def test_next_poll(evohome_v2: EvohomeClientV2) -> None:
+    """Test a location is polled densely near its events, and sparsely otherwise."""
+
+    loc = evohome_v2.locations[0]
+    await evohome_v2.tcs.get_schedules()
+
+    scheduler = AdaptivePollingScheduler(
+        evohome_v2,
+        min_interval=MIN_INTERVAL.total_seconds(),
+        max_interval=MAX_INTERVAL.total_seconds(),
+        event_window=EVENT_WINDOW.total_seconds(),
+    )
+
+    now = dt.now(tz=UTC)
+    events = predicted_events(loc, now, now + td(days=7))
+
+    # an event after a long stable period (e.g. the first switchpoint of the morning)
+    gap = td(hours=3)
+    prev, event = next((a, b) for a, b in pairwise(events) if b - a > gap)
+
+    start = event - EVENT_WINDOW  # the start of the event's window
+
+    # in a stable period, the polls are sparse...
+    assert scheduler.next_poll(loc, prev + gap / 2) == prev + gap / 2 + MAX_INTERVAL
+
+    # but not so sparse as to miss the start of the window of the next event...
+    assert scheduler.next_poll(loc, start - MAX_INTERVAL / 2) == start
+
+    # within the window, the polls are dense...
+    assert scheduler.next_poll(loc, start) == start + MIN_INTERVAL
+    assert scheduler.next_poll(loc, event) == event + MIN_INTERVAL
+
+    with pytest.raises(ValueError, match="Invalid min/max_interval"):
+        AdaptivePollingScheduler(evohome_v2, min_interval=60, max_interval=30)
+
+
+@pytest.mark.parametrize("fixture_folder", [FIXTURES / "system_004"], ids=["004"])
+async def test_next_poll_offline(evohome_v2: EvohomeClientV2) -> None:
+    """Test a location whose gateways are offline is only probed."""
+
+    scheduler = AdaptivePollingScheduler(
+        evohome_v2,
+        min_interval=MIN_INTERVAL.total_seconds(),
+        max_interval=MAX_INTERVAL.total_seconds(),
+        probe_interval=PROBE_INTERVAL.total_seconds(),
+    )
+
+    now = dt.now(tz=UTC)
+
+    for loc in evohome_v2.locations:
+        if loc.is_offline():
+            assert scheduler.next_poll(loc, now) == now + PROBE_INTERVAL
+        else:
+            assert scheduler.next_poll(loc, now) <= now + MAX_INTERVAL
+
+    assert any(loc.is_offline() for loc in evohome_v2.locations)
+
+
+@pytest.mark.parametrize("fixture_folder", [FIXTURES / "default"], ids=["default"])
+async def test_scheduler_run(evohome_v2: EvohomeClientV2) -> None:
+    """Test the scheduler polls each location, and survives transient failures."""
+
+    scheduler = AdaptivePollingScheduler(
+        evohome_v2, min_interval=0.005, max_interval=0.01, event_window=0
+    )
+
+    polls = [
+        exc.ApiRequestFailedError("Transient"),
+        exc.ApiRequestFailedError("Revoked", status=HTTPStatus.UNAUTHORIZED),
+        None,
+    ]
+    polled = asyncio.Event()
+
+    async def update() -> None:
+        if not polls:
+            polled.set()
+        elif isinstance(poll := polls.pop(0), Exception):
+            raise poll
+
+    with (
+        patch.object(evohome_v2.locations[0], "update", update),
+        patch.object(evohome_v2._token_manager, "clear_access_token") as clear,
+    ):
+        task = asyncio.create_task(scheduler.run())
+        await asyncio.wait_for(polled.wait(), timeout=1)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    # a 401 cleared the (rejected) access token, so the next poll re-authenticates
+    clear.assert_called_once()
+
+    # a non-transient failure stops the polling...
+    with (
+        patch.object(
+            evohome_v2.locations[0],
+            "update",
+            AsyncMock(side_effect=exc.BadUserCredentialsError("Fatal")),
+        ),
+        pytest.raises(ExceptionGroup),
+    ):
+        await scheduler.run()
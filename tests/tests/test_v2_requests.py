@@ -0,0 +1,509 @@
+"""evohome-async - validate the handling of requests by the v2 Auth class."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import voluptuous as vol
+
+from _evohome.retry import parse_retry_after
+from evohomeasync2 import (
+    AbstractRateLimiter,
+    RateLimiter,
+    ResponseCache,
+    RetryPolicy,
+    ShapeCache,
+    SystemMode,
+    exceptions as exc,
+)
+from evohomeasync2.auth import CACHE_TTLS, Auth
+from evohomeasync2.schemas.compiler import compile_schema
+from evohomeasync2.schemas.const import TccSystemMode
+from evohomeasync2.schemas.helpers import Case, factory_datetime, factory_enum
+
+from .aioresponses import aioresponses
+
+if TYPE_CHECKING:
+    from http import HTTPMethod
+
+    import aiohttp
+
+    from evohome_cli.auth import TokenCacheManager
+
+
+SCH_ACCOUNT = vol.Schema({vol.Required("user_id"): str}, extra=vol.ALLOW_EXTRA)
+
+
+async def _make_request(
+    method: HTTPMethod, url: str, /, **kwargs: Any
+) -> dict[str, Any]:
+    """Return the response to a request, after a (short) delay."""
+    await asyncio.sleep(0.01)  # so that other callers arrive while in flight
+    return {"userId": "2263181", "username": "nobody@nowhere.com"}
+
+
+async def test_get_coalesces_requests(
+    client_session: aiohttp.ClientSession,
+    credentials_manager: TokenCacheManager,
+) -> None:
+    """Test concurrent GETs of the same URL share a single request."""
+
+    auth = Auth(credentials_manager, client_session)
+
+    with patch(
+        "_evohome.auth.AbstractAuth._make_request",
+        new_callable=AsyncMock,
+        side_effect=_make_request,
+    ) as req:
+        results = await asyncio.gather(
+            *(auth.get("userAccount", schema=SCH_ACCOUNT) for _ in range(5)),
+            auth.get("location/2738909/status", schema=SCH_ACCOUNT),
+        )
+
+        # one request per distinct URL
+        assert [c.args[1] for c in req.await_args_list] == [
+            "userAccount",
+            "location/2738909/status",
+        ]
+        assert all(r["user_id"] == "2263181" for r in results)
+
+        # each caller gets its own (validated) copy of the response
+        assert len({id(r) for r in results}) == len(results)
+
+        # a GET that isn't concurrent with another makes its own request
+        await auth.get("userAccount", schema=SCH_ACCOUNT)
+
+        assert [c.args[1] for c in req.await_args_list] == [
+            "userAccount",
+            "location/2738909/status",
+            "userAccount",
+        ]
+
+
+async def test_get_coalesces_errors(
+    client_session: aiohttp.ClientSession,
+    credentials_manager: TokenCacheManager,
+) -> None:
+    """Test an error from a coalesced GET is raised to every caller."""
+
+    async def make_request(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        await asyncio.sleep(0.01)
+        raise exc.ApiCallFailedError("GET userAccount: 503 Service Unavailable")
+
+    auth = Auth(credentials_manager, client_session)
+
+    with patch(
+        "_evohome.auth.AbstractAuth._make_request",
+        new_callable=AsyncMock,
+        side_effect=make_request,
+    ) as req:
+        errors = await asyncio.gather(
+            *(auth.get("userAccount", schema=SCH_ACCOUNT) for _ in range(5)),
+            return_exceptions=True,
+        )
+
+        req.assert_awaited_once()
+        assert all(isinstance(e, exc.ApiCallFailedError) for e in errors)
+
+    # a schema failure is raised only to the caller whose schema failed
+    with patch(
+        "_evohome.auth.AbstractAuth._make_request",
+        new_callable=AsyncMock,
+        side_effect=_make_request,
+    ) as req:
+        results = await asyncio.gather(
+            auth.get("userAccount", schema=SCH_ACCOUNT),
+            auth.get("userAccount", schema=vol.Schema({"user_id": int})),
+            return_exceptions=True,
+        )
+
+        req.assert_awaited_once()
+        assert isinstance(results[0], dict)
+        assert isinstance(results[1], exc.BadApiSchemaError)
+
+
+class _CountingRateLimiter(AbstractRateLimiter):
+    """A rate limiter that counts its use (and doesn't limit anything)."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.requests = 0
+
+    async def acquire(self) -> None:
+        self.in_flight += 1
+        self.requests += 1
+
+    def release(self) -> None:
+        self.in_flight -= 1
+
+
+async def test_rate_limiter_token_bucket() -> None:
+    """Test the token bucket allows a burst, then limits the rate of requests."""
+
+    limiter = RateLimiter(requests_per_minute=600, burst=2)  # 1 per 0.1 seconds
+
+    start = time.monotonic()
+    for _ in range(4):
+        async with limiter:
+            pass
+
+    # the burst is immediate, then two more requests at 0.1 second intervals
+    assert time.monotonic() - start == pytest.approx(0.2, abs=0.05)
+
+
+async def test_rate_limiter_max_in_flight() -> None:
+    """Test the rate limiter caps the number of requests in flight."""
+
+    max_in_flight = 2
+    limiter = RateLimiter(max_in_flight=max_in_flight)
+
+    in_flight = peak = 0
+
+    async def request() -> None:
+        nonlocal in_flight, peak
+
+        async with limiter:
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    await asyncio.gather(*(request() for _ in range(5)))
+
+    assert peak == max_in_flight
+
+
+async def test_rate_limiter_is_used(
+    client_session: aiohttp.ClientSession,
+    credentials_manager: TokenCacheManager,
+) -> None:
+    """Test the rate limiter is used for every request, even if it fails."""
+
+    limiter = _CountingRateLimiter()
+    auth = Auth(credentials_manager, client_session, rate_limiter=limiter)
+
+    with aioresponses() as rsp:
+        rsp.get(f"{auth.url_base}/userAccount", payload={"userId": "2263181"})
+
+        await auth.get("userAccount", schema=SCH_ACCOUNT)
+
+        with pytest.raises(exc.ApiCallFailedError):  # connection refused
+            await auth.get("userAccount", schema=SCH_ACCOUNT)
+
+    assert limiter.requests == len(
+        rsp.requests[("GET", f"{auth.url_base}/userAccount")]
+    )
+    assert limiter.in_flight == 0
+
+    with pytest.raises(ValueError, match="Invalid max_in_flight"):
+        RateLimiter(max_in_flight=0)
+
+
+async def test_retry_policy_gets(
+    client_session: aiohttp.ClientSession,
+    credentials_manager: TokenCacheManager,
+) -> None:
+    """Test GETs that fail for transient reasons are retried, as per the policy."""
+
+    max_attempts = 3
+    auth = Auth(
+        credentials_manager,
+        client_session,
+        retry_policy=RetryPolicy(max_attempts=max_attempts, backoff=0.01),
+    )
+    url = f"{auth.url_base}/userAccount"
+
+    with aioresponses() as rsp:
+        rsp.get(url, status=HTTPStatus.SERVICE_UNAVAILABLE)
+        rsp.get(url, status=HTTPStatus.BAD_GATEWAY)
+        rsp.get(url, payload={"userId": "2263181"})
+
+        result = await auth.get("userAccount", schema=SCH_ACCOUNT)
+
+    assert result["user_id"] == "2263181"
+    assert auth.stats == {"requests": 3, "retries": 2}
+
+    # gives up after max_attempts (a refused connection is retryable)
+    with aioresponses() as rsp, pytest.raises(exc.ApiCallFailedError) as err:
+        await auth.get("userAccount", schema=SCH_ACCOUNT)
+
+    assert err.value.status is None
+    assert len(rsp.requests[("GET", url)]) == max_attempts
+
+    # a 404 is not transient, so is not retried
+    with aioresponses() as rsp:
+        rsp.get(url, status=HTTPStatus.NOT_FOUND)
+
+        with pytest.raises(exc.ApiCallFailedError) as err:
+            await auth.get("userAccount", schema=SCH_ACCOUNT)
+
+    assert err.value.status == HTTPStatus.NOT_FOUND
+    assert len(rsp.requests[("GET", url)]) == 1
+
+
+async def test_retry_policy_retry_after(
+    client_session: aiohttp.ClientSession,
+    credentials_manager: TokenCacheManager,
+) -> None:
+    """Test a Retry-After header is honoured (unless it would stall the caller)."""
+
+    auth = Auth(
+        credentials_manager,
+        client_session,
+        retry_policy=RetryPolicy(backoff=0.01, max_backoff=1),
+    )
+    url = f"{auth.url_base}/userAccount"
+
+    with aioresponses() as rsp:
+        rsp.get(
+            url,
+            status=HTTPStatus.TOO_MANY_REQUESTS,
+            headers={"Retry-After": "0.2"},
+        )
+        rsp.get(url, payload={"userId": "2263181"})
+
+        start = time.monotonic()
+        await auth.get("userAccount", schema=SCH_ACCOUNT)
+
+    assert time.monotonic() - start == pytest.approx(0.2, abs=0.05)
+
+    retry_after = 3600  # seconds, much longer than max_backoff
+
+    with aioresponses() as rsp:
+        rsp.get(
+            url,
+            status=HTTPStatus.TOO_MANY_REQUESTS,
+            headers={"Retry-After": str(retry_after)},
+        )
+
+        with pytest.raises(exc.ApiCallFailedError) as err:
+            await auth.get("userAccount", schema=SCH_ACCOUNT)
+
+    assert err.value.status == HTTPStatus.TOO_MANY_REQUESTS
+    assert err.value.retry_after == retry_after
+    assert len(rsp.requests[("GET", url)]) == 1
+
+
+async def test_retry_policy_puts(
+    client_session: aiohttp.ClientSession,
+    credentials_manager: TokenCacheManager,
+) -> None:
+    """Test PUTs are not retried, unless explicitly opted in."""
+
+    url = "temperatureZone/3432576/heatSetpoint"
+    mode = {"setpoint_mode": "PermanentOverride", "heat_setpoint_value": 20.5}
+
+    for retry_puts in (False, True):
+        auth = Auth(
+            credentials_manager,
+            client_session,
+            retry_policy=RetryPolicy(backoff=0.01, retry_puts=retry_puts),
+        )
+
+        with aioresponses() as rsp:
+            rsp.put(f"{auth.url_base}/{url}", status=HTTPStatus.SERVICE_UNAVAILABLE)
+            rsp.put(f"{auth.url_base}/{url}", payload={"id": "1234567"})
+
+            if retry_puts:
+                await auth.put(url, json=mode)
+            else:
+                with pytest.raises(exc.ApiCallFailedError):
+                    await auth.put(url, json=mode)
+
+        assert auth.stats.get("retries", 0) == int(retry_puts)
+
+
+def test_parse_retry_after() -> None:
+    """Test the parsing of Retry-After headers (either seconds, or an HTTP-date)."""
+
+    assert parse_retry_after("1") == 1
+    assert parse_retry_after("-1") == 0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0  # in the past
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+async def test_response_cache(
+    client_session: aiohttp.ClientSession,
+    credentials_manager: TokenCacheManager,
+) -> None:
+    """Test GETs of cacheable URLs are served from the cache, until invalidated."""
+
+    auth = Auth(
+        credentials_manager, client_session, response_cache=ResponseCache(CACHE_TTLS)
+    )
+
+    url = "temperatureZone/3432576/schedule"
+    schedule: dict[str, list[Any]] = {"dailySchedules": []}
+
+    with aioresponses() as rsp:
+        rsp.get(f"{auth.url_base}/{url}", payload=schedule)
+        rsp.get(f"{auth.url_base}/{url}", payload=schedule)
+        rsp.put(f"{auth.url_base}/{url}", payload={"id": "1234567"})
+
+        await auth.get(url, schema=vol.Schema(dict))
+        await auth.get(url, schema=vol.Schema(dict))  # from the cache
+
+        assert len(rsp.requests[("GET", f"{auth.url_base}/{url}")]) == 1
+
+        await auth.put(url, json={"daily_schedules": []})  # invalidates the GET
+        await auth.get(url, schema=vol.Schema(dict))  # not from the cache
+
+    # status URLs are not cacheable, so are neither a hit nor a miss
+    with aioresponses() as rsp:
+        rsp.get(f"{auth.url_base}/location/2738909/status", payload={})
+        await auth.get("location/2738909/status", schema=vol.Schema(dict))
+
+    assert auth.stats == {"requests": 4, "cache_hits": 1, "cache_misses": 2}
+
+
+async def test_response_cache_put_during_get(
+    client_session: aiohttp.ClientSession,
+    credentials_manager: TokenCacheManager,
+) -> None:
+    """Test a GET in flight during a PUT of the same URL doesn't cache its response."""
+
+    auth = Auth(
+        credentials_manager, client_session, response_cache=ResponseCache(CACHE_TTLS)
+    )
+
+    url = "temperatureZone/3432576/schedule"
+    schedules = iter([{"old": True}, {"new": True}])  # before/after the PUT
+    in_flight, put_done = asyncio.Event(), asyncio.Event()
+
+    async def request(self: Any, method: HTTPMethod, url: str, **kwargs: Any) -> Any:
+        if method == "PUT":
+            return {"id": "1234567"}
+
+        response = next(schedules)
+        in_flight.set()
+        await put_done.wait()  # so the (old) response arrives after the PUT
+        return response
+
+    with patch("_evohome.auth.AbstractAuth.request", request):
+        task = asyncio.create_task(auth.get(url, schema=vol.Schema(dict)))
+        await in_flight.wait()
+
+        await auth.put(url, json={"daily_schedules": []})
+        put_done.set()
+
+        assert await task == {"old": True}  # this caller gets the response anyway...
+        assert await auth.get(url, schema=vol.Schema(dict)) == {"new": True}
+        assert await auth.get(url, schema=vol.Schema(dict)) == {"new": True}
+
+    assert auth.stats["cache_hits"] == 1  # only the last GET
+
+
+def test_response_cache_eviction() -> None:
+    """Test the cache expires entries after their TTL, and evicts the LRU entries."""
+
+    cache = ResponseCache({r"^short": 0, r"^long": 3600}, max_size=2)
+
+    cache.set("short/1", {})
+    assert cache.get("short/1") is None  # has expired
+
+    cache.set("long/1", {"id": 1})
+    cache.set("long/2", {"id": 2})
+    assert cache.get("long/1") == {"id": 1}  # now long/2 is least recently used
+
+    cache.set("long/3", {"id": 3})
+    assert cache.get("long/2") is None  # was evicted
+    assert list(cache._entries) == ["long/1", "long/3"]
+
+    cache.set("other/1", {})  # is not cacheable
+    assert cache.get("other/1") is None
+
+    cache.invalidate(r"/3$")
+    assert cache.get("long/3") is None
+    assert cache.get("long/1") == {"id": 1}
+
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+SCH_MODE = compile_schema(
+    vol.Schema(
+        {
+            vol.Required("system_mode"): factory_enum(Case.PYTHONIC, TccSystemMode),
+            vol.Required("is_permanent"): bool,
+            vol.Optional("time_until"): factory_datetime(Case.PYTHONIC),
+        }
+    )
+)
+
+
+def test_shape_cache() -> None:
+    """Test responses are validated in full only if their shape changes (or so often)."""
+
+    cache = ShapeCache(revalidate_every=3)
+    url = "temperatureControlSystem/2738909/status"
+
+    response = {"system_mode": "Auto", "is_permanent": True}
+    results = [cache.validate(url, response, SCH_MODE) for _ in range(4)]
+
+    assert results == [SCH_MODE(response)] * len(results)
+    assert results[0] == {"system_mode": SystemMode.AUTO, "is_permanent": True}
+    assert (cache.hits, cache.misses) == (2, 2)  # the 4th poll was revalidated
+
+    # a change of value (but not of shape) is coerced, and needn't be revalidated
+    response = {"system_mode": "AutoWithEco", "is_permanent": False}
+    assert cache.validate(url, response, SCH_MODE) == SCH_MODE(response)
+    assert (cache.hits, cache.misses) == (3, 2)
+
+    # a change of shape is validated in full
+    response |= {"time_until": "2024-07-10T21:10:00Z"}
+    assert cache.validate(url, response, SCH_MODE) == SCH_MODE(response)
+    assert (cache.hits, cache.misses) == (3, 3)
+
+    # an invalid value is caught, even if the shape is unchanged
+    response |= {"system_mode": "Bogus"}
+    with pytest.raises(vol.Invalid):
+        cache.validate(url, response, SCH_MODE)
+
+    # schemas that aren't compiled are always validated in full
+    assert cache.validate(url, response, vol.Schema(dict)) == response
+    assert (cache.hits, cache.misses) == (3, 3)
+
+
+async def test_shape_cache_is_used(
+    client_session: aiohttp.ClientSession,
+    credentials_manager: TokenCacheManager,
+) -> None:
+    """Test the v2 Auth class validates GET responses via its shape cache."""
+
+    auth = Auth(credentials_manager, client_session, shape_cache=ShapeCache())
+
+    url = "temperatureControlSystem/2738909/status"
+
+    with aioresponses() as rsp:
+        rsp.get(
+            f"{auth.url_base}/{url}",
+            payload={"systemMode": "Auto", "isPermanent": True},
+        )
+        rsp.get(
+            f"{auth.url_base}/{url}",
+            payload={"systemMode": "Away", "isPermanent": True},
+        )
+        rsp.get(
+            f"{auth.url_base}/{url}",
+            payload={"systemMode": "Bogus", "isPermanent": True},
+        )
+
+        assert await auth.get(url, schema=SCH_MODE) == {
+            "system_mode": SystemMode.AUTO,
+            "is_permanent": True,
+        }
+        assert await auth.get(url, schema=SCH_MODE) == {
+            "system_mode": SystemMode.AWAY,
+            "is_permanent": True,
+        }
+
+        with pytest.raises(exc.BadApiSchemaError):
+            await auth.get(url, schema=SCH_MODE)
+
+    assert auth.stats == {"requests": 3, "shape_hits": 1, "shape_misses": 1}
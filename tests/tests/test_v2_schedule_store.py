@@ -0,0 +1,205 @@
+"""evohome-async - validate the persistence of schedules by the v2 EvohomeClient."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from copy import deepcopy
+from datetime import UTC, datetime as dt, timedelta as td
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import pytest
+
+from evohomeasync2 import (
+    AbstractScheduleStore,
+    EvohomeClient,
+    RestoreStatus,
+    exceptions as exc,
+)
+
+from .conftest import FIXTURES_V2 as FIXTURES
+
+if TYPE_CHECKING:
+    from evohomeasync2 import ControlSystem, HotWater, Zone
+    from tests.conftest import EvohomeClientV2
+
+
+class _ScheduleStore(AbstractScheduleStore):
+    """A schedule store that persists to a JSON string (rather than to a file)."""
+
+    def __init__(self, content: str = "{}", **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.content = content
+        self.saves = 0
+
+    async def load_schedules(self) -> None:
+        self._import_schedules(json.loads(self.content))
+
+    async def save_schedules(self) -> None:
+        self.content = json.dumps(self._export_schedules())
+        self.saves += 1
+
+
+async def _restart(evo: EvohomeClient, store: AbstractScheduleStore) -> EvohomeClient:
+    """Return a new client with a (loaded) schedule store, e.g. after a restart."""
+
+    new = EvohomeClient(evo._token_manager, schedule_store=store)
+    await new.update(dont_update_status=True)  # instantiates the zones/DHW
+    return new
+
+
+@pytest.mark.parametrize("fixture_folder", [FIXTURES / "default"], ids=["default"])
+async def test_schedule_store(evohome_v2: EvohomeClientV2) -> None:
+    """Test a stored schedule is used (instead of a GET) until it is stale."""
+
+    store = evohome_v2.schedule_store = _ScheduleStore()
+    zone = evohome_v2.tcs.zones[0]
+
+    schedule = await zone.get_schedule()  # a GET, then saved
+
+    assert store.get(zone.id) == schedule
+    assert store.is_fresh(zone.id)
+    assert store.saves == 1
+
+    with patch("evohomeasync2.auth.Auth.get") as mock_get:
+        assert await zone.get_schedule() == schedule
+    assert mock_get.call_count == 0
+
+    # reading the schedule doesn't restore it from a store (it is a plain read)...
+    other = evohome_v2.tcs.zones[1]
+    store._import_schedules({other.id: store._export_schedules()[zone.id]})
+
+    with pytest.raises(exc.InvalidScheduleError):
+        _ = other.schedule
+
+    # after a restart, the (persisted) schedule is available without a GET...
+    new_store = _ScheduleStore(store.content)
+    await new_store.load_schedules()
+
+    zone = (await _restart(evohome_v2, new_store)).tcs.zones[0]
+
+    assert zone.schedule == schedule
+    assert zone.this_switchpoint[0] < dt.now(tz=UTC) < zone.next_switchpoint[0]
+
+    # once stale, the schedule is got (and saved) again...
+    new_store = _ScheduleStore(store.content, ttl=td(0))
+    await new_store.load_schedules()
+
+    zone = (await _restart(evohome_v2, new_store)).tcs.zones[0]
+
+    assert await zone.get_schedule() == schedule
+    assert new_store.saves == 1
+
+    # setting a schedule makes the stored schedule stale...
+    saves = new_store.saves
+
+    with patch("_evohome.auth.AbstractAuth.request"):
+        await zone.set_schedule(schedule)
+
+    assert new_store.get(zone.id) is None
+    assert new_store.saves == saves + 1
+
+
+@pytest.mark.parametrize("fixture_folder", [FIXTURES / "default"], ids=["default"])
+async def test_schedule_store_import(evohome_v2: EvohomeClientV2) -> None:
+    """Test only newer schedules are imported, and invalid schedules are ignored."""
+
+    store = evohome_v2.schedule_store = _ScheduleStore()
+    zone = evohome_v2.tcs.zones[0]
+
+    schedule = await zone.get_schedule()
+    fetched = store.fetched(zone.id)
+    assert fetched is not None
+
+    older = (fetched - td(hours=1)).isoformat()
+    store._import_schedules({zone.id: {"daily_schedules": [], "fetched": older}})
+    assert store.get(zone.id) == schedule
+
+    newer = (fetched + td(hours=1)).isoformat()
+    store._import_schedules({zone.id: {"daily_schedules": [{}], "fetched": newer}})
+    assert store.get(zone.id) == [{}]
+
+    zone = (await _restart(evohome_v2, store)).tcs.zones[0]
+
+    with pytest.raises(exc.InvalidScheduleError):
+        _ = zone.this_switchpoint
+    assert store.get(zone.id) is None  # the invalid schedule was discarded
+
+
+@pytest.mark.parametrize("fixture_folder", [FIXTURES / "default"], ids=["default"])
+async def test_schedule_store_only_changed(evohome_v2: EvohomeClientV2) -> None:
+    """Test only_changed/dry_run compare with the server, if the store is stale."""
+
+    tcs = evohome_v2.tcs
+    schedule = await tcs.zones[0].get_schedule()  # the server's schedule
+
+    zone = tcs.zones[1]  # its schedule has not been got by this client
+    changed: list[Any] = deepcopy(schedule)  # e.g. the server's, before an edit
+    changed[0]["switchpoints"][0]["heat_setpoint"] += 1.0
+
+    restore: list[Any] = [
+        {"zone_id": zone.id, "name": zone.name, "daily_schedules": changed}
+    ]
+
+    async def load_store(age: td) -> ControlSystem:
+        fetched = (dt.now(tz=UTC) - age).isoformat()
+        content = {zone.id: {"daily_schedules": changed, "fetched": fetched}}
+
+        store = _ScheduleStore(json.dumps(content))
+        await store.load_schedules()
+
+        tcs = (await _restart(evohome_v2, store)).tcs
+        assert tcs.zones[1].schedule == changed  # the stored schedule is used
+        return tcs
+
+    # a stale stored schedule is not trusted, so the server's schedule is got...
+    tcs = await load_store(td(hours=2))
+    results = await tcs.restore_schedules(restore, dry_run=True)
+    assert results[0].status == RestoreStatus.CHANGED
+
+    # a fresh stored schedule is trusted...
+    tcs = await load_store(td(0))
+    results = await tcs.restore_schedules(restore, dry_run=True)
+    assert results[0].status == RestoreStatus.UNCHANGED
+
+
+@pytest.mark.parametrize("fixture_folder", [FIXTURES / "default"], ids=["default"])
+async def test_schedule_store_saves(evohome_v2: EvohomeClientV2) -> None:
+    """Test the store is saved once per batch, and that saves never overlap."""
+
+    class SlowStore(_ScheduleStore):
+        in_flight = max_in_flight = 0
+
+        async def save_schedules(self) -> None:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.01)
+            await super().save_schedules()
+            self.in_flight -= 1
+
+    tcs = evohome_v2.tcs
+    children: list[HotWater | Zone] = [*tcs.zones]
+    if tcs.hotwater:
+        children.append(tcs.hotwater)
+
+    # a backup saves the store once, not once per zone/dhw...
+    store = evohome_v2.schedule_store = SlowStore()
+
+    schedules = await tcs.get_schedules()
+    assert len(store) == len(children)
+    assert store.saves == 1
+
+    # as does a restore...
+    with patch("_evohome.auth.AbstractAuth.request"):
+        await tcs.restore_schedules(schedules)
+    assert len(store) == 0
+    assert store.saves == 2  # noqa: PLR2004
+
+    # outside of a batch, concurrent saves are serialized (and coalesced)...
+    store = evohome_v2.schedule_store = SlowStore()
+
+    await asyncio.gather(*(c.get_schedule() for c in children))
+    assert len(store) == len(children)
+    assert store.max_in_flight == 1
+    assert store.saves < len(children)
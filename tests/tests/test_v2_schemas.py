@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import json
+from copy import deepcopy
 from pathlib import Path
 
 import pytest
-
-from evohomeasync2.schemas.account import TCC_GET_USR_ACCOUNT
-from evohomeasync2.schemas.config import TCC_GET_USR_LOCATIONS
+import voluptuous as vol
+
+from _evohome.helpers import convert_keys_to_snake_case
+from evohomeasync2.schemas.account import TCC_GET_USR_ACCOUNT, factory_user_account
+from evohomeasync2.schemas.compiler import compile_schema
+from evohomeasync2.schemas.config import (
+    TCC_GET_USR_LOCATIONS,
+    factory_user_locations_installation_info,
+)
+from evohomeasync2.schemas.helpers import Case
 from evohomeasync2.schemas.status import factory_loc_status
 
 from .common import assert_schema
@@ -46,3 +55,64 @@ def test_location_status(fixture_folder: Path) -> None:
 
     for p in Path(fixture_folder).glob("status_*.json"):
         assert_schema(fixture_folder, SCH_STATUS, p.name)
+
+
+def test_compiled_schemas(fixture_folder: Path) -> None:
+    """Test the compiled schemas give the same results as the original schemas."""
+
+    factories = {
+        "user_account.json": factory_user_account,
+        "user_locations.json": factory_user_locations_installation_info,
+    } | {p.name: factory_loc_status for p in fixture_folder.glob("status_*.json")}
+
+    for file_name, factory in factories.items():
+        if not (path := fixture_folder / file_name).is_file():
+            continue
+
+        with path.open() as f:
+            data = json.load(f)
+
+        for case, json_ in (
+            (Case.VENDOR, data),
+            (Case.PYTHONIC, convert_keys_to_snake_case(data)),
+        ):
+            schema = factory(case)
+            compiled = compile_schema(schema)
+
+            assert compiled.validator(json_) == schema(json_)
+            assert compiled.coerce(json_)[0] == schema(json_)
+
+
+def test_compiled_schema_errors(fixture_folder: Path) -> None:
+    """Test the compiled schemas raise the same errors as the original schemas."""
+
+    schema = factory_loc_status()
+
+    for p in fixture_folder.glob("status_*.json"):
+        with p.open() as f:
+            data = json.load(f)
+
+        for key, value in (
+            (
+                "setpointStatus",
+                {"setpointMode": "Bogus", "targetHeatTemperature": 21.0},
+            ),
+            ("name", None),
+            ("unexpectedKey", True),
+        ):
+            bad_data = deepcopy(data)
+            for gwy in bad_data["gateways"]:
+                for tcs in gwy["temperatureControlSystems"]:
+                    for zone in tcs["zones"]:
+                        zone[key] = value
+
+            if bad_data == data:  # there are no zones
+                continue
+
+            with pytest.raises(vol.Invalid) as exc_info:
+                schema(bad_data)
+
+            with pytest.raises(vol.Invalid) as compiled_exc_info:
+                compile_schema(schema)(bad_data)
+
+            assert str(compiled_exc_info.value) == str(exc_info.value)
@@ -0,0 +1,258 @@
+"""evohome-async - validate the export/import of snapshots by the v2 EvohomeClient."""
+
+from __future__ import annotations
+
+import json
+import logging
+from copy import deepcopy
+from datetime import UTC, datetime as dt, timedelta as td
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import pytest
+
+from _evohome.auth import AbstractAuth
+from _evohome.response_cache import ResponseCache
+from evohomeasync2 import EvohomeClient, exceptions as exc
+from evohomeasync2.auth import CACHE_TTLS
+
+from .conftest import FIXTURES_V2 as FIXTURES, auth_get
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from evohomeasync2 import StatusChange
+    from tests.conftest import EvohomeClientV2
+
+
+@pytest.mark.parametrize("fixture_folder", [FIXTURES / "default"], ids=["default"])
+async def test_config_snapshot(
+    evohome_v2: EvohomeClientV2, fixture_folder: Path
+) -> None:
+    """Test the entity tree is instantiated from a config snapshot, sans API calls."""
+
+    snapshot = json.loads(json.dumps(evohome_v2.export_config()))
+
+    evo = EvohomeClient(evohome_v2._token_manager)
+
+    with patch("_evohome.auth.AbstractAuth.request") as mock_request:
+        await evo.import_config(snapshot)
+    assert mock_request.call_count == 0
+
+    assert evo.user_account == evohome_v2.user_account
+    assert [z.id for z in evo.tcs.zones] == [z.id for z in evohome_v2.tcs.zones]
+    assert evo.tcs.zones[0].name == evohome_v2.tcs.zones[0].name
+    assert evo.export_config() == snapshot
+
+    # a refresh of an unchanged config retains the entities...
+    tcs = evo.tcs
+
+    with patch("evohomeasync2.auth.Auth.get", auth_get(fixture_folder)):
+        assert await evo.refresh_config() is False
+    assert evo.tcs is tcs
+
+    # a refresh of a changed config re-instantiates the entities...
+    changed: dict[str, Any] = deepcopy(snapshot)
+    changed["user_locations"][0]["gateways"][0]["temperature_control_systems"][0][
+        "zones"
+    ][0]["name"] = "Renamed"
+
+    await evo.import_config(changed)
+    assert evo.tcs.zones[0].name == "Renamed"
+
+    with patch("evohomeasync2.auth.Auth.get", auth_get(fixture_folder)):
+        assert await evo.refresh_config() is True
+    assert evo.tcs.zones[0].name == evohome_v2.tcs.zones[0].name
+
+
+@pytest.mark.parametrize("fixture_folder", [FIXTURES / "default"], ids=["default"])
+async def test_config_refresh_cached(evohome_v2: EvohomeClientV2) -> None:
+    """Test a refresh of the config is never served from the response cache."""
+
+    snapshot = json.loads(json.dumps(evohome_v2.export_config()))
+
+    cache = ResponseCache(CACHE_TTLS)
+    evo = EvohomeClient(evohome_v2._token_manager, response_cache=cache)
+    await evo.import_config(snapshot)
+
+    # the cache has a (fresh, but now stale) config, e.g. from an earlier GET...
+    user_id = snapshot["user_account"]["user_id"]
+    url = f"location/installationInfo?userId={user_id}&includeTemperatureControlSystems=True"
+
+    cache.set("userAccount", snapshot["user_account"])
+    cache.set(url, snapshot["user_locations"])
+
+    # but the vendor has a changed config...
+    changed: dict[str, Any] = deepcopy(snapshot)
+    changed["user_locations"][0]["gateways"][0]["temperature_control_systems"][0][
+        "zones"
+    ][0]["name"] = "Renamed"
+
+    responses = {"userAccount": changed["user_account"], url: changed["user_locations"]}
+
+    async def request(self: Any, method: str, url: str, **kwargs: Any) -> Any:
+        return deepcopy(responses[url])
+
+    # NOTE: the fixture patches Auth.get(), which would bypass the response cache
+    with (
+        patch("evohomeasync2.auth.Auth.get", AbstractAuth.get),
+        patch("_evohome.auth.AbstractAuth.request", request),
+    ):
+        assert await evo.refresh_config() is True
+    assert evo.tcs.zones[0].name == "Renamed"
+
+    assert cache.hits == 0
+
+
+@pytest.mark.parametrize("fixture_folder", [FIXTURES / "default"], ids=["default"])
+async def test_config_snapshot_invalid(evohome_v2: EvohomeClientV2) -> None:
+    """Test an invalid config snapshot (or one of another version) is rejected."""
+
+    snapshot: dict[str, Any] = dict(evohome_v2.export_config())
+    evo = EvohomeClient(evohome_v2._token_manager)
+
+    with pytest.raises(exc.InvalidConfigError):
+        await evo.import_config(snapshot | {"version": 0})
+
+    with pytest.raises(exc.InvalidConfigError):
+        await evo.import_config(snapshot | {"user_locations": [{}]})
+
+    with pytest.raises(exc.InvalidConfigError):
+        _ = evo.locations  # nothing was imported
+
+
+@pytest.mark.parametrize("fixture_folder", [FIXTURES / "default"], ids=["default"])
+async def test_state_snapshot(
+    evohome_v2: EvohomeClientV2, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the state of the entities is restored from a snapshot, sans API calls."""
+
+    zone = evohome_v2.tcs.zones[0]
+    await zone.get_schedule()
+
+    expires = (dt.now(tz=UTC) + td(hours=1)).isoformat()
+    assert evohome_v2._token_manager.import_access_token(
+        {
+            "access_token": "new_access_token...",
+            "access_token_expires": expires,
+            "refresh_token": "new_refresh_token...",
+        }
+    )
+
+    # by default, the snapshot has only the expiry of the tokens (not the secrets)...
+    snapshot: dict[str, Any] = json.loads(json.dumps(evohome_v2.export_state()))
+    assert snapshot["access_token_expires"] == expires
+    assert snapshot["access_token"] is None
+
+    snapshot = json.loads(json.dumps(evohome_v2.export_state(include_tokens=True)))
+    assert snapshot["access_token"]["access_token"] == "new_access_token..."  # noqa: S105
+
+    evo = EvohomeClient(evohome_v2._token_manager)
+
+    with (
+        patch("_evohome.auth.AbstractAuth.request") as mock_request,
+        caplog.at_level(logging.WARNING),
+    ):
+        await evo.import_state(snapshot)
+    assert mock_request.call_count == 0
+
+    # the active faults were logged (by evohome_v2) less than a day ago
+    assert not [r for r in caplog.records if "Active fault" in r.message]
+
+    for restored, entity in zip(evo._entities(), evohome_v2._entities(), strict=True):
+        assert restored.status == entity.status
+
+    assert evo.tcs.active_faults == evohome_v2.tcs.active_faults
+    assert evo.tcs.zones[0].schedule == zone.schedule
+    assert evo.tcs.zones[0].this_switchpoint == zone.this_switchpoint
+
+    assert evo.export_state(include_tokens=True) == snapshot
+
+    # the entities are keyed by type, as (e.g.) a TCS and its gateway may share an id
+    assert list(snapshot["entities"]) == [
+        "location",
+        "gateway",
+        "temperatureControlSystem",
+        "temperatureZone",
+        "domesticHotWater",
+    ]
+
+    # active faults last logged over a day ago are logged again...
+    logged = (dt.now(tz=UTC) - td(days=2)).isoformat()
+    for state in (s for by_id in snapshot["entities"].values() for s in by_id.values()):
+        if "last_logged" in state:
+            state["last_logged"] = dict.fromkeys(state["last_logged"], logged)
+
+    caplog.clear()
+    evo = EvohomeClient(evohome_v2._token_manager)
+
+    with caplog.at_level(logging.WARNING):
+        await evo.import_state(snapshot)
+
+    assert [r for r in caplog.records if "Active fault" in r.message]
+
+
+@pytest.mark.parametrize("fixture_folder", [FIXTURES / "default"], ids=["default"])
+async def test_state_snapshot_invalid(evohome_v2: EvohomeClientV2) -> None:
+    """Test an invalid state snapshot (or one of another version) is rejected."""
+
+    snapshot: dict[str, Any] = json.loads(json.dumps(evohome_v2.export_state()))
+    evo = EvohomeClient(evohome_v2._token_manager)
+
+    with pytest.raises(exc.InvalidStatusError):
+        await evo.import_state(snapshot | {"version": 0})
+
+    loc_id = evohome_v2.locations[0].id
+    snapshot["entities"]["location"][loc_id]["status"]["gateways"] = None
+
+    with pytest.raises(exc.InvalidStatusError):
+        await evo.import_state(snapshot)
+
+    # tokens are imported only if they are newer
+    tokens = evohome_v2._token_manager.export_access_token()
+    assert not evohome_v2._token_manager.import_access_token(tokens)
+
+    # tokens with a naive expiry are rejected (rather than compared)
+    snapshot = json.loads(json.dumps(evohome_v2.export_state(include_tokens=True)))
+    snapshot["access_token"]["access_token_expires"] = dt.now().isoformat()  # noqa: DTZ005
+
+    with pytest.raises(exc.InvalidStatusError, match="not TZ-aware"):
+        await evo.import_state(snapshot)
+
+
+# system_004 has a fault with fractional seconds, i.e. "since": "...T18:47:36.7727046"
+@pytest.mark.parametrize(
+    "fixture_folder",
+    [FIXTURES / "default", FIXTURES / "system_004"],
+    ids=["default", "system_004"],
+)
+async def test_state_snapshot_round_trip(
+    evohome_v2: EvohomeClientV2,
+    fixture_folder: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a state snapshot is lossless, so the next poll finds no spurious changes."""
+
+    snapshot: dict[str, Any] = json.loads(json.dumps(evohome_v2.export_state()))
+
+    evo = EvohomeClient(evohome_v2._token_manager)
+    notified: list[StatusChange] = []
+    evo.add_listener(notified.extend)
+
+    await evo.import_state(snapshot)
+
+    assert evo.export_state() == snapshot
+
+    # the restored status is not a (live) change, so the listeners are not notified
+    assert notified == []
+    assert evo.last_changes() == []
+
+    with (
+        patch("evohomeasync2.auth.Auth.get", auth_get(fixture_folder)),
+        caplog.at_level(logging.INFO),
+    ):
+        await evo.update()
+
+    assert not [c for c in evo.last_changes() if c.type.startswith("fault_")]
+    assert not [r for r in caplog.records if "Fault cleared" in r.message]
+    assert not [r for r in caplog.records if "Active fault" in r.message]
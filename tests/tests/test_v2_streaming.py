@@ -0,0 +1,217 @@
+"""evohome-async - validate the streaming of status updates by the EvohomeClients."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import operator
+from contextlib import aclosing
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from _evohome.streaming import BackpressurePolicy, poll_stream
+from evohomeasync2 import ChangeType, EvohomeClient, exceptions as exc
+
+from .conftest import FIXTURES_V2 as FIXTURES, auth_get
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from pathlib import Path
+
+    import voluptuous as vol
+
+    from evohome_cli.auth import TokenCacheManager
+    from tests.conftest import EvohomeClientV2
+
+
+_LOGGER = logging.getLogger(__name__)
+
+INTERVAL = 0.005  # the interval (seconds) between polls
+NUM_ITEMS = 4  # the number of items to consume
+
+
+class _Poller:
+    """Return an incrementing counter (as a list), raising any queued errors."""
+
+    def __init__(self, *errors: Exception | None, duration: float = 0) -> None:
+        self.count = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        self._errors = list(errors)
+        self._duration = duration
+
+    async def __call__(self) -> list[int]:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self._duration)
+        finally:
+            self.in_flight -= 1
+
+        if self._errors and (err := self._errors.pop(0)) is not None:
+            raise err
+
+        self.count += 1
+        return [self.count]
+
+
+@pytest.mark.parametrize("policy", list(BackpressurePolicy))
+async def test_poll_stream_policies(policy: BackpressurePolicy) -> None:
+    """Test the backpressure policies of a stream, with a slow consumer."""
+
+    poller = _Poller()
+    items: list[list[int]] = []
+
+    stream = poll_stream(
+        poller,
+        interval=INTERVAL,
+        logger=_LOGGER,
+        buffer_size=2,
+        policy=policy,
+        coalesce=operator.add,
+    )
+
+    async with aclosing(stream):
+        async for item in stream:
+            items.append(item)
+            if len(items) == NUM_ITEMS:
+                break
+            await asyncio.sleep(INTERVAL * 5)  # a slow consumer
+
+    values = [v for item in items for v in item]
+
+    assert values == sorted(values)
+    assert values[0] == 1
+
+    if policy == BackpressurePolicy.BLOCK:  # no polls are made until there is room
+        assert values == [1, 2, 3, 4]
+    elif policy == BackpressurePolicy.COALESCE:  # no polls are lost
+        assert values == list(range(1, len(values) + 1))
+        assert len(values) > len(items)
+    else:  # BackpressurePolicy.DROP_OLDEST: polls are lost
+        assert values[-1] > len(values)
+
+    # the poller is stopped once the stream is closed
+    count = poller.count
+    await asyncio.sleep(INTERVAL * 5)
+    assert poller.count == count
+
+
+async def test_poll_stream_errors() -> None:
+    """Test transient errors are skipped, and other errors are raised, in order."""
+
+    poller = _Poller(
+        exc.ApiRequestFailedError("transient"),
+        None,
+        ExceptionGroup("transient", [exc.ApiRequestFailedError("transient")]),
+        None,
+        exc.BadUserCredentialsError("fatal"),
+    )
+
+    stream = poll_stream(poller, interval=INTERVAL, logger=_LOGGER, buffer_size=4)
+
+    assert await anext(stream) == [1]
+    assert await anext(stream) == [2]
+
+    with pytest.raises(exc.BadUserCredentialsError):
+        await anext(stream)
+
+    with pytest.raises(StopAsyncIteration):
+        await anext(stream)
+
+    with pytest.raises(ValueError, match="Invalid interval"):
+        poll_stream(poller, interval=0, logger=_LOGGER)
+
+    with pytest.raises(ValueError, match="Invalid buffer_size"):
+        poll_stream(poller, interval=INTERVAL, logger=_LOGGER, buffer_size=0)
+
+
+async def test_poll_stream_slow_polls() -> None:
+    """Test slow polls do not overlap (the missed polls are skipped)."""
+
+    poller = _Poller(duration=INTERVAL * 2.5)
+
+    async with aclosing(
+        poll_stream(poller, interval=INTERVAL, logger=_LOGGER)
+    ) as stream:
+        async for item in stream:
+            if item == [NUM_ITEMS]:
+                break
+
+    assert poller.max_in_flight == 1
+
+
+def _status_get(
+    fixture_folder: Path,
+) -> Callable[[Any, str, vol.Schema | None], Awaitable[Any]]:
+    """Return a mock of Auth.get() where a zone's setpoint increases with each poll."""
+
+    get = auth_get(fixture_folder)
+    polls = 0
+
+    async def status_get(self: Any, url: str, schema: vol.Schema | None = None) -> Any:
+        nonlocal polls
+
+        result = await get(self, url, schema)
+
+        if "status" in url:
+            tcs_status = result["gateways"][0]["temperature_control_systems"][0]
+            tcs_status["zones"][0]["setpoint_status"]["target_heat_temperature"] += (
+                polls
+            )
+            polls += 1
+
+        return result
+
+    return status_get
+
+
+@pytest.mark.parametrize("fixture_folder", [FIXTURES / "default"], ids=["default"])
+async def test_client_stream(evohome_v2: EvohomeClientV2, fixture_folder: Path) -> None:
+    """Test the v2 client streams snapshots, and change-sets (only if any)."""
+
+    with patch("evohomeasync2.auth.Auth.get", _status_get(fixture_folder)):
+        async with aclosing(evohome_v2.stream(INTERVAL)) as stream:
+            statuses = await anext(stream)
+            assert [s["location_id"] for s in statuses] == [
+                loc.id for loc in evohome_v2.locations
+            ]
+
+    zone = evohome_v2.tcs.zones[0]
+    setpoint = zone.target_heat_temperature
+
+    # the first poll has no changes, so the first change-set is from the second poll
+    with patch("evohomeasync2.auth.Auth.get", _status_get(fixture_folder)):
+        async with aclosing(evohome_v2.stream_changes(INTERVAL)) as stream:
+            changes = await anext(stream)
+
+    assert [(c.entity, c.type, c.old, c.new) for c in changes] == [
+        (zone, ChangeType.SETPOINT, setpoint, setpoint + 1)
+    ]
+
+
+async def test_client_stream_unauthorized(
+    credentials_manager: TokenCacheManager,
+) -> None:
+    """Test the access token is cleared if several locations' polls get a 401."""
+
+    def unauthorized() -> exc.ApiRequestFailedError:
+        return exc.ApiRequestFailedError("Revoked", status=HTTPStatus.UNAUTHORIZED)
+
+    updates = [AsyncMock(side_effect=[unauthorized(), [i]]) for i in range(2)]
+
+    evo = EvohomeClient(credentials_manager)
+    evo._user_info = {}  # type: ignore[assignment]  # so config is not fetched
+    evo._user_locs = []
+    evo._locations = [Mock(update=u) for u in updates]
+
+    with patch.object(credentials_manager, "clear_access_token") as clear:
+        async with aclosing(evo.stream(INTERVAL)) as stream:
+            assert len(await anext(stream)) == len(updates)  # the 2nd poll
+
+    clear.assert_called_once()
+    assert all(u.await_count == 2 for u in updates)  # noqa: PLR2004